@@ -0,0 +1,10 @@
+"""
+성능 측정 도구
+- seed: 벤치마크용 강의실/일정 데이터 생성 (1만~100만 건)
+- run: 앱을 프로세스 안에서(ASGI) 띄워 주요 API를 동시에 호출하고 처리량/지연 분위수 측정, 기준 결과와 비교
+
+    cd backend
+    python -m benchmarks.seed --schedules 100000
+    python -m benchmarks.run --duration 20 --output before.json
+    python -m benchmarks.run --duration 20 --baseline before.json
+"""
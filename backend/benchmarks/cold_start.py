@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 측정: uvicorn 프로세스 실행 → 첫 GET /public/schedule 200 응답까지 걸린 시간
+- fresh: DB 파일을 지우고 시작 (테이블 생성 + 초기 강의실/관리자, SQLite 파일 DB만)
+- full:  STARTUP_MODE=full (기존 DB에 create_all/마이그레이션/초기 데이터 확인을 매번 실행)
+- fast:  STARTUP_MODE=fast (스키마 버전이 같으면 위 과정을 건너뜀, 기본값)
+경우마다 --runs회 실행한 중앙값을 출력하고, main import 시간과 지연 import한 인증 모듈(passlib, jose) 비용도 잽니다.
+서버 로그의 "startup:" 줄에 단계별 시간이 나옵니다 (--verbose).
+
+사용법:
+    python -m benchmarks.cold_start --runs 5
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time as _time
+import urllib.error
+import urllib.request
+from datetime import date
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB_URL = "sqlite:///./bench-cold-start.db"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _sqlite_path(db_url: str):
+    prefix = "sqlite:///"
+    if not db_url.startswith(prefix) or ":memory:" in db_url:
+        return None
+    return os.path.join(BACKEND_DIR, db_url[len(prefix):])
+
+
+def _env(db_url: str, mode: str) -> dict:
+    return dict(os.environ, DB_URL=db_url, STARTUP_MODE=mode)
+
+
+def time_to_first_schedule(db_url: str, mode: str, timeout: float, verbose: bool) -> float:
+    """프로세스 실행부터 첫 200 응답까지 (초)"""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/public/schedule?date={date.today():%Y-%m-%d}"
+    t0 = _time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "info" if verbose else "warning"],
+        cwd=BACKEND_DIR, env=_env(db_url, mode),
+    )
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise SystemExit(f"❌ 서버가 종료됨 (code {proc.returncode})")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as r:
+                    if r.status == 200:
+                        return _time.perf_counter() - t0
+            except (urllib.error.URLError, ConnectionError, OSError):
+                pass
+            if _time.perf_counter() - t0 > timeout:
+                raise SystemExit(f"❌ {timeout:.0f}초 안에 응답 없음")
+            _time.sleep(0.005)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def import_seconds(code: str, db_url: str) -> float:
+    """새 인터프리터에서 code 실행 시간 (인터프리터 기동 시간 제외, code에서 t를 다시 잡으면 그 뒤부터)"""
+    script = f"import time; t = time.perf_counter(); {code}; print(time.perf_counter() - t)"
+    out = subprocess.run(
+        [sys.executable, "-c", script], cwd=BACKEND_DIR, env=_env(db_url, "fast"),
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def run(db_url: str, runs: int, timeout: float, verbose: bool):
+    db_path = _sqlite_path(db_url)
+    cases = ["fresh", "full", "fast"] if db_path else ["full", "fast"]
+
+    results = {}
+    for case in cases:
+        samples = []
+        for _ in range(runs):
+            if case == "fresh":
+                for suffix in ("", "-wal", "-shm"):
+                    if os.path.exists(db_path + suffix):
+                        os.remove(db_path + suffix)
+            samples.append(time_to_first_schedule(db_url, "full" if case == "fresh" else case, timeout, verbose))
+        results[case] = statistics.median(samples)
+
+    main_import = statistics.median(import_seconds("import main", db_url) for _ in range(runs))
+    auth_import = statistics.median(
+        import_seconds("import main; t = time.perf_counter(); import passlib.context, jose.jwt", db_url)
+        for _ in range(runs)
+    )
+
+    print(f"\n실행 → 첫 /public/schedule 200 (중앙값, {runs}회)")
+    for case, seconds in results.items():
+        print(f"  {case:<6}{seconds * 1000:>9.0f} ms")
+    print(f"\nimport main            {main_import * 1000:>7.0f} ms")
+    print(f"지연 import (인증)     {auth_import * 1000:>7.0f} ms  (passlib.context + jose.jwt, 첫 관리자 요청 때)")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="콜드 스타트 측정")
+    parser.add_argument("--db-url", default=os.getenv("BENCH_COLD_START_DB_URL", DEFAULT_DB_URL))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0, help="한 번 실행의 최대 대기(초)")
+    parser.add_argument("--verbose", action="store_true", help="서버 로그(startup: 단계별 시간) 출력")
+    args = parser.parse_args()
+    run(args.db_url, args.runs, args.timeout, args.verbose)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+API 부하 측정
+앱을 프로세스 안에서 ASGI로 호출합니다 (네트워크/서버 설정 영향 없이 main.py 변경만 비교).
+엔드포인트마다 --concurrency개의 작업자가 --duration초 동안 반복 호출하고,
+요청 수/오류 수/초당 처리량/p50·p95·p99 지연(ms)을 출력합니다.
+
+사용법:
+    python -m benchmarks.run --duration 20 --output before.json
+    python -m benchmarks.run --duration 20 --baseline before.json --threshold 10
+
+POST /public/reservations 시나리오는 실제로 일정을 만들므로, 비교할 때는 매번 seed로 데이터를 새로 만드세요.
+httpx가 필요합니다 (pip install httpx).
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time as _time
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed import DEFAULT_DB_URL
+
+
+class Scenario(NamedTuple):
+    name: str
+    call: Callable[..., Awaitable]  # (client, rng, ctx) -> httpx.Response
+    ok_statuses: tuple[int, ...] = (200,)
+
+
+class Context(NamedTuple):
+    dates: list[str]
+    future_dates: list[str]
+    room_ids: list[int]
+    admin_headers: dict
+
+
+async def _public_schedule(client, rng, ctx: Context):
+    return await client.get("/public/schedule", params={"date": rng.choice(ctx.dates)})
+
+async def _public_reservations(client, rng, ctx: Context):
+    h = rng.randint(8, 20)
+    return await client.post("/public/reservations", json={
+        "classroom_id": rng.choice(ctx.room_ids),
+        "date": rng.choice(ctx.future_dates),
+        "start_time": f"{h:02d}:00",
+        "end_time": f"{h + 1:02d}:00",
+        "name": "bench", "org": "bench", "reason": "bench",
+    })
+
+async def _admin_schedules(client, rng, ctx: Context):
+    return await client.get("/admin/schedules", params={"date_str": rng.choice(ctx.dates)}, headers=ctx.admin_headers)
+
+async def _admin_timetable(client, rng, ctx: Context):
+    return await client.get("/admin/timetable", params={"date": rng.choice(ctx.dates)}, headers=ctx.admin_headers)
+
+async def _admin_stats(client, rng, ctx: Context):
+    return await client.get("/admin/stats", headers=ctx.admin_headers)
+
+SCENARIOS = [
+    Scenario("public_schedule", _public_schedule),
+    Scenario("public_reservations", _public_reservations, (200, 409)),
+    Scenario("admin_schedules", _admin_schedules),
+    Scenario("admin_timetable", _admin_timetable),
+    Scenario("admin_stats", _admin_stats),
+]
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """nearest-rank 분위수"""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    lat = sorted(latencies)
+    ms = lambda v: round(v * 1000, 3)
+    return {
+        "requests": len(lat),
+        "errors": errors,
+        "rps": round(len(lat) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": ms(sum(lat) / len(lat)) if lat else 0.0,
+        "p50_ms": ms(percentile(lat, 50)),
+        "p95_ms": ms(percentile(lat, 95)),
+        "p99_ms": ms(percentile(lat, 99)),
+    }
+
+
+async def _worker(client, scenario: Scenario, ctx: Context, rng: random.Random, deadline: float,
+                  record: bool, latencies: list[float], errors: list[int]):
+    while _time.perf_counter() < deadline:
+        t0 = _time.perf_counter()
+        try:
+            res = await scenario.call(client, rng, ctx)
+            ok = res.status_code in scenario.ok_statuses
+        except Exception:
+            ok = False
+        if record:
+            latencies.append(_time.perf_counter() - t0)
+            if not ok:
+                errors[0] += 1
+
+
+async def _build_context(client, main) -> Context:
+    from sqlalchemy import func, select
+
+    with main.SessionLocal() as db:
+        d_min, d_max = db.execute(select(func.min(main.Schedule.date), func.max(main.Schedule.date))).one()
+        room_ids = db.execute(select(main.Classroom.id).where(main.Classroom.is_active == True)).scalars().all()
+    if d_min is None:
+        raise SystemExit("일정이 없습니다. 먼저 python -m benchmarks.seed 로 데이터를 만드세요.")
+    dates = [(d_min + timedelta(days=i)).isoformat() for i in range((d_max - d_min).days + 1)]
+    today = date.today().isoformat()
+    future_dates = [d for d in dates if d >= today] or dates
+
+    res = await client.post("/admin/login", json={
+        "username": main.DEFAULT_ADMIN_USERNAME, "password": main.DEFAULT_ADMIN_PASSWORD,
+    })
+    res.raise_for_status()
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+    return Context(dates, future_dates, room_ids, headers)
+
+
+async def run(db_url: str, duration: float, warmup: float, concurrency: int, names: Optional[list[str]], rng_seed: int) -> dict:
+    try:
+        import httpx
+    except ImportError:
+        raise SystemExit("httpx가 필요합니다: pip install httpx")
+
+    os.environ["DB_URL"] = db_url
+    import main
+    from sqlalchemy import func, select
+
+    scenarios = [s for s in SCENARIOS if not names or s.name in names]
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            ctx = await _build_context(client, main)
+            with main.SessionLocal() as db:
+                total_schedules = db.execute(select(func.count(main.Schedule.id))).scalar_one()
+
+            results = {}
+            latencies = {s.name: [] for s in scenarios}
+            errors = {s.name: [0] for s in scenarios}
+            for record, seconds in ((False, warmup), (True, duration)):
+                if seconds <= 0:
+                    continue
+                started = _time.perf_counter()
+                deadline = started + seconds
+                await asyncio.gather(*[
+                    _worker(client, s, ctx, random.Random(f"{rng_seed}-{s.name}-{i}"), deadline, record,
+                            latencies[s.name], errors[s.name])
+                    for s in scenarios for i in range(concurrency)
+                ])
+                elapsed = _time.perf_counter() - started
+            for s in scenarios:
+                results[s.name] = summarize(latencies[s.name], errors[s.name][0], elapsed)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "db_url": db_url,
+            "schedules": total_schedules,
+            "duration": duration,
+            "concurrency": concurrency,
+            "python": platform.python_version(),
+            "db_async": main.DB_ASYNC,
+            "sqlite_profile": main.SQLITE_PROFILE,
+        },
+        "endpoints": results,
+    }
+
+
+def print_results(result: dict):
+    meta = result["meta"]
+    print(f"일정 {meta['schedules']:,}건 / {meta['duration']}초 / 엔드포인트당 동시 {meta['concurrency']}")
+    print(f"{'endpoint':<22}{'req':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for name, r in result["endpoints"].items():
+        print(f"{name:<22}{r['requests']:>8}{r['errors']:>6}{r['rps']:>9.1f}"
+              f"{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}")
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준 대비 변화율 출력. threshold(%) 넘게 느려진 항목 목록 반환 (p95 증가 또는 rps 감소)"""
+    def pct(new: float, old: float) -> float:
+        return (new - old) / old * 100 if old else 0.0
+
+    regressions = []
+    print()
+    print(f"기준: {baseline['meta'].get('timestamp')} (일정 {baseline['meta'].get('schedules', 0):,}건)")
+    print(f"{'endpoint':<22}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name, r in result["endpoints"].items():
+        old = baseline["endpoints"].get(name)
+        if old is None:
+            print(f"{name:<22}{'(기준 없음)':>10}")
+            continue
+        d_rps = pct(r["rps"], old["rps"])
+        d50, d95, d99 = (pct(r[k], old[k]) for k in ("p50_ms", "p95_ms", "p99_ms"))
+        mark = ""
+        if d95 > threshold or d_rps < -threshold:
+            regressions.append(name)
+            mark = "  ⚠️"
+        print(f"{name:<22}{d_rps:>+9.1f}%{d50:>+9.1f}%{d95:>+9.1f}%{d99:>+9.1f}%{mark}")
+    return regressions
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="API 부하 측정")
+    parser.add_argument("--db-url", default=os.getenv("BENCH_DB_URL", DEFAULT_DB_URL))
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 예열 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=4, help="엔드포인트당 동시 작업자 수")
+    parser.add_argument("--endpoints", help=f"쉼표로 구분 (기본: 전체 {','.join(s.name for s in SCENARIOS)})")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 볼 변화율(%%)")
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.endpoints.split(",")] if args.endpoints else None
+    result = asyncio.run(run(args.db_url, args.duration, args.warmup, args.concurrency, names, args.seed))
+    print_results(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {args.threshold:g}% 넘게 느려짐: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
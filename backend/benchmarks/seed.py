@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 데이터 생성
+강의실 --rooms개에 하루 평균 --per-day건씩, 강의실-일자 안에서 겹치지 않는 일정을 --schedules건 채웁니다.
+날짜는 오늘 기준 과거 2/3, 미래 1/3로 배치 (오래된 일정 통계/정리 대상이 생기도록).
+
+사용법:
+    python -m benchmarks.seed --schedules 100000
+    python -m benchmarks.seed --schedules 1000000 --rooms 80 --db-url sqlite:///./bench-1m.db
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time as _time
+from datetime import date, datetime, time, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_DB_URL = "sqlite:///./bench.db"
+DEFAULT_MIX = "APPROVED=60,PENDING=25,REJECTED=15"
+CATEGORIES = ("CLASS", "SEMINAR", "EVENT", "RENTAL", "ETC")
+COLORS = ("blue", "yellow", "pink", "green")
+SLOT_MIN = 30
+
+
+def parse_mix(s: str) -> tuple[list[str], list[float]]:
+    """"APPROVED=60,PENDING=25,REJECTED=15" → (상태 목록, 가중치)"""
+    statuses, weights = [], []
+    for part in s.split(","):
+        name, _, weight = part.partition("=")
+        statuses.append(name.strip().upper())
+        weights.append(float(weight))
+    return statuses, weights
+
+
+def room_day_slots(rng: random.Random, per_day: int, open_min: int, close_min: int) -> list[tuple[int, int]]:
+    """운영 시간 안에서 30분 단위로 겹치지 않는 (start_min, end_min) 목록. 평균 per_day건."""
+    target = max(0, min(round(rng.gauss(per_day, per_day / 3)), (close_min - open_min) // SLOT_MIN))
+    out = []
+    cur = open_min
+    while len(out) < target:
+        cur += SLOT_MIN * rng.randint(0, 2)
+        end = cur + SLOT_MIN * rng.randint(1, 4)
+        if end > close_min:
+            break
+        out.append((cur, end))
+        cur = end
+    return out
+
+
+def seed(db_url: str, schedules: int, rooms: int, per_day: int, mix: str, rng_seed: int, batch_size: int,
+         assume_yes: bool = False):
+    # main은 import 시점의 DB_URL로 엔진을 만듦
+    os.environ["DB_URL"] = db_url
+    import main
+    from sqlalchemy import func, inspect, insert, select
+
+    if not assume_yes and inspect(main.engine).has_table(main.Schedule.__tablename__):
+        with main.SessionLocal() as db:
+            existing = db.execute(select(func.count(main.Schedule.id))).scalar_one()
+        if existing:
+            print(f"⚠️  {db_url}에 일정 {existing:,}건이 있습니다. 모두 지우고 새로 만들까요? (y/n): ", end="")
+            if input().lower() != "y":
+                print("❌ 취소되었습니다.")
+                return
+
+    rng = random.Random(rng_seed)
+    statuses, weights = parse_mix(mix)
+    started = _time.perf_counter()
+
+    main.Base.metadata.drop_all(bind=main.engine)
+    main.init_db()
+
+    with main.SessionLocal() as db:
+        room_rows = [
+            {"room_code": code, "display_name": name, "capacity": cap, "is_active": True}
+            for code, name, cap in main.SEED_ROOMS
+        ]
+        for i in range(len(room_rows), rooms):
+            room_rows.append({
+                "room_code": f"B{i:03d}", "display_name": f"벤치 {i:03d}호",
+                "capacity": rng.choice((20, 30, 40, 60, 80, 120)), "is_active": True,
+            })
+        db.execute(insert(main.Classroom.__table__), room_rows[:rooms])
+        db.commit()
+        room_ids = db.execute(select(main.Classroom.id).order_by(main.Classroom.id)).scalars().all()
+
+        days = math.ceil(schedules / max(1, len(room_ids) * per_day))
+        day = date.today() - timedelta(days=days * 2 // 3)
+        open_min, close_min = main.OPEN_HOUR * 60, main.CLOSE_HOUR * 60
+        owners = [(f"user{n:04d}", f"org{n % 50:02d}") for n in range(2000)]
+        now = datetime.utcnow()
+
+        table = main.Schedule.__table__
+        batch: list[dict] = []
+        written = 0
+        while written + len(batch) < schedules:
+            for cid in room_ids:
+                for st, et in room_day_slots(rng, per_day, open_min, close_min):
+                    status = rng.choices(statuses, weights)[0]
+                    owner_name, owner_org = rng.choice(owners)
+                    batch.append({
+                        "classroom_id": cid,
+                        "date": day,
+                        "start_time": time(st // 60, st % 60),
+                        "end_time": time(et // 60, et % 60),
+                        "category": rng.choice(CATEGORIES),
+                        "title": f"bench {rng.randint(1, 500)}",
+                        "owner_name": owner_name,
+                        "owner_org": owner_org,
+                        "memo": None,
+                        "color": rng.choice(COLORS) if status == "APPROVED" else None,
+                        "status": status,
+                        "reject_reason": "bench" if status == "REJECTED" else None,
+                        "created_at": now,
+                        "updated_at": now,
+                    })
+                    if written + len(batch) >= schedules:
+                        break
+                if written + len(batch) >= schedules:
+                    break
+            day += timedelta(days=1)
+            if len(batch) >= batch_size:
+                db.execute(insert(table), batch)
+                db.commit()
+                written += len(batch)
+                batch = []
+                print(f"  {written:,} / {schedules:,}", end="\r", flush=True)
+        if batch:
+            db.execute(insert(table), batch)
+            db.commit()
+            written += len(batch)
+        print()
+
+        # 벌크 INSERT는 ORM 이벤트를 거치지 않으므로 점유 요약은 한 번에 다시 계산
+        occupancy = main.rebuild_occupancy(db)
+    # schedules를 다시 만들면서 검색 트리거도 사라졌으므로 install이 트리거를 만들고 전체 색인
+    main.search.install(main.engine)
+
+    print(f"✅ 강의실 {len(room_ids)}개, 일정 {written:,}건, 점유 요약 {occupancy:,}건 "
+          f"({_time.perf_counter() - started:.1f}s, {db_url})")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="벤치마크 데이터 생성 (기존 테이블은 지움)")
+    parser.add_argument("--db-url", default=os.getenv("BENCH_DB_URL", DEFAULT_DB_URL))
+    parser.add_argument("--schedules", type=int, default=10_000, help="생성할 일정 수 (1만~100만)")
+    parser.add_argument("--rooms", type=int, default=30, help="강의실 수 (기본 강의실 포함)")
+    parser.add_argument("--per-day", type=int, default=6, help="강의실-일자당 평균 일정 수")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="상태 비율 (예: APPROVED=60,PENDING=25,REJECTED=15)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--batch-size", type=int, default=5000, help="INSERT 묶음 크기")
+    parser.add_argument("--yes", action="store_true", help="기존 데이터가 있어도 묻지 않고 지움")
+    args = parser.parse_args()
+    seed(args.db_url, args.schedules, args.rooms, args.per_day, args.mix, args.seed, args.batch_size, args.yes)
+
+
+if __name__ == "__main__":
+    main_cli()
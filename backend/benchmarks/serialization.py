@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+관리자 일정 목록 직렬화 비교 (기본 5만 행)
+- model: ORM 객체 + joinedload → AdminScheduleRes 생성 → response_model 검증/직렬화 (FastAPI 기본 경로 재현)
+- fast: 튜플 행 → dict → fast_json (orjson, 없으면 표준 json), 검증 없음
+두 결과 JSON이 같은지도 확인합니다.
+
+사용법:
+    python -m benchmarks.serialization --rows 50000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time as _time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.seed import DEFAULT_MIX, seed
+
+DEFAULT_DB_URL = "sqlite:///./bench-serialization.db"
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = _time.perf_counter()
+        fn()
+        best = min(best, _time.perf_counter() - t0)
+    return best
+
+
+def run(db_url: str, rows: int, repeat: int, reseed: bool):
+    os.environ["DB_URL"] = db_url
+    import main
+    import fast_json
+    from pydantic import TypeAdapter
+    from sqlalchemy import func, inspect, select
+    from sqlalchemy.orm import joinedload
+
+    have = 0
+    if not reseed and inspect(main.engine).has_table(main.Schedule.__tablename__):
+        with main.SessionLocal() as db:
+            have = db.execute(select(func.count(main.Schedule.id))).scalar()
+    if have != rows:
+        seed(db_url, rows, rooms=30, per_day=6, mix=DEFAULT_MIX, rng_seed=42, batch_size=5000, assume_yes=True)
+
+    adapter = TypeAdapter(list[main.AdminScheduleRes])
+    order = (main.Schedule.date.desc(), main.Schedule.start_time.asc(), main.Schedule.id.asc())
+
+    def model_path() -> bytes:
+        with main.SessionLocal() as db:
+            objs = db.execute(
+                select(main.Schedule).options(joinedload(main.Schedule.classroom)).order_by(*order)
+            ).scalars().all()
+            content = [main._to_admin_res(s) for s in objs]
+        return adapter.dump_json(adapter.validate_python(content))
+
+    def fast_path() -> bytes:
+        with main.SessionLocal() as db:
+            rows_ = db.execute(
+                select(*main.ADMIN_LIST_COLUMNS)
+                .join(main.Classroom, main.Classroom.id == main.Schedule.classroom_id)
+                .order_by(*order)
+            ).all()
+        return main._admin_rows_json(rows_)
+
+    def fast_path_stdlib() -> bytes:
+        saved = fast_json.orjson
+        fast_json.orjson = None
+        try:
+            return fast_path()
+        finally:
+            fast_json.orjson = saved
+
+    if json.loads(model_path()) != json.loads(fast_path()):
+        raise SystemExit("❌ 두 경로의 결과가 다릅니다.")
+
+    cases = [("model (ORM + pydantic)", model_path), (f"fast ({fast_json.BACKEND})", fast_path)]
+    if fast_json.BACKEND != "json":
+        cases.append(("fast (json fallback)", fast_path_stdlib))
+
+    print(f"\n일정 {rows:,}행, 최선 {repeat}회 기준")
+    base = None
+    for name, fn in cases:
+        t = _best(fn, repeat)
+        base = base or t
+        print(f"  {name:<26}{t * 1000:>9.1f} ms   x{base / t:.1f}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="관리자 일정 목록 직렬화 비교")
+    parser.add_argument("--db-url", default=os.getenv("BENCH_SERIALIZATION_DB_URL", DEFAULT_DB_URL))
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--reseed", action="store_true", help="행 수가 같아도 데이터를 새로 만듦")
+    args = parser.parse_args()
+    run(args.db_url, args.rows, args.repeat, args.reseed)
+
+
+if __name__ == "__main__":
+    main_cli()
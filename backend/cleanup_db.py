@@ -2,76 +2,94 @@
 """
 데이터베이스 정리 스크립트
 오래된 일정을 삭제하여 DB 크기를 관리합니다.
+
+묻는 과정 없이 옵션대로 실행합니다 (cron 용). 옵션 없이 실행하면 통계만 보여 줍니다:
+    python cleanup_db.py --days 180 --archive-dir ./archive
+    python cleanup_db.py --days 90 --dry-run
+    python cleanup_db.py --rebuild-occupancy   # 점유 요약(room_day_occupancy) 전체 재계산
+    python cleanup_db.py --rebuild-search      # 일정 검색 색인(SQLite FTS5) 전체 재색인
 """
 
+import argparse
 import os
 import sys
 from datetime import date, timedelta
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select, func
 
 sys.path.insert(0, os.path.dirname(__file__))
-from main import Schedule, DB_URL
-
-engine = create_engine(DB_URL, connect_args={"check_same_thread": False} if DB_URL.startswith("sqlite") else {})
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+import search
+# 서버와 같은 엔진 설정(풀, SQLite 운영 프로필 PRAGMA: WAL/busy_timeout)과 세션 이벤트(점유 요약/변경 순번)를 그대로 사용
+from main import (
+    Base, Schedule, DB_URL, RETENTION_BATCH_SIZE, SessionLocal, engine,
+    collect_stats, purge_old_schedules, rebuild_occupancy,
+)
 
-def cleanup_old_schedules(days=180):
-    """지정된 일수보다 오래된 일정 삭제"""
+def cleanup_old_schedules(days=180, archive_dir=None, dry_run=False, batch_size=RETENTION_BATCH_SIZE, pause=0.0):
+    """지정된 일수보다 오래된 일정 삭제 (묶음 단위 DELETE)"""
     cutoff_date = date.today() - timedelta(days=days)
     
     with SessionLocal() as db:
-        # 오래된 일정 조회
-        old_schedules = db.execute(
-            select(Schedule).where(Schedule.date < cutoff_date)
-        ).scalars().all()
+        count = db.execute(select(func.count(Schedule.id)).where(Schedule.date < cutoff_date)).scalar_one()
         
-        if not old_schedules:
+        if not count:
             print(f"✅ {cutoff_date} 이전 일정이 없습니다.")
             return
         
-        print(f"📅 {cutoff_date} 이전 일정 {len(old_schedules)}개 발견")
-        print(f"   삭제하시겠습니까? (y/n): ", end="")
-        
-        response = input().lower()
-        if response != 'y':
-            print("❌ 취소되었습니다.")
+        print(f"📅 {cutoff_date} 이전 일정 {count}개 발견")
+        if dry_run:
+            print("ℹ️  --dry-run: 삭제하지 않았습니다.")
             return
         
         # 삭제 실행
-        for schedule in old_schedules:
-            db.delete(schedule)
-        
-        db.commit()
-        print(f"✅ {len(old_schedules)}개 일정이 삭제되었습니다.")
+        result = purge_old_schedules(db, cutoff_date, batch_size=batch_size, archive_dir=archive_dir, pause=pause)
+        if result["archive_path"]:
+            print(f"📦 보관 파일: {result['archive_path']}")
+        if result["vacuum"]:
+            print(f"🧹 VACUUM: {result['vacuum']}")
+        print(f"✅ {result['deleted_count']}개 일정이 삭제되었습니다.")
+
+def enable_incremental_vacuum():
+    """SQLite auto_vacuum을 INCREMENTAL로 전환 (한 번만 필요, 전체 VACUUM이 실행되므로 한가한 시간에)"""
+    if not DB_URL.startswith("sqlite"):
+        print("❌ SQLite에서만 사용할 수 있습니다.")
+        return
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.exec_driver_sql("VACUUM")
+    print("✅ auto_vacuum = INCREMENTAL 로 전환했습니다.")
+
+def rebuild_occupancy_table():
+    """room_day_occupancy를 schedules 기준으로 다시 채움 (테이블이 없으면 생성)"""
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        written = rebuild_occupancy(db)
+    print(f"✅ 강의실-일자 {written}개의 점유 요약을 다시 계산했습니다.")
+    print("ℹ️  실행 중인 서버는 다음 조회(CACHE_SYNC_INTERVAL_MS 이내) 때 캐시를 버립니다.")
+
+def rebuild_search_index():
+    """검색 색인을 schedules 내용으로 다시 만듦 (FTS5 테이블/트리거가 없으면 생성)"""
+    Base.metadata.create_all(bind=engine)
+    search.rebuild(engine)
+    print("✅ 일정 검색 색인을 다시 만들었습니다.")
 
 def show_stats():
     """데이터베이스 통계 표시"""
     with SessionLocal() as db:
-        total = db.execute(select(Schedule)).scalars().all()
-        pending = db.execute(select(Schedule).where(Schedule.status == "PENDING")).scalars().all()
-        approved = db.execute(select(Schedule).where(Schedule.status == "APPROVED")).scalars().all()
-        rejected = db.execute(select(Schedule).where(Schedule.status == "REJECTED")).scalars().all()
-        
-        cutoff_30 = date.today() - timedelta(days=30)
-        cutoff_90 = date.today() - timedelta(days=90)
-        cutoff_180 = date.today() - timedelta(days=180)
-        
-        old_30 = db.execute(select(Schedule).where(Schedule.date < cutoff_30)).scalars().all()
-        old_90 = db.execute(select(Schedule).where(Schedule.date < cutoff_90)).scalars().all()
-        old_180 = db.execute(select(Schedule).where(Schedule.date < cutoff_180)).scalars().all()
+        stats = collect_stats(db, age_days=(30, 90, 180))
+        by_status = stats["by_status"]
+        older = stats["older_than"]
         
         print("\n📊 데이터베이스 통계")
         print("=" * 50)
-        print(f"총 일정 수:        {len(total):5}개")
-        print(f"  - PENDING:       {len(pending):5}개")
-        print(f"  - APPROVED:      {len(approved):5}개")
-        print(f"  - REJECTED:      {len(rejected):5}개")
+        print(f"총 일정 수:        {stats['total_schedules']:5}개")
+        print(f"  - PENDING:       {by_status.get('PENDING', 0):5}개")
+        print(f"  - APPROVED:      {by_status.get('APPROVED', 0):5}개")
+        print(f"  - REJECTED:      {by_status.get('REJECTED', 0):5}개")
         print()
         print(f"오래된 일정:")
-        print(f"  - 30일 이전:     {len(old_30):5}개")
-        print(f"  - 90일 이전:     {len(old_90):5}개")
-        print(f"  - 180일 이전:    {len(old_180):5}개")
+        print(f"  - 30일 이전:     {older[30]['count']:5}개")
+        print(f"  - 90일 이전:     {older[90]['count']:5}개")
+        print(f"  - 180일 이전:    {older[180]['count']:5}개")
         print("=" * 50)
         
         # DB 파일 크기 (SQLite인 경우)
@@ -83,25 +101,30 @@ def show_stats():
         print()
 
 if __name__ == "__main__":
-    print("🗑️  데이터베이스 정리 도구\n")
-    
-    show_stats()
-    
-    print("\n옵션을 선택하세요:")
-    print("1. 180일(6개월) 이전 일정 삭제")
-    print("2. 90일(3개월) 이전 일정 삭제")
-    print("3. 30일(1개월) 이전 일정 삭제")
-    print("4. 취소")
-    print("\n선택 (1-4): ", end="")
-    
-    choice = input().strip()
-    
-    if choice == "1":
-        cleanup_old_schedules(180)
-    elif choice == "2":
-        cleanup_old_schedules(90)
-    elif choice == "3":
-        cleanup_old_schedules(30)
-    else:
-        print("❌ 취소되었습니다.")
+    parser = argparse.ArgumentParser(description="오래된 일정 정리")
+    parser.add_argument("--days", type=int, help="이 일수보다 오래된 일정 삭제")
+    parser.add_argument("--dry-run", action="store_true", help="삭제 대상 수만 확인")
+    parser.add_argument("--archive-dir", help="삭제 전 JSONL.gz로 보관할 디렉터리")
+    parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE, help="한 번에 삭제할 행 수")
+    parser.add_argument("--pause", type=float, default=0.0, help="묶음 사이 대기 시간(초)")
+    parser.add_argument("--stats", action="store_true", help="통계만 출력")
+    parser.add_argument("--enable-incremental-vacuum", action="store_true", help="SQLite auto_vacuum을 INCREMENTAL로 전환")
+    parser.add_argument("--rebuild-occupancy", action="store_true", help="점유 요약 테이블 전체 재계산 (backfill/복구)")
+    parser.add_argument("--rebuild-search", action="store_true", help="일정 검색 색인 전체 재색인 (복구)")
+    args = parser.parse_args()
 
+    if args.enable_incremental_vacuum:
+        enable_incremental_vacuum()
+    elif args.rebuild_occupancy:
+        rebuild_occupancy_table()
+    elif args.rebuild_search:
+        rebuild_search_index()
+    elif args.days is not None:
+        cleanup_old_schedules(
+            args.days, archive_dir=args.archive_dir, dry_run=args.dry_run,
+            batch_size=args.batch_size, pause=args.pause,
+        )
+    else:
+        show_stats()
+        if not args.stats:
+            print("ℹ️  삭제하려면 --days N 을 지정하세요 (예: --days 180 --dry-run). 전체 옵션: --help")
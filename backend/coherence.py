@@ -0,0 +1,175 @@
+"""
+여러 워커(프로세스) 간 인메모리 캐시 일관성
+DB의 change_counters 테이블에 scope별 "마지막으로 바뀐 순번"을 기록합니다.
+- 순번: PostgreSQL은 시퀀스(nextval, 행 잠금 없음), 그 밖의 DB는 "*" 행을 +1
+  (SQLite는 쓰기가 어차피 DB 단위로 직렬화되므로 "*" 행이 추가 경합을 만들지 않음)
+- scope(예: "room:3:2025-03-01", "classrooms")는 그 트랜잭션의 순번으로 갱신.
+  강의실-일자 scope는 쓰는 쪽이 이미 그 강의실-일자 잠금을 쥐고 있으므로 새 경합이 없음
+각 워커는 마지막으로 본 순번보다 큰 행만 읽어(version 인덱스 범위 스캔) 해당 캐시만 버립니다.
+시퀀스 순번은 커밋 순서와 다를 수 있어(작은 순번이 늦게 커밋) 건너뛴 순번은 gap_timeout 동안 다시 확인합니다.
+Redis 같은 외부 서비스 없이 DB만 공유하면 됩니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time as _time
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import Sequence, func, insert, select, update
+
+GLOBAL_SCOPE = "*"
+SEQUENCE_NAME = "change_counters_seq"
+MAX_TRACKED_GAPS = 10000
+
+
+def room_day_scope(classroom_id: int, d) -> str:
+    return f"room:{classroom_id}:{d.isoformat()}"
+
+
+class ChangeCounters:
+    """
+    table: (scope 문자열 PK, version 정수) 테이블
+    interval: maybe_sync가 실제로 DB를 확인하는 최소 간격(초). 음수면 maybe_sync는 아무것도 안 함
+    on_change(scopes): 다른 워커가 바꾼 scope 목록을 받아 로컬 캐시를 버리는 콜백
+    gap_timeout: 건너뛴 순번(아직 커밋 안 된 트랜잭션일 수 있음)을 다시 확인하는 시간(초)
+    """
+
+    def __init__(self, table, on_change: Callable[[list[str]], None], interval: float = 0.2, gap_timeout: float = 30.0):
+        self.table = table
+        self.on_change = on_change
+        self.interval = interval
+        self.gap_timeout = gap_timeout
+        self.sequence = Sequence(SEQUENCE_NAME)
+        self._lock = threading.Lock()
+        self._last_seen: Optional[int] = None
+        self._gaps: dict[int, float] = {}  # 아직 못 본 순번 → 포기할 시각
+        self._own: set[int] = set()        # 이 워커가 커밋한 순번 (자기 변경으로 캐시를 버리지 않도록)
+        self._next_check = 0.0
+        self.syncs = 0
+        self.remote_changes = 0
+
+    # ---------- 쓰기 쪽 ----------
+    def ensure(self, conn):
+        """순번 시퀀스 또는 전역 순번 행을 만듦 (기동 시, 여러 워커가 동시에 실행해도 안전)"""
+        t = self.table
+        dialect = conn.dialect.name
+        if dialect == "postgresql":
+            conn.exec_driver_sql(f"CREATE SEQUENCE IF NOT EXISTS {SEQUENCE_NAME}")
+            # 이전 방식("*" 행)으로 이미 쓴 순번보다 크게 시작
+            current = conn.execute(select(func.max(t.c.version))).scalar() or 0
+            if current:
+                conn.exec_driver_sql(
+                    f"SELECT setval('{SEQUENCE_NAME}', GREATEST(nextval('{SEQUENCE_NAME}'), {int(current) + 1}))"
+                )
+        elif dialect == "sqlite":
+            conn.execute(self._upsert_stmt(dialect, [{"scope": GLOBAL_SCOPE, "version": 0}]).on_conflict_do_nothing())
+        elif conn.execute(select(t.c.scope).where(t.c.scope == GLOBAL_SCOPE)).first() is None:
+            conn.execute(insert(t).values(scope=GLOBAL_SCOPE, version=0))
+
+    def bump(self, conn, scopes: Iterable[str]) -> Optional[int]:
+        """쓰기 트랜잭션 안에서 호출 (커밋과 함께 반영). 반환: 이 트랜잭션의 순번"""
+        scopes = sorted(set(scopes) - {GLOBAL_SCOPE})
+        if not scopes:
+            return None
+        if conn.dialect.name == "postgresql":
+            seq = conn.execute(select(self.sequence.next_value())).scalar()
+        else:
+            t = self.table
+            seq = conn.execute(
+                update(t).where(t.c.scope == GLOBAL_SCOPE).values(version=t.c.version + 1).returning(t.c.version)
+            ).scalar()
+            if seq is None:
+                seq = 1
+                conn.execute(insert(t).values(scope=GLOBAL_SCOPE, version=seq))
+        self._upsert(conn, scopes, seq)
+        return seq
+
+    def _upsert(self, conn, scopes: list[str], seq: int):
+        t = self.table
+        dialect = conn.dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            stmt = self._upsert_stmt(dialect, [{"scope": s, "version": seq} for s in scopes])
+            conn.execute(stmt.on_conflict_do_update(index_elements=[t.c.scope], set_={"version": seq}))
+            return
+        for s in scopes:
+            if conn.execute(update(t).where(t.c.scope == s).values(version=seq)).rowcount == 0:
+                conn.execute(insert(t).values(scope=s, version=seq))
+
+    def _upsert_stmt(self, dialect: str, rows: list[dict]):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        return upsert(self.table).values(rows)
+
+    def committed(self, seq: Optional[int]):
+        """이 워커의 트랜잭션이 커밋된 뒤 호출 (로컬 캐시는 이미 직접 반영함)"""
+        if seq is None:
+            return
+        with self._lock:
+            if self._last_seen is not None:
+                self._own.add(seq)
+
+    # ---------- 읽기 쪽 ----------
+    def due(self) -> bool:
+        return self.interval >= 0 and _time.monotonic() >= self._next_check
+
+    def maybe_sync(self, connect: Callable):
+        """interval이 지났을 때만 확인. connect()는 커넥션 컨텍스트 매니저 (예: engine.connect)"""
+        if not self.due():
+            return
+        with connect() as conn:
+            self.sync(conn)
+
+    def sync(self, conn) -> list[str]:
+        """마지막 확인 이후 다른 워커가 바꾼 scope를 읽어 on_change 호출. 반환: 바뀐 scope 목록"""
+        t = self.table
+        with self._lock:
+            last_seen = self._last_seen
+            floor = min(self._gaps, default=(last_seen or 0) + 1) - 1
+        if last_seen is None:
+            # 처음에는 현재 순번만 기억 (기동 직후라 로컬 캐시가 비어 있음)
+            current = conn.execute(select(func.max(t.c.version))).scalar() or 0
+            with self._lock:
+                self._last_seen = current if self._last_seen is None else self._last_seen
+                self._next_check = _time.monotonic() + max(self.interval, 0.0)
+                self.syncs += 1
+            return []
+
+        rows = conn.execute(select(t.c.scope, t.c.version).where(t.c.version > floor)).all()
+        now = _time.monotonic()
+        scopes = []
+        with self._lock:
+            seen = set()
+            ordered_upto = 0  # "*" 행 순번 이하는 모두 커밋됨 (쓰기가 직렬화되는 DB)
+            for scope, version in rows:
+                if scope == GLOBAL_SCOPE:
+                    ordered_upto = version
+                if version <= self._last_seen and version not in self._gaps:
+                    continue  # 이미 본 순번
+                seen.add(version)
+                if scope == GLOBAL_SCOPE or version in self._own:
+                    continue
+                scopes.append(scope)
+            for version in seen:
+                self._gaps.pop(version, None)
+            current = max(seen, default=self._last_seen)
+            if current > self._last_seen:
+                # 건너뛴 순번: 아직 커밋 안 된 트랜잭션이거나, 같은 scope가 더 큰 순번으로 덮어써짐
+                start = max(self._last_seen, ordered_upto) + 1
+                missing = [v for v in range(start, current) if v not in seen]
+                deadline = now + self.gap_timeout
+                for v in missing[-MAX_TRACKED_GAPS:]:
+                    self._gaps[v] = deadline
+                self._last_seen = current
+            for v in [v for v, deadline in self._gaps.items() if deadline <= now or v <= ordered_upto]:
+                del self._gaps[v]
+            low = min(self._gaps, default=self._last_seen + 1)
+            self._own = {v for v in self._own if v >= low}
+            self.remote_changes += len(scopes)
+            self._next_check = now + max(self.interval, 0.0)
+            self.syncs += 1
+        if scopes:
+            self.on_change(scopes)
+        return scopes
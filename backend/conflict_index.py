@@ -0,0 +1,199 @@
+"""
+강의실-일자별 점유 구간 인덱스
+(classroom_id, date)마다 정렬된 분(minute) 단위 구간 배열을 메모리에 유지하고,
+bisect로 "[st, et)가 겹치는가?"를 판단합니다.
+캐시 미스 시 DB에서 필요한 컬럼만 읽어 지연 재구성합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, time
+from typing import Callable, Iterable, Optional, Tuple
+
+ACTIVE_STATUSES = ("PENDING", "APPROVED")
+
+RoomDayKey = Tuple[int, date]
+# (schedule_id, start_time, end_time, status)
+IntervalRow = Tuple[int, time, time, str]
+
+
+def to_minutes(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+
+class RoomDayIntervals:
+    """한 강의실-일자의 점유 구간. 시작 분 기준으로 정렬된 병렬 배열."""
+
+    __slots__ = ("starts", "ends", "ids", "statuses", "max_ends")
+
+    def __init__(self):
+        self.starts = array("H")
+        self.ends = array("H")
+        self.ids = array("q")
+        self.statuses: list[str] = []
+        # max_ends[i] = max(ends[:i+1]) → 구간이 겹쳐 저장돼 있어도 탐색을 일찍 끝낼 수 있음
+        self.max_ends = array("H")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _rebuild_max_ends(self, start: int):
+        cur = self.max_ends[start - 1] if start > 0 else 0
+        for i in range(start, len(self.ends)):
+            if self.ends[i] > cur:
+                cur = self.ends[i]
+            self.max_ends[i] = cur
+
+    def add(self, schedule_id: int, st: int, et: int, status: str):
+        i = bisect_right(self.starts, st)
+        self.starts.insert(i, st)
+        self.ends.insert(i, et)
+        self.ids.insert(i, schedule_id)
+        self.statuses.insert(i, status)
+        self.max_ends.insert(i, 0)
+        self._rebuild_max_ends(i)
+
+    def discard(self, schedule_id: int) -> bool:
+        try:
+            i = self.ids.index(schedule_id)
+        except ValueError:
+            return False
+        del self.starts[i]
+        del self.ends[i]
+        del self.ids[i]
+        del self.statuses[i]
+        del self.max_ends[i]
+        self._rebuild_max_ends(i)
+        return True
+
+    def find_conflict(
+        self,
+        st: int,
+        et: int,
+        statuses: Iterable[str] = ACTIVE_STATUSES,
+        exclude_id: Optional[int] = None,
+    ) -> Optional[int]:
+        """[st, et)와 겹치는 구간의 schedule_id (없으면 None)"""
+        # start < et 인 후보만 보면 되고, 뒤에서부터 max_end가 st 이하가 되는 순간 중단
+        j = bisect_left(self.starts, et) - 1
+        while j >= 0 and self.max_ends[j] > st:
+            if (
+                self.ends[j] > st
+                and self.statuses[j] in statuses
+                and self.ids[j] != exclude_id
+            ):
+                return self.ids[j]
+            j -= 1
+        return None
+
+
+class ConflictIndex:
+    """
+    (classroom_id, date) → RoomDayIntervals LRU 캐시.
+    loader(db, classroom_id, date)는 PENDING/APPROVED 행의 IntervalRow 목록을 돌려줘야 합니다.
+    """
+
+    def __init__(self, loader: Callable[..., Iterable[IntervalRow]], max_keys: int = 4096):
+        self._loader = loader
+        self._max_keys = max_keys
+        self._entries: "OrderedDict[RoomDayKey, RoomDayIntervals]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 로딩 중에 쓰기가 반영되면 그 로딩 결과는 캐시하지 않음
+        self._write_seq = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _build(self, rows: Iterable[IntervalRow]) -> RoomDayIntervals:
+        entry = RoomDayIntervals()
+        for sid, st, et, status in sorted(rows, key=lambda r: r[1]):
+            entry.add(sid, to_minutes(st), to_minutes(et), status)
+        return entry
+
+    def get(self, db, classroom_id: int, d: date) -> RoomDayIntervals:
+        key = (classroom_id, d)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            self.misses += 1
+            seq = self._write_seq
+
+        entry = self._build(self._loader(db, classroom_id, d))
+
+        with self._lock:
+            if seq == self._write_seq:
+                self._entries[key] = entry
+                if len(self._entries) > self._max_keys:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def reload(self, db, classroom_id: int, d: date) -> RoomDayIntervals:
+        """캐시와 관계없이 DB 기준으로 다시 읽어 교체. 예약 잠금 안에서 호출."""
+        key = (classroom_id, d)
+        entry = self._build(self._loader(db, classroom_id, d))
+        with self._lock:
+            self._write_seq += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_keys:
+                self._entries.popitem(last=False)
+        return entry
+
+    def find_conflict(
+        self,
+        db,
+        classroom_id: int,
+        d: date,
+        st: time,
+        et: time,
+        statuses: Iterable[str] = ACTIVE_STATUSES,
+        exclude_id: Optional[int] = None,
+    ) -> Optional[int]:
+        entry = self.get(db, classroom_id, d)
+        with self._lock:
+            return entry.find_conflict(to_minutes(st), to_minutes(et), statuses, exclude_id)
+
+    def apply(
+        self,
+        schedule_id: int,
+        old_key: Optional[RoomDayKey],
+        new_key: Optional[RoomDayKey],
+        st: Optional[time] = None,
+        et: Optional[time] = None,
+        status: Optional[str] = None,
+    ):
+        """커밋된 변경 하나를 반영. new_key=None이면 삭제."""
+        with self._lock:
+            self._write_seq += 1
+            for key in {old_key, new_key}:
+                entry = self._entries.get(key) if key is not None else None
+                if entry is not None:
+                    entry.discard(schedule_id)
+            if new_key is None or status not in ACTIVE_STATUSES:
+                return
+            entry = self._entries.get(new_key)
+            # 캐시에 없는 키는 다음 조회 때 DB에서 새로 읽으므로 건드리지 않음
+            if entry is not None:
+                entry.add(schedule_id, to_minutes(st), to_minutes(et), status)
+
+    def invalidate(self, key: Optional[RoomDayKey] = None):
+        """특정 키(또는 전체) 폐기. 벌크 DELETE 등 ORM 이벤트를 거치지 않는 쓰기 후 호출."""
+        with self._lock:
+            self._write_seq += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_date(self, d: date):
+        """그 날짜의 모든 강의실 키 폐기 (다른 워커가 바꾼 날짜)"""
+        with self._lock:
+            self._write_seq += 1
+            for key in [k for k in self._entries if k[1] == d]:
+                del self._entries[key]
@@ -0,0 +1,97 @@
+"""
+프로세스 내 변경 이벤트 fan-out (Server-Sent Events 용)
+커밋 후 발행된 이벤트를 구독 중인 모든 연결의 asyncio.Queue로 전달합니다.
+발행은 어느 스레드에서 해도 되고, 느린 구독자는 큐가 차면 resync 신호만 받습니다.
+이벤트 id는 연결마다 1부터 연속이므로 클라이언트는 id가 건너뛰면 놓친 이벤트가 있다고 보고 전체를 다시 읽으면 됩니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Callable, Optional
+
+RESYNC_FRAME = "event: resync\ndata: {}\n\n"
+
+
+class Subscription:
+    __slots__ = ("loop", "queue", "accept", "overflowed", "last_id")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int, accept: Optional[Callable[[dict], bool]]):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.accept = accept
+        self.overflowed = False
+        self.last_id = 0  # 이 연결에 보낸 마지막 이벤트 id
+
+
+class ChangeBroker:
+    def __init__(self, queue_size: int = 256):
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subs: set[Subscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subs)
+
+    def subscribe(self, accept: Optional[Callable[[dict], bool]] = None) -> Subscription:
+        """이벤트 루프 안에서 호출. accept(event)가 False인 이벤트는 받지 않음."""
+        sub = Subscription(asyncio.get_running_loop(), self._queue_size, accept)
+        with self._lock:
+            self._subs.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            self._subs.discard(sub)
+
+    def publish(self, event_type: str, data: dict):
+        with self._lock:
+            subs = list(self._subs)
+        if not subs:
+            return
+        payload = {"type": event_type, **data}
+        frame = f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False, separators=(',', ':'))}\n\n"
+        for sub in subs:
+            if sub.accept is not None and not sub.accept(payload):
+                continue
+            try:
+                sub.loop.call_soon_threadsafe(self._deliver, sub, frame)
+            except RuntimeError:
+                # 루프가 이미 닫힌 연결
+                self.unsubscribe(sub)
+
+    @staticmethod
+    def _deliver(sub: Subscription, frame: str):
+        # 구독자의 이벤트 루프에서만 실행되므로 last_id는 잠금 없이 증가
+        if sub.overflowed:
+            return
+        sub.last_id += 1
+        try:
+            sub.queue.put_nowait(f"id: {sub.last_id}\n{frame}")
+        except asyncio.QueueFull:
+            # 밀린 이벤트는 버리고 클라이언트에게 전체 다시 읽기를 요청
+            sub.overflowed = True
+            while not sub.queue.empty():
+                sub.queue.get_nowait()
+            sub.queue.put_nowait(f"id: {sub.last_id}\n{RESYNC_FRAME}")
+
+    async def stream(self, sub: Subscription, is_disconnected: Callable, heartbeat: float = 25.0):
+        """SSE 프레임 제너레이터. 연결이 끊기면 구독 해제."""
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    frame = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    if await is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+                if frame.endswith(RESYNC_FRAME):
+                    sub.overflowed = False
+                yield frame
+        finally:
+            self.unsubscribe(sub)
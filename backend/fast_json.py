@@ -0,0 +1,22 @@
+"""
+JSON 직렬화 (orjson이 설치돼 있으면 사용, 없으면 표준 json)
+이미 검증된 내부 데이터를 pydantic 모델/response_model 검증 없이 바로 bytes로 만들 때 씁니다.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj) -> bytes:
+    """dict/list/str/int/None만 담긴 객체 → UTF-8 JSON (공백 없음, 한글 그대로)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
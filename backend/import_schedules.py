@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+일정 일괄 등록 스크립트
+CSV/JSON 파일의 일정(AdminScheduleCreateReq 형식)을 한 번에 검증/충돌 판정 후 등록합니다.
+
+사용법:
+    python import_schedules.py schedules.csv
+    python import_schedules.py schedules.json --dry-run
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+from main import SessionLocal, init_db, import_schedules, parse_import_payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일정 일괄 등록")
+    parser.add_argument("file", help="CSV 또는 JSON 파일")
+    parser.add_argument("--format", choices=["csv", "json"], help="파일 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--dry-run", action="store_true", help="등록하지 않고 결과만 확인")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.file.lower().endswith(".csv") else "json")
+    with open(args.file, "rb") as f:
+        raw_rows = parse_import_payload(f.read(), fmt)
+
+    init_db()
+    with SessionLocal() as db:
+        result = import_schedules(db, raw_rows, dry_run=args.dry_run)
+
+    for r in result["rows"]:
+        if r["result"] != "ok":
+            print(f"  {r['row']:5}행 [{r['result']}] {r['detail']}")
+    print()
+    print(f"📥 총 {result['total']}행: 등록 가능 {result['accepted']} / 충돌 {result['conflicts']} / 오류 {result['invalid']}")
+    if args.dry_run:
+        print("ℹ️  --dry-run: 실제로 등록하지 않았습니다.")
+    else:
+        print(f"✅ {result['inserted']}개 일정이 등록되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,85 @@
 from __future__ import annotations
 
+# 기동 시간 측정용 (가장 먼저)
+import time as _time
+_IMPORT_STARTED = _time.perf_counter()
+
+import base64
+import csv
+import gzip
+import io
+import ipaddress
+import json
+import asyncio
+import anyio.to_thread
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from bisect import bisect_left
+from itertools import groupby
 from datetime import datetime, timedelta, date, time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple
 
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
 from sqlalchemy import (
-    create_engine, String, Integer, Boolean, Date, Time, DateTime, Text,
-    ForeignKey, select, and_
+    create_engine, String, Integer, BigInteger, Boolean, Date, Time, DateTime, Text,
+    ForeignKey, Index, select, insert, delete, and_, or_, event, inspect, func, case
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker, Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import (
+    DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker, Session, joinedload
+)
+
 
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+from conflict_index import ConflictIndex, ACTIVE_STATUSES, to_minutes
+from room_locks import KeyedLocks, LockTimeout
+from response_cache import VersionClock, ResponseCache, TTLCache, etag_matches
+from timetable import SlotGrid, GRANULARITIES
+from events import ChangeBroker
+from occupancy import pack, decode_busy
+import fast_json
+import search
+from metrics import MetricsRegistry, HttpMetrics, MetricsMiddleware
+from profiling import QueryProfiler, ProfilingMiddleware, query_budget
+from static_assets import StaticAssets
+from coherence import ChangeCounters, room_day_scope
+from startup_timing import StartupTiming
 
+startup_timing = StartupTiming(_IMPORT_STARTED)
 
 # =========================
 # Config
 # =========================
 DB_URL = os.getenv("DB_URL", "sqlite:///./classroom_rental.db")
 
+# 커넥션 풀 (SQLite 메모리 DB 제외)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 초, -1이면 사용 안 함
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "0") == "1"
+
+# SQLite 운영 프로필: production이면 WAL + 아래 PRAGMA 적용, public 조회는 별도 읽기 전용 풀 사용
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "default")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))  # 음수면 KiB 단위 (64MB)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# 읽기 전용 조회에 쓸 DB (예: Postgres 복제본). 비우면 DB_URL과 같은 DB에 별도 풀
+DB_READ_URL = os.getenv("DB_READ_URL", "")
+
+# 1이면 주요 public 조회 API를 AsyncSession(aiosqlite/asyncpg)으로 처리
+DB_ASYNC = os.getenv("DB_ASYNC", "0") == "1"
+
 DEFAULT_ADMIN_USERNAME = os.getenv("DEFAULT_ADMIN_USERNAME", "admin")
 DEFAULT_ADMIN_PASSWORD = os.getenv("DEFAULT_ADMIN_PASSWORD", "admin1234")
 
@@ -33,10 +87,59 @@ JWT_SECRET = os.getenv("JWT_SECRET", "change-me-in-prod")
 JWT_ALG = "HS256"
 JWT_EXPIRE_MIN = int(os.getenv("JWT_EXPIRE_MIN", "240"))
 
+# 검증된 관리자 토큰 캐시 유지 시간(초) / bcrypt 전용 워커 수
+ADMIN_CACHE_TTL = float(os.getenv("ADMIN_CACHE_TTL", "60"))
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", "2"))
+
+# /metrics (Prometheus 텍스트 형식). METRICS_TOKEN을 주면 Authorization: Bearer <token> 필요,
+# 없으면 같은 호스트(loopback)에서만 허용. METRICS_PUBLIC=1이면 토큰 없이 누구나 (내부망 전용 배포 등)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "0") == "1"
+
+# 동적 응답(JSON 목록 등) gzip: 이 크기(바이트) 이상만, 압축 수준 1~9. SSE(text/event-stream)와 이미 압축된 정적 파일은 제외
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+
+# 디버그 프로파일링: warn이면 쿼리 예산 초과/N+1 의심을 경고 로그로, raise면 예외로 (테스트용). 비우면 끔
+QUERY_PROFILE = os.getenv("QUERY_PROFILE", "")
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "1"))
+
+# 여러 워커 간 캐시 일관성: 조회 전에 다른 워커의 변경(change_counters)을 확인하는 최소 간격(ms). -1이면 조회 시 확인 안 함 (워커 1개)
+CACHE_SYNC_INTERVAL_MS = float(os.getenv("CACHE_SYNC_INTERVAL_MS", "200"))
+
+# 기동 모드: fast면 DB의 스키마 버전이 SCHEMA_VERSION과 같을 때 테이블 생성/마이그레이션/초기 데이터 확인을 건너뜀,
+# full이면 매번 실행 (DB를 손으로 고쳤거나 초기 강의실/관리자를 다시 만들고 싶을 때)
+STARTUP_MODE = os.getenv("STARTUP_MODE", "fast")
+
+# 예약 트랜잭션: 같은 강의실-일자 쓰기를 직렬화할 때 잠금 대기 한도(초)
+BOOKING_LOCK_TIMEOUT = float(os.getenv("BOOKING_LOCK_TIMEOUT", "10"))
+
 OPEN_HOUR = 8
 CLOSE_HOUR = 22  # end_time max 22:00
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 기간 조회(/public/schedule/range 등) 최대 일수
+MAX_RANGE_DAYS = int(os.getenv("MAX_RANGE_DAYS", "92"))
+# 기간 조회 스트리밍: 한 번에 읽을 일수 (읽은 뒤 세션을 닫고 직렬화만 스트리밍 → 느린 클라이언트가 DB 잠금을 쥐지 않음)
+RANGE_CHUNK_DAYS = max(1, int(os.getenv("RANGE_CHUNK_DAYS", "14")))
+# 오래된 일정 정리: 한 번에 지울 행 수 / 삭제 전 보관(JSONL.gz) 디렉터리 (비우면 보관 안 함)
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "500"))
+RETENTION_ARCHIVE_DIR = os.getenv("RETENTION_ARCHIVE_DIR", "")
+
+# 내 신청 내역 한 페이지 기본 건수
+MY_RESERVATIONS_PAGE_SIZE = int(os.getenv("MY_RESERVATIONS_PAGE_SIZE", "50"))
+
+# 빈 시간 검색 최대 일수 (한 학기)
+MAX_SEARCH_DAYS = int(os.getenv("MAX_SEARCH_DAYS", "190"))
+
+# 일정 전문 검색 한 페이지 최대 건수 / offset 상한 (깊은 페이지는 기간·강의실 필터로 좁히도록)
+SCHEDULE_SEARCH_MAX_LIMIT = 200
+SCHEDULE_SEARCH_MAX_OFFSET = 5000
+
+# 타임테이블 슬롯 격자 (분 단위 간격별로 기동 시 한 번만 계산)
+TIMETABLE_GRIDS = {g: SlotGrid(OPEN_HOUR, CLOSE_HOUR, g) for g in GRANULARITIES}
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
 
 # 초기 강의실 목록(요구한 현황 반영)
@@ -58,9 +161,74 @@ SEED_ROOMS = [
 # =========================
 # DB setup
 # =========================
-engine = create_engine(DB_URL, connect_args={"check_same_thread": False} if DB_URL.startswith("sqlite") else {})
+def _is_sqlite_memory(url) -> bool:
+    """SQLite 메모리 DB (sqlite://, sqlite:///:memory:)인지. 파일 DB가 아니면 QueuePool 설정을 쓸 수 없음"""
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+def _engine_kwargs(url: str) -> dict:
+    kwargs: Dict[str, Any] = {}
+    if url.startswith("sqlite"):
+        kwargs["connect_args"] = {"check_same_thread": False}
+    if not _is_sqlite_memory(url):
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    return kwargs
+
+def async_db_url(url: str) -> str:
+    """동기 DB_URL → 비동기 드라이버 URL (sqlite → aiosqlite, postgresql → asyncpg)"""
+    scheme, sep, rest = url.partition("://")
+    driver = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg", "postgres": "postgresql+asyncpg"}
+    base = scheme.split("+", 1)[0]
+    if base not in driver:
+        raise RuntimeError(f"DB_ASYNC is not supported for {base}")
+    return driver[base] + sep + rest
+
+def _install_sqlite_pragmas(target_engine, read_only: bool = False):
+    """커넥션이 만들어질 때마다 PRAGMA 적용 (SQLite 운영 프로필)"""
+    if target_engine.dialect.name != "sqlite" or SQLITE_PROFILE != "production":
+        return
+
+    @event.listens_for(target_engine, "connect")
+    def _set_pragmas(dbapi_conn, conn_record):
+        cur = dbapi_conn.cursor()
+        try:
+            if not _is_sqlite_memory(target_engine.url):
+                cur.execute("PRAGMA journal_mode=WAL")
+            cur.execute("PRAGMA synchronous=NORMAL")
+            cur.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            cur.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+            cur.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            if read_only:
+                cur.execute("PRAGMA query_only=ON")
+        finally:
+            cur.close()
+
+engine = create_engine(DB_URL, **_engine_kwargs(DB_URL))
+_install_sqlite_pragmas(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+# public GET 전용 읽기 풀: WAL에서는 쓰기(예약/정리) 중에도 막히지 않고 조회 가능
+if DB_READ_URL or (engine.dialect.name == "sqlite" and SQLITE_PROFILE == "production"):
+    read_engine = create_engine(DB_READ_URL or DB_URL, **_engine_kwargs(DB_READ_URL or DB_URL))
+    _install_sqlite_pragmas(read_engine, read_only=True)
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(bind=read_engine, autocommit=False, autoflush=False)
+
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+    _async_url = async_db_url(DB_READ_URL or DB_URL)
+    async_engine = create_async_engine(_async_url, **{k: v for k, v in _engine_kwargs(_async_url).items() if k != "connect_args"})
+    _install_sqlite_pragmas(async_engine.sync_engine, read_only=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 class Base(DeclarativeBase):
     pass
 
@@ -112,9 +280,82 @@ class Schedule(Base):
 
     classroom: Mapped["Classroom"] = relationship(back_populates="schedules")
 
+    __table_args__ = (
+        # 내 신청 내역: 이름/소속/분류 일치 + 날짜 역순 범위 스캔
+        Index("ix_schedules_owner", "owner_name", "owner_org", "category", "date"),
+    )
+
+class RoomDayOccupancy(Base):
+    """
+    Schedule에서 파생된 강의실-일자별 점유 요약 (PENDING/APPROVED 기준).
+    일정이 바뀌면 같은 트랜잭션 안에서 해당 키만 다시 계산. 행이 없으면 빈 날.
+    """
+    __tablename__ = "room_day_occupancy"
+    # 조회가 대부분 날짜 단위라 date를 PK 앞에 둠
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    classroom_id: Mapped[int] = mapped_column(ForeignKey("classrooms.id"), primary_key=True)
+    busy: Mapped[str] = mapped_column(Text, default="")  # 병합된 점유 구간 "600-660,720-780" (분)
+
+class ChangeCounter(Base):
+    """
+    워커 간 캐시 일관성용 변경 순번 (coherence.ChangeCounters).
+    scope: "*"(전역 순번, PostgreSQL은 시퀀스를 써서 없음) / "room:<강의실>:YYYY-MM-DD" / "date:YYYY-MM-DD"
+           / "schedules"(날짜 불명 전체) / "classrooms" / "admins"
+    """
+    __tablename__ = "change_counters"
+    scope: Mapped[str] = mapped_column(String(40), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, index=True)
+
+class SchemaVersion(Base):
+    """
+    DB 스키마 버전 (행 하나, id=1). SCHEMA_VERSION과 같으면 기동 시 create_all/마이그레이션/초기 데이터 확인을 건너뜀.
+    """
+    __tablename__ = "schema_version"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+# 테이블/인덱스/파생 테이블(점유 요약, 검색 색인, 변경 순번)이 바뀌면 올림 → 다음 기동 때 전체 준비 과정 실행
+SCHEMA_VERSION = 3
+
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    migrate_db()
+
+def read_schema_version() -> int:
+    """DB에 기록된 스키마 버전 (테이블이 없으면 0)"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(SchemaVersion.version).where(SchemaVersion.id == 1)).scalar() or 0
+    except DBAPIError:
+        return 0
+
+def write_schema_version(version: int = SCHEMA_VERSION):
+    with SessionLocal() as db:
+        row = db.get(SchemaVersion, 1)
+        if row is None:
+            db.add(SchemaVersion(id=1, version=version))
+        else:
+            row.version = version
+            row.updated_at = datetime.utcnow()
+        try:
+            db.commit()
+        except IntegrityError:
+            # 다른 워커가 동시에 기록함
+            db.rollback()
+
+def migrate_db():
+    """
+    가벼운 마이그레이션: create_all은 이미 있는 테이블에 나중에 추가한 인덱스를 만들지 않으므로
+    모델에 선언된 인덱스 중 없는 것만 생성 (여러 번 실행해도 안전)
+    """
+    insp = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        existing = {ix["name"] for ix in insp.get_indexes(table.name)}
+        for ix in table.indexes:
+            if ix.name not in existing:
+                ix.create(bind=engine)
 
 def get_db():
     db = SessionLocal()
@@ -123,22 +364,495 @@ def get_db():
     finally:
         db.close()
 
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# =========================
+# Change tracking
+# - flush 시점에 바뀐 Schedule을 모아두고, 커밋이 끝난 뒤에만 인메모리 구조에 반영
+# =========================
+class ScheduleChange(NamedTuple):
+    schedule_id: int
+    old_key: Optional[tuple[int, date]]
+    new_key: Optional[tuple[int, date]]  # None이면 삭제
+    start_time: Optional[time]
+    end_time: Optional[time]
+    status: Optional[str]
+    # 변경 전 구간/상태 (새로 만든 일정이면 None)
+    old_start_time: Optional[time] = None
+    old_end_time: Optional[time] = None
+    old_status: Optional[str] = None
+
+def _old_value(obj, attr: str):
+    hist = inspect(obj).attrs[attr].history
+    return hist.deleted[0] if hist.deleted else getattr(obj, attr)
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_schedule_changes(session: Session, flush_context):
+    changes = session.info.setdefault("schedule_changes", [])
+    for obj in session.new:
+        if isinstance(obj, Schedule):
+            key = (obj.classroom_id, obj.date)
+            changes.append(ScheduleChange(obj.id, None, key, obj.start_time, obj.end_time, obj.status))
+    for obj in session.dirty:
+        if isinstance(obj, Schedule):
+            old_key = (_old_value(obj, "classroom_id"), _old_value(obj, "date"))
+            key = (obj.classroom_id, obj.date)
+            changes.append(ScheduleChange(
+                obj.id, old_key, key, obj.start_time, obj.end_time, obj.status,
+                _old_value(obj, "start_time"), _old_value(obj, "end_time"), _old_value(obj, "status"),
+            ))
+    for obj in session.deleted:
+        if isinstance(obj, Schedule):
+            old_key = (_old_value(obj, "classroom_id"), _old_value(obj, "date"))
+            changes.append(ScheduleChange(
+                obj.id, old_key, None, None, None, None,
+                _old_value(obj, "start_time"), _old_value(obj, "end_time"), _old_value(obj, "status"),
+            ))
+    touched = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, Classroom) for obj in touched):
+        session.info["classrooms_changed"] = True
+    if any(isinstance(obj, Admin) for obj in touched):
+        session.info["admins_changed"] = True
+
+@event.listens_for(SessionLocal, "before_commit")
+def _maintain_occupancy(session: Session):
+    # commit()은 before_commit 이후에 남은 변경을 flush하므로 먼저 flush해서 변경 목록을 확정
+    session.flush()
+    keys = set()
+    for c in session.info.get("schedule_changes", ()):
+        # 제목/메모만 바뀐 경우는 점유가 그대로
+        if c.old_key == c.new_key and (c.start_time, c.end_time, c.status) == (c.old_start_time, c.old_end_time, c.old_status):
+            continue
+        keys.update(k for k in (c.old_key, c.new_key) if k is not None)
+    if keys:
+        _begin_booking_write(session, sorted(keys))
+        # 커밋 후 push 이벤트에 바뀐 강의실-일자의 점유 구간을 그대로 실어 보냄
+        session.info["occupancy_busy"] = refresh_occupancy(session, keys)
+
+@event.listens_for(SessionLocal, "before_commit")
+def _bump_change_counters(session: Session):
+    # _maintain_occupancy 다음에 실행 (이미 flush됨). 같은 트랜잭션에서 올려서 커밋과 함께 다른 워커에 보임
+    # 일정 변경은 강의실-일자 scope만 올림 (이미 그 강의실-일자 잠금을 쥐고 있어 새 경합 없음)
+    scopes = set()
+    for c in session.info.get("schedule_changes", ()):
+        scopes.update(room_day_scope(*k) for k in (c.old_key, c.new_key) if k is not None)
+    if session.info.get("classrooms_changed"):
+        scopes.add("classrooms")
+    if session.info.get("admins_changed"):
+        scopes.add("admins")
+    if scopes:
+        session.info["change_seq"] = change_counters.bump(session.connection(), scopes)
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_schedule_changes(session: Session):
+    change_counters.committed(session.info.pop("change_seq", None))
+    if session.info.pop("admins_changed", False):
+        admin_identity_cache.clear()
+    if session.info.pop("classrooms_changed", False):
+        schedule_versions.bump_all()
+        change_broker.publish("rooms", {})
+    changes = session.info.pop("schedule_changes", None)
+    busy_after = session.info.pop("occupancy_busy", None) or {}
+    if not changes:
+        return
+    for c in changes:
+        conflict_index.apply(c.schedule_id, c.old_key, c.new_key, c.start_time, c.end_time, c.status)
+        for key in {c.old_key, c.new_key}:
+            if key is not None:
+                schedule_versions.bump(key[1])
+        change_broker.publish("schedule", _change_event(c, busy_after))
+
+def _busy_entry(key: Optional[tuple[int, date]], st: Optional[time], et: Optional[time], status: Optional[str]):
+    if key is None or status not in ACTIVE_STATUSES:
+        return None
+    return {"classroom_id": key[0], "date": key[1].isoformat(), "start": st.strftime("%H:%M"), "end": et.strftime("%H:%M")}
+
+def _change_event(c: ScheduleChange, busy_after: Dict[tuple[int, date], str]) -> dict:
+    """
+    push용 요약 이벤트: 점유 구간 증감과 커밋 후 강의실-일자별 점유 구간(rooms)만 담고 상세(제목/신청자 등)는 담지 않음.
+    클라이언트는 rooms로 해당 칸을 그대로 교체하면 됨 (점유가 바뀌지 않은 변경이면 빈 목록)
+    """
+    rooms = [
+        {"classroom_id": key[0], "date": key[1].isoformat(), "busy": [
+            {"start": _hhmm(st), "end": _hhmm(et)} for st, et in decode_busy(busy_after[key])
+        ]}
+        for key in dict.fromkeys((c.old_key, c.new_key)) if key is not None and key in busy_after
+    ]
+    return {
+        "id": c.schedule_id,
+        "action": "created" if c.old_key is None else "deleted" if c.new_key is None else "updated",
+        "status": c.status,
+        "dates": sorted({key[1].isoformat() for key in (c.old_key, c.new_key) if key is not None}),
+        "busy_removed": _busy_entry(c.old_key, c.old_start_time, c.old_end_time, c.old_status),
+        "busy_added": _busy_entry(c.new_key, c.start_time, c.end_time, c.status),
+        "rooms": rooms,
+    }
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_schedule_changes(session: Session):
+    session.info.pop("schedule_changes", None)
+    session.info.pop("classrooms_changed", None)
+    session.info.pop("admins_changed", None)
+    session.info.pop("change_seq", None)
+    session.info.pop("occupancy_busy", None)
+
+
+# =========================
+# Occupancy
+# - room_day_occupancy를 바뀐 (classroom_id, date)만 현재 트랜잭션 기준으로 다시 씀
+# - 조회 API는 Schedule 대신 이 테이블을 PK로 읽음
+# =========================
+OCCUPANCY_CHUNK_DATES = 100  # OR 조건 하나에 묶을 날짜 수 (SQLite 식 깊이 제한 고려)
+
+def refresh_occupancy(db: Session, keys) -> Dict[tuple[int, date], str]:
+    """keys의 점유 요약을 다시 계산해 교체. 커밋은 호출 측에서. 반환: 키별 새 busy 문자열 (빈 날은 "")"""
+    by_date: Dict[date, set[int]] = {}
+    for cid, d in keys:
+        by_date.setdefault(d, set()).add(cid)
+    occ = RoomDayOccupancy.__table__
+    dates = sorted(by_date)
+    busy_after = {key: "" for key in keys}
+    for i in range(0, len(dates), OCCUPANCY_CHUNK_DATES):
+        chunk = dates[i:i + OCCUPANCY_CHUNK_DATES]
+        rows = db.execute(
+            select(Schedule.classroom_id, Schedule.date, Schedule.start_time, Schedule.end_time).where(
+                Schedule.status.in_(ACTIVE_STATUSES),
+                or_(*[and_(Schedule.date == d, Schedule.classroom_id.in_(by_date[d])) for d in chunk]),
+            )
+        ).all()
+        intervals: Dict[tuple[int, date], list[tuple[int, int]]] = {}
+        for cid, d, st, et in rows:
+            intervals.setdefault((cid, d), []).append((to_minutes(st), to_minutes(et)))
+        db.execute(delete(occ).where(
+            or_(*[and_(occ.c.date == d, occ.c.classroom_id.in_(by_date[d])) for d in chunk])
+        ))
+        if intervals:
+            rows = [_occupancy_row(key, iv) for key, iv in intervals.items()]
+            db.execute(insert(occ), rows)
+            busy_after.update(((row["classroom_id"], row["date"]), row["busy"]) for row in rows)
+    return busy_after
+
+def _occupancy_row(key: tuple[int, date], intervals: list[tuple[int, int]]) -> dict:
+    return {"classroom_id": key[0], "date": key[1], "busy": pack(intervals)}
+
+def rebuild_occupancy(db: Session, batch_size: int = 1000) -> int:
+    """전체 재계산 (테이블 신설 시 backfill, 불일치 복구용). 반환: 기록한 강의실-일자 수"""
+    occ = RoomDayOccupancy.__table__
+    db.execute(delete(occ))
+    rows = db.execute(
+        select(Schedule.date, Schedule.classroom_id, Schedule.start_time, Schedule.end_time)
+        .where(Schedule.status.in_(ACTIVE_STATUSES))
+        .order_by(Schedule.date, Schedule.classroom_id)
+        .execution_options(yield_per=batch_size)
+    )
+    written = 0
+    batch: list[dict] = []
+    for key, group in groupby(rows, key=lambda row: (row.classroom_id, row.date)):
+        batch.append(_occupancy_row(key, [(to_minutes(r.start_time), to_minutes(r.end_time)) for r in group]))
+        if len(batch) >= batch_size:
+            db.execute(insert(occ), batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        db.execute(insert(occ), batch)
+        written += len(batch)
+    seq = change_counters.bump(db.connection(), {"schedules"})
+    db.commit()
+    change_counters.committed(seq)
+    schedule_versions.bump_all()
+    return written
+
+
+# 커밋된 변경을 SSE 구독자에게 전달
+change_broker = ChangeBroker(queue_size=int(os.getenv("EVENT_QUEUE_SIZE", "256")))
+
+
+# =========================
+# Conflict index
+# - (classroom_id, date)별 점유 구간을 메모리에 두고 bisect로 충돌 검사
+# =========================
+def _load_room_day_intervals(db: Session, classroom_id: int, d: date):
+    return db.execute(
+        select(Schedule.id, Schedule.start_time, Schedule.end_time, Schedule.status).where(
+            and_(
+                Schedule.classroom_id == classroom_id,
+                Schedule.date == d,
+                Schedule.status.in_(ACTIVE_STATUSES),
+            )
+        )
+    ).all()
+
+conflict_index = ConflictIndex(_load_room_day_intervals, max_keys=int(os.getenv("CONFLICT_INDEX_MAX_KEYS", "4096")))
+
+
+# =========================
+# Response cache
+# - 날짜별 데이터 버전(Schedule 변경 시 해당 날짜, Classroom 변경 시 전체)으로 ETag 생성
+# =========================
+schedule_versions = VersionClock("schedule")
+public_schedule_cache = ResponseCache(max_entries=int(os.getenv("SCHEDULE_CACHE_MAX_DATES", "512")))
+
+
+# =========================
+# Cache coherence (멀티 워커)
+# - 쓰기 트랜잭션이 change_counters를 함께 올리고, 각 워커는 캐시를 쓰기 전에 바뀐 scope만 확인해 버림
+# - 조회 경로는 CACHE_SYNC_INTERVAL_MS마다 한 번, 예약 트랜잭션은 잠금 안에서 항상 확인
+# =========================
+def _apply_remote_changes(scopes: list[str]):
+    for scope in scopes:
+        if scope.startswith(("room:", "date:")):
+            d = date.fromisoformat(scope.rsplit(":", 1)[1])
+            conflict_index.invalidate_date(d)
+            schedule_versions.bump(d)
+        elif scope in ("schedules", "classrooms"):
+            conflict_index.invalidate()
+            schedule_versions.bump_all()
+        elif scope == "admins":
+            admin_identity_cache.clear()
+
+change_counters = ChangeCounters(ChangeCounter.__table__, _apply_remote_changes, interval=CACHE_SYNC_INTERVAL_MS / 1000)
+
+
+# =========================
+# Booking transaction
+# - (classroom_id, date)별로만 쓰기를 직렬화 (전역 잠금 X)
+# - 프로세스 내: 키별 Lock / DB: SQLite는 BEGIN IMMEDIATE(DB 단위 쓰기 잠금),
+#   PostgreSQL은 (classroom_id, date) advisory 잠금, 그 밖의 DB는 강의실 행 SELECT ... FOR UPDATE (강의실 단위)
+# - 다른 프로세스가 잠금을 오래 쥐고 있으면 503 + Retry-After
+# =========================
+room_day_locks = KeyedLocks(timeout=BOOKING_LOCK_TIMEOUT)
+BOOKING_RETRY_AFTER = "1"  # 초
+
+def _is_lock_error(e: DBAPIError) -> bool:
+    """잠금 대기 초과 (SQLite busy_timeout, PostgreSQL lock_timeout/교착 상태)"""
+    return "database is locked" in str(e.orig) or getattr(e.orig, "pgcode", None) in ("55P03", "40P01")
+
+def _begin_booking_write(db: Session, keys: list[tuple[int, date]]):
+    conn = db.connection()
+    if engine.dialect.name == "sqlite":
+        # 이미 쓰기 트랜잭션이 열려 있으면 그 트랜잭션이 쓰기 잠금을 쥐고 있음
+        if not conn.connection.driver_connection.in_transaction:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+    elif engine.dialect.name == "postgresql":
+        # 트랜잭션이 끝나면 풀리는 (int4, int4) 키 잠금. 정렬된 순서로 잡아 교착 방지
+        for cid, d in sorted(set(keys)):
+            db.execute(select(func.pg_advisory_xact_lock(cid, d.toordinal())))
+    else:
+        room_ids = sorted({cid for cid, _ in keys})
+        db.execute(
+            select(Classroom.id).where(Classroom.id.in_(room_ids)).order_by(Classroom.id).with_for_update()
+        ).all()
+
+@contextmanager
+def booking_transaction(db: Session, *keys: Optional[tuple[int, date]], reload: bool = True):
+    """
+    충돌 검사 → 쓰기 → 커밋을 하나의 임계 구역으로 묶음.
+    블록 안에서 commit 해야 하며, 잠금은 커밋 후(인덱스 반영까지 끝난 뒤) 풀림.
+    reload=False면 다른 워커의 변경을 확인하지 않음 (호출 측이 잠금 안에서 직접 DB를 조회하는 경우).
+    """
+    locked_keys = [k for k in keys if k is not None]
+    try:
+        with room_day_locks.hold(*locked_keys):
+            _begin_booking_write(db, locked_keys)
+            # 다른 워커/프로세스가 커밋한 날짜만 인덱스에서 버림 → find_conflict가 그 키만 DB에서 다시 읽음
+            if reload:
+                change_counters.sync(db.connection())
+            try:
+                yield
+            except BaseException:
+                db.rollback()
+                raise
+    except LockTimeout:
+        raise HTTPException(
+            status_code=503, detail="Too many concurrent bookings, please retry", headers={"Retry-After": BOOKING_RETRY_AFTER},
+        )
+    except DBAPIError as e:
+        if not _is_lock_error(e):
+            raise
+        db.rollback()
+        raise HTTPException(
+            status_code=503, detail="Database is busy, please retry", headers={"Retry-After": BOOKING_RETRY_AFTER},
+        )
+
+
+# =========================
+# Stats
+# - 행을 메모리로 올리지 않고 COUNT/GROUP BY 집계 쿼리로만 계산 (admin_stats, cleanup_db 공용)
+# =========================
+def collect_stats(db: Session, age_days: tuple[int, ...] = (30, 90, 180), today: Optional[date] = None) -> dict:
+    today = today or date.today()
+    cutoffs = {days: today - timedelta(days=days) for days in age_days}
+
+    # 상태별 개수 + 기간별 오래된 일정 개수를 한 번의 쿼리로
+    age_cols = [
+        func.sum(case((Schedule.date < cutoff, 1), else_=0)).label(f"older_{days}")
+        for days, cutoff in cutoffs.items()
+    ]
+    rows = db.execute(
+        select(Schedule.status, func.count(Schedule.id), *age_cols).group_by(Schedule.status)
+    ).all()
+
+    by_status: Dict[str, int] = {}
+    older = {days: 0 for days in age_days}
+    for status, count, *aged in rows:
+        by_status[status] = count
+        for days, n in zip(age_days, aged):
+            older[days] += n or 0
+
+    total_classrooms = db.execute(select(func.count(Classroom.id))).scalar_one()
+    return {
+        "total_classrooms": total_classrooms,
+        "total_schedules": sum(by_status.values()),
+        "by_status": by_status,
+        "older_than": {days: {"cutoff": cutoffs[days], "count": older[days]} for days in age_days},
+    }
+
+
+# =========================
+# Retention
+# - 오래된 일정을 id 묶음 단위 DELETE ... WHERE id IN (...)로 지우고 묶음마다 커밋 (SQLite 잠금을 짧게)
+# - 옵션: 지우기 전에 묶음을 JSONL.gz로 보관 / 끝난 뒤 incremental VACUUM
+# =========================
+def _json_default(o):
+    if isinstance(o, (date, time, datetime)):
+        return o.isoformat()
+    raise TypeError(f"not JSON serializable: {type(o)}")
+
+def purge_old_schedules(
+    db: Session,
+    cutoff: date,
+    batch_size: int = RETENTION_BATCH_SIZE,
+    archive_dir: Optional[str] = None,
+    dry_run: bool = False,
+    vacuum: bool = True,
+    pause: float = 0.0,
+) -> dict:
+    """cutoff 이전 일정 삭제. 반환: 삭제 수, 보관 파일, vacuum 결과"""
+    if dry_run:
+        count = db.execute(select(func.count(Schedule.id)).where(Schedule.date < cutoff)).scalar_one()
+        return {"deleted_count": 0, "matched_count": count, "archive_path": None, "vacuum": None, "dry_run": True}
+
+    archive_path = None
+    archive = None
+    if archive_dir:
+        os.makedirs(archive_dir, exist_ok=True)
+        archive_path = os.path.join(
+            archive_dir, f"schedules-before-{cutoff.isoformat()}-{datetime.utcnow():%Y%m%dT%H%M%S}.jsonl.gz"
+        )
+        archive = gzip.open(archive_path, "wt", encoding="utf-8")
+
+    deleted = 0
+    touched: set[tuple[int, date]] = set()
+    table = Schedule.__table__
+    try:
+        last_id = 0
+        while True:
+            cols = [table] if archive else [table.c.id, table.c.classroom_id, table.c.date]
+            rows = db.execute(
+                select(*cols).where(and_(table.c.date < cutoff, table.c.id > last_id))
+                .order_by(table.c.id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            if archive:
+                for row in rows:
+                    archive.write(json.dumps(dict(row._mapping), ensure_ascii=False, default=_json_default) + "\n")
+                archive.flush()
+            ids = [row.id for row in rows]
+            db.execute(delete(Schedule).where(Schedule.id.in_(ids)).execution_options(synchronize_session=False))
+            refresh_occupancy(db, {(row.classroom_id, row.date) for row in rows})
+            seq = change_counters.bump(db.connection(), {room_day_scope(row.classroom_id, row.date) for row in rows})
+            db.commit()
+            change_counters.committed(seq)
+            deleted += len(ids)
+            last_id = ids[-1]
+            touched.update((row.classroom_id, row.date) for row in rows)
+            if pause:
+                _time.sleep(pause)
+    finally:
+        if archive:
+            archive.close()
+        # 벌크 DELETE는 ORM 이벤트를 거치지 않으므로 인메모리 구조를 직접 정리
+        for key in touched:
+            conflict_index.invalidate(key)
+            schedule_versions.bump(key[1])
+
+    return {
+        "deleted_count": deleted,
+        "archive_path": archive_path,
+        "vacuum": _incremental_vacuum(db) if vacuum and deleted else None,
+        "dry_run": False,
+    }
+
+def _incremental_vacuum(db: Session) -> Optional[str]:
+    """SQLite auto_vacuum=INCREMENTAL일 때만 빈 페이지 반환 (전체 VACUUM은 DB를 오래 잠가서 하지 않음)"""
+    if engine.dialect.name != "sqlite":
+        return None
+    conn = db.connection()
+    mode = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+    if mode != 2:
+        return "skipped (auto_vacuum is not INCREMENTAL)"
+    freelist = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+    # 결과를 끝까지 소비해야 모든 빈 페이지가 반환됨
+    conn.connection.driver_connection.execute("PRAGMA incremental_vacuum").fetchall()
+    db.commit()
+    return f"reclaimed {freelist} pages"
+
 
 # =========================
 # Auth helpers
 # =========================
+class AdminIdentity(NamedTuple):
+    """인증된 관리자 정보 (세션에 묶이지 않아 요청 간 캐시 가능)"""
+    id: int
+    username: str
+    is_super: bool
+
+# 토큰 → AdminIdentity. Admin 행이 바뀌면 커밋 시 전체 비움
+admin_identity_cache = TTLCache(max_entries=1024)
+
+# bcrypt는 CPU를 오래 쓰므로 요청 스레드풀과 분리된 작은 풀에서만 실행
+_hash_executor = ThreadPoolExecutor(max_workers=AUTH_HASH_WORKERS, thread_name_prefix="bcrypt")
+
+# passlib/bcrypt, jose는 관리자 기능에서만 쓰므로 처음 필요할 때 import (콜드 스타트 단축)
+@lru_cache(maxsize=1)
+def _pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 def hash_password(pw: str) -> str:
-    return pwd_context.hash(pw)
+    return _pwd_context().hash(pw)
 
 def verify_password(pw: str, hashed: str) -> bool:
-    return pwd_context.verify(pw, hashed)
+    return _pwd_context().verify(pw, hashed)
+
+async def verify_password_async(pw: str, hashed: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, verify_password, pw, hashed)
 
 def create_access_token(sub: str) -> str:
+    from jose import jwt
     exp = datetime.utcnow() + timedelta(minutes=JWT_EXPIRE_MIN)
     payload = {"sub": sub, "exp": exp}
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALG)
 
-def get_current_admin(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Admin:
+def get_current_admin(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> AdminIdentity:
+    # 다른 워커에서 관리자 정보가 바뀌었으면 캐시를 비운 뒤 조회
+    change_counters.maybe_sync(engine.connect)
+    cached = admin_identity_cache.get(token)
+    if cached is not None:
+        return cached
+
+    from jose import jwt, JWTError
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
         username = payload.get("sub")
@@ -150,7 +864,11 @@ def get_current_admin(token: str = Depends(oauth2_scheme), db: Session = Depends
     admin = db.execute(select(Admin).where(Admin.username == username)).scalar_one_or_none()
     if not admin:
         raise HTTPException(status_code=401, detail="Admin not found")
-    return admin
+    identity = AdminIdentity(admin.id, admin.username, admin.is_super)
+    # 토큰 만료 시각을 넘겨서 캐시하지 않음
+    ttl = min(ADMIN_CACHE_TTL, payload.get("exp", 0) - _time.time())
+    admin_identity_cache.put(token, identity, ttl)
+    return identity
 
 
 # =========================
@@ -249,6 +967,15 @@ class RejectReq(BaseModel):
 class ApproveReq(BaseModel):
     color: str = Field(min_length=1)  # 승인 시 색깔 필수: blue/yellow/pink/green
 
+class ScheduleBatchItemReq(BaseModel):
+    id: int
+    action: str  # approve / reject
+    color: Optional[str] = None  # approve 시 필수
+    reject_reason: Optional[str] = None  # reject 시 필수
+
+class ScheduleBatchReq(BaseModel):
+    items: List[ScheduleBatchItemReq] = Field(min_length=1, max_length=1000)
+
 class AdminScheduleRes(BaseModel):
     id: int
     classroom_id: int
@@ -279,27 +1006,181 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Next-Offset"],
 )
+# 메트릭/프로파일링 미들웨어보다 안쪽: 압축 시간도 라우트 지연에 포함
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
 
-# 정적 파일 (HTML) 서빙
-FRONTEND_DIR = os.path.join(os.path.dirname(__file__), "..", "frontend")
-if os.path.exists(FRONTEND_DIR):
-    app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
+# =========================
+# Metrics
+# - 라우트별 지연/상태 코드(미들웨어) + 라우트별 쿼리 수/시간(커서 이벤트) + 풀/대기열/캐시 게이지
+# =========================
+metrics_registry = MetricsRegistry()
+http_metrics = HttpMetrics(metrics_registry)
+
+def _track_query_time(target_engine):
+    # 시작 시각은 실행 컨텍스트(문장 하나)에 둠: 실패한 문장은 after가 불리지 않지만 컨텍스트와 함께 버려짐
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_query_started = _time.perf_counter()
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_query_started", None)
+        if started is not None:
+            http_metrics.record_query(_time.perf_counter() - started)
+
+def _is_loopback(host: Optional[str]) -> bool:
+    try:
+        return host is not None and ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+def _pool_samples(attr: str):
+    engines = {"write": engine, "read": read_engine}
+    if DB_ASYNC:
+        engines["async"] = async_engine.sync_engine
+    out = []
+    for name, e in engines.items():
+        # QueuePool만 checkedout/overflow를 제공 (SQLite 메모리 DB 등은 없음)
+        fn = getattr(e.pool, attr, None)
+        if fn is not None and (name == "write" or e is not engine):
+            # QueuePool.overflow()는 풀이 다 차기 전엔 음수
+            out.append(((name,), max(0, fn())))
+    return out
+
+def _threadpool_samples():
+    # sync 핸들러가 도는 anyio 워커 스레드. waiting = 스레드를 기다리는 요청 수
+    try:
+        stats = anyio.to_thread.current_default_thread_limiter().statistics()
+    except RuntimeError:  # 이벤트 루프 밖
+        return []
+    return [(("busy",), stats.borrowed_tokens), (("waiting",), stats.tasks_waiting), (("limit",), stats.total_tokens)]
+
+_CACHES = {
+    "public_schedule": public_schedule_cache,
+    "admin_identity": admin_identity_cache,
+    "conflict_index": conflict_index,
+}
+
+def _cache_ratio_samples():
+    out = []
+    for name, c in _CACHES.items():
+        total = c.hits + c.misses
+        out.append(((name,), c.hits / total if total else None))
+    return out
+
+if METRICS_ENABLED:
+    for _e in {engine, read_engine, *((async_engine.sync_engine,) if DB_ASYNC else ())}:
+        _track_query_time(_e)
+    app.add_middleware(MetricsMiddleware, metrics=http_metrics, exclude=("/public/events",))  # SSE는 연결 시간이라 제외
+
+    metrics_registry.gauge("app_db_pool_checked_out", "DB connections currently checked out", lambda: _pool_samples("checkedout"), ("pool",))
+    metrics_registry.gauge("app_db_pool_overflow", "DB connections opened beyond pool_size", lambda: _pool_samples("overflow"), ("pool",))
+    metrics_registry.gauge("app_threadpool_tasks", "Worker threads for sync handlers", _threadpool_samples, ("state",))
+    metrics_registry.gauge("app_booking_locks", "Room-day booking locks", lambda: list(zip((("held",), ("waiting",)), room_day_locks.stats())), ("state",))
+    metrics_registry.gauge("app_sse_subscribers", "Open /public/events streams", lambda: change_broker.subscriber_count)
+    metrics_registry.callback_counter("app_cache_hits_total", "Cache hits", lambda: [((n,), c.hits) for n, c in _CACHES.items()], ("cache",))
+    metrics_registry.callback_counter("app_cache_misses_total", "Cache misses", lambda: [((n,), c.misses) for n, c in _CACHES.items()], ("cache",))
+    metrics_registry.gauge("app_cache_hit_ratio", "Cache hit ratio since start", _cache_ratio_samples, ("cache",))
+    metrics_registry.callback_counter("app_cache_sync_total", "change_counters checks against the DB", lambda: change_counters.syncs)
+    metrics_registry.callback_counter(
+        "app_cache_remote_changes_total", "Scopes invalidated because another worker changed them", lambda: change_counters.remote_changes,
+    )
+    metrics_registry.gauge("app_startup_seconds", "Startup phase durations / time from process start", startup_timing.samples, ("phase",))
 
-@app.get("/")
-def root():
-    """사용자 페이지로 리다이렉트"""
-    return FileResponse(os.path.join(FRONTEND_DIR, "user.html"))
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint(request: Request):
+        if METRICS_TOKEN:
+            if request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+                raise HTTPException(status_code=401, detail="Invalid metrics token")
+        elif not METRICS_PUBLIC and not _is_loopback(request.client.host if request.client else None):
+            raise HTTPException(status_code=403, detail="Metrics are only available from localhost (set METRICS_TOKEN)")
+        return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
-@app.get("/admin")
-def admin_page():
+# =========================
+# Query profiling (opt-in)
+# - 요청별 쿼리 수 X-Query-Count 헤더, @query_budget 초과/N+1 의심 감지, X-Profile: 1 스택 샘플링
+# =========================
+if QUERY_PROFILE in ("warn", "raise"):
+    query_profiler = QueryProfiler(QUERY_PROFILE, repeat_threshold=QUERY_REPEAT_THRESHOLD)
+    for _e in {engine, read_engine, *((async_engine.sync_engine,) if DB_ASYNC else ())}:
+        query_profiler.install(_e)
+    app.add_middleware(ProfilingMiddleware, profiler=query_profiler, sample_interval=PROFILE_SAMPLE_INTERVAL_MS / 1000)
+
+# 정적 파일 (HTML) 서빙: 기동 시 gzip/brotli로 미리 압축, 내용 해시 ETag로 304
+FRONTEND_DIR = os.path.join(os.path.dirname(__file__), "..", "frontend")
+static_assets = StaticAssets(FRONTEND_DIR)
+
+def _asset_response(request: Request, name: str, immutable: bool = False) -> Response:
+    asset = static_assets.get(name)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return static_assets.response(request, asset, immutable)
+
+@app.api_route("/static/{filename}", methods=["GET", "HEAD"])
+def static_file(request: Request, filename: str):
+    """/static/user.html (재검증) 또는 /static/user.<해시>.html (1년 immutable)"""
+    asset, immutable = static_assets.resolve(filename)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return static_assets.response(request, asset, immutable)
+
+@app.api_route("/", methods=["GET", "HEAD"])
+def root(request: Request):
+    """사용자 페이지"""
+    return _asset_response(request, "user.html")
+
+@app.api_route("/admin", methods=["GET", "HEAD"])
+def admin_page(request: Request):
     """관리자 페이지"""
-    return FileResponse(os.path.join(FRONTEND_DIR, "admin.html"))
+    return _asset_response(request, "admin.html")
 
 @app.on_event("startup")
 def on_startup():
+    global SEARCH_BACKEND
+    with startup_timing.phase("schema_check"):
+        current = read_schema_version()
+    fast = STARTUP_MODE == "fast" and current == SCHEMA_VERSION
+    if fast:
+        # 이미 준비된 DB: DDL/초기 데이터 확인 없이 검색 방식만 확인
+        with startup_timing.phase("search"):
+            SEARCH_BACKEND = search.detect(engine)
+    else:
+        with startup_timing.phase("migrate"):
+            prepare_db()
+            if current != SCHEMA_VERSION:
+                write_schema_version()
+    # 이 워커가 이미 반영한 변경 순번을 기준으로 잡음 (캐시는 비어 있음)
+    with startup_timing.phase("cache_sync"):
+        with engine.connect() as conn:
+            change_counters.sync(conn)
+    # 정적 파일 압축은 첫 API 응답을 막지 않도록 백그라운드에서 (요청이 먼저 오면 그때 읽고 압축)
+    if os.path.isdir(FRONTEND_DIR):
+        threading.Thread(target=static_assets.preload, name="static-preload", daemon=True).start()
+    startup_timing.startup_done(
+        f"{'fast' if fast else 'full'} start, schema v{current} -> v{SCHEMA_VERSION}, search={SEARCH_BACKEND}"
+    )
+
+def prepare_db():
+    """테이블/인덱스 생성, 파생 테이블 채우기, 초기 데이터 (여러 번 실행해도 안전)"""
+    global SEARCH_BACKEND
+    # 점유 요약 테이블이 새로 생기면 기존 일정으로 채움
+    insp = inspect(engine)
+    occupancy_missing = not insp.has_table(RoomDayOccupancy.__tablename__)
+    if not occupancy_missing and "mask" in {c["name"] for c in insp.get_columns(RoomDayOccupancy.__tablename__)}:
+        # 예전 형식(읽는 곳 없는 mask 컬럼)의 파생 테이블은 지우고 다시 만듦
+        RoomDayOccupancy.__table__.drop(bind=engine)
+        occupancy_missing = True
     init_db()
+    SEARCH_BACKEND = search.install(engine)
+    with engine.begin() as conn:
+        change_counters.ensure(conn)
     with SessionLocal() as db:
+        if occupancy_missing:
+            rebuild_occupancy(db)
+
         # seed classrooms if empty
         any_room = db.execute(select(Classroom.id)).scalars().first()
         if not any_room:
@@ -322,61 +1203,243 @@ def on_startup():
 # Public APIs (사용자)
 # - 절대 상세 정보 노출하지 않음
 # =========================
-@app.get("/public/classrooms", response_model=list[ClassroomRes])
-def public_list_classrooms(db: Session = Depends(get_db)):
-    rooms = db.execute(
-        select(Classroom).where(Classroom.is_active == True).order_by(Classroom.room_code)
-    ).scalars().all()
+def _active_rooms_query():
+    return select(Classroom).where(Classroom.is_active == True).order_by(Classroom.room_code)
+
+@query_budget(1)
+def public_list_classrooms(db: Session = Depends(get_read_db)):
+    rooms = db.execute(_active_rooms_query()).scalars().all()
     return [ClassroomRes(
         id=r.id, room_code=r.room_code, display_name=r.display_name, capacity=r.capacity, is_active=r.is_active
     ) for r in rooms]
 
-def _merge_busy(intervals: list[tuple[time, time]]) -> list[tuple[time, time]]:
-    if not intervals:
-        return []
-    intervals.sort(key=lambda x: x[0])
-    merged = [intervals[0]]
-    for st, et in intervals[1:]:
-        last_st, last_et = merged[-1]
-        if st <= last_et:  # overlap/adjacent
-            merged[-1] = (last_st, max(last_et, et))
-        else:
-            merged.append((st, et))
-    return merged
+@query_budget(1)
+async def public_list_classrooms_async(db=Depends(get_async_db)):
+    rooms = (await db.execute(_active_rooms_query())).scalars().all()
+    return [ClassroomRes(
+        id=r.id, room_code=r.room_code, display_name=r.display_name, capacity=r.capacity, is_active=r.is_active
+    ) for r in rooms]
 
-@app.get("/public/schedule")
-def public_schedule(date_str: str = Query(..., alias="date"), db: Session = Depends(get_db)):
+def _public_busy_query(d: date):
+    # PENDING/APPROVED 점유는 room_day_occupancy에 이미 병합돼 있음 (PK 조회)
+    return select(RoomDayOccupancy.classroom_id, RoomDayOccupancy.busy).where(RoomDayOccupancy.date == d)
+
+def _render_public_schedule(d: date, rooms, occupancy_rows) -> bytes:
+    by_room = dict(occupancy_rows)
+    body = {"date": d.strftime("%Y-%m-%d"), "rooms": [_public_room_busy(r, by_room.get(r.id)) for r in rooms]}
+    return fast_json.dumps(body)
+
+def _build_public_schedule(db: Session, d: date) -> bytes:
+    rooms = db.execute(_active_rooms_query()).scalars().all()
+    occupancy_rows = db.execute(_public_busy_query(d)).all()
+    return _render_public_schedule(d, rooms, occupancy_rows)
+
+def _hhmm(m: int) -> str:
+    return f"{m // 60:02d}:{m % 60:02d}"
+
+def _public_room_busy(r: Classroom, busy: Optional[str]) -> dict:
+    return {
+        "classroom_id": r.id,
+        "room_code": r.room_code,
+        "display_name": r.display_name,
+        "capacity": r.capacity,
+        "busy": [{"start": _hhmm(st), "end": _hhmm(et)} for st, et in decode_busy(busy or "")]
+    }
+
+def _public_schedule_cached(request: Request, d: date) -> tuple[str, dict, Optional[Response], Optional[bytes]]:
+    # 조회 전에 버전을 읽어둠 → 조회 도중 쓰기가 들어와도 다음 요청에서 버전 불일치로 다시 생성
+    # (다른 워커의 변경은 호출 전에 change_counters로 반영)
+    etag = schedule_versions.etag(d)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return etag, headers, Response(status_code=304, headers=headers), None
+    return etag, headers, None, public_schedule_cache.get(d, etag)
+
+@query_budget(3)
+def public_schedule(request: Request, date_str: str = Query(..., alias="date"), db: Session = Depends(get_read_db)):
     d = parse_date(date_str)
+    change_counters.maybe_sync(engine.connect)
+    etag, headers, not_modified, body = _public_schedule_cached(request, d)
+    if not_modified is not None:
+        return not_modified
+    if body is None:
+        body = _build_public_schedule(db, d)
+        public_schedule_cache.put(d, etag, body)
+    startup_timing.first_served("/public/schedule")
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@query_budget(3)
+async def public_schedule_async(request: Request, date_str: str = Query(..., alias="date"), db=Depends(get_async_db)):
+    d = parse_date(date_str)
+    if change_counters.due():
+        await run_in_threadpool(change_counters.maybe_sync, engine.connect)
+    etag, headers, not_modified, body = _public_schedule_cached(request, d)
+    if not_modified is not None:
+        return not_modified
+    if body is None:
+        rooms = (await db.execute(_active_rooms_query())).scalars().all()
+        occupancy_rows = (await db.execute(_public_busy_query(d))).all()
+        body = _render_public_schedule(d, rooms, occupancy_rows)
+        public_schedule_cache.put(d, etag, body)
+    startup_timing.first_served("/public/schedule")
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# =========================
+# Range streaming
+# - 기간 전체를 (date, classroom_id, start_time) 순서의 쿼리 한 번으로 읽고
+#   하루치씩 묶어 JSON 조각으로 바로 내보냄 (전체 dict를 메모리에 만들지 않음)
+# =========================
+def parse_date_range(from_str: str, to_str: str, max_days: int = MAX_RANGE_DAYS) -> tuple[date, date]:
+    d_from, d_to = parse_date(from_str), parse_date(to_str)
+    if d_to < d_from:
+        raise HTTPException(status_code=400, detail="to must not be before from")
+    if (d_to - d_from).days + 1 > max_days:
+        raise HTTPException(status_code=400, detail=f"Range must be at most {max_days} days")
+    return d_from, d_to
+
+def _stream_range(d_from: date, d_to: date, rows_query, render_day):
+    """
+    rows_query(lo, hi) → lo~hi 일자 행을 date 순으로 읽는 select, render_day(d, rooms, rows_by_room) → 하루치 dict.
+    RANGE_CHUNK_DAYS일씩 짧은 세션으로 모두 읽고 닫은 뒤 직렬화 결과만 내보냄 (yield 중에는 커서/세션을 쥐지 않음).
+    """
+    dumps = fast_json.dumps
+
+    def gen():
+        yield b'{"from":' + dumps(d_from.isoformat()) + b',"to":' + dumps(d_to.isoformat()) + b',"days":['
+        rooms = None
+        lo = d_from
+        while lo <= d_to:
+            hi = min(d_to, lo + timedelta(days=RANGE_CHUNK_DAYS - 1))
+            with ReadSessionLocal() as db:
+                if rooms is None:
+                    rooms = db.execute(_active_rooms_query()).scalars().all()
+                rows = db.execute(rows_query(lo, hi)).all()
+            by_date: Dict[date, Dict[int, list]] = {}
+            for row in rows:
+                by_date.setdefault(row.date, {}).setdefault(row.classroom_id, []).append(row)
+            d = lo
+            while d <= hi:
+                yield (b"," if d != d_from else b"") + dumps(render_day(d, rooms, by_date.get(d, {})))
+                d += timedelta(days=1)
+            lo = hi + timedelta(days=1)
+        yield b"]}"
+
+    return StreamingResponse(gen(), media_type="application/json")
+
+def _render_public_day(d: date, rooms: list[Classroom], by_room: Dict[int, list]) -> dict:
+    return {
+        "date": d.strftime("%Y-%m-%d"),
+        "rooms": [
+            _public_room_busy(r, by_room[r.id][0].busy if r.id in by_room else None)
+            for r in rooms
+        ],
+    }
+
+@app.get("/public/schedule/range")
+def public_schedule_range(from_str: str = Query(..., alias="from"), to_str: str = Query(..., alias="to")):
+    """기간별 사용 현황 (하루 단위로 스트리밍)"""
+    d_from, d_to = parse_date_range(from_str, to_str)
+    occ = RoomDayOccupancy
+
+    def rows_query(lo: date, hi: date):
+        return select(occ.date, occ.classroom_id, occ.busy).where(
+            and_(occ.date >= lo, occ.date <= hi)
+        ).order_by(occ.date, occ.classroom_id)
+    return _stream_range(d_from, d_to, rows_query, _render_public_day)
+
+# =========================
+# Availability search
+# - room_day_occupancy의 병합 구간으로 강의실-일자별 점유 비트맵(5분 단위)을 만들고 비트 연산으로 빈 구간을 찾음
+# =========================
+@app.get("/public/availability/search")
+@query_budget(2)
+def public_availability_search(
+    from_str: str = Query(..., alias="from"),
+    to_str: str = Query(..., alias="to"),
+    duration: int = Query(..., ge=5, le=(CLOSE_HOUR - OPEN_HOUR) * 60, description="사용 시간(분)"),
+    min_capacity: int = Query(0, ge=0),
+    window_start: Optional[str] = Query(None, description="HH:MM, 이 시각 이후 시작"),
+    window_end: Optional[str] = Query(None, description="HH:MM, 이 시각 이전 종료"),
+    step: int = Query(30, ge=5, description="시작 시각 간격(분)"),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_read_db),
+):
+    """
+    조건에 맞는 빈 (강의실, 날짜, 시작 시각) 후보.
+    작은 강의실부터, 같은 강의실은 날짜/시간 순. 빈 구간마다 가장 이른 시작 하나와 그 구간의 끝(free_until)을 반환.
+    """
+    d_from, d_to = parse_date_range(from_str, to_str, max_days=MAX_SEARCH_DAYS)
+    grid = TIMETABLE_GRIDS[5]
+    if step % grid.minutes:
+        raise HTTPException(status_code=400, detail=f"step must be a multiple of {grid.minutes}")
+    ws = parse_time(window_start) if window_start else time(OPEN_HOUR, 0)
+    we = parse_time(window_end) if window_end else time(CLOSE_HOUR, 0)
+    validate_time_range(ws, we)
+    # 창 안에서만 시작/종료: 시작은 다음 슬롯 경계로 올림, 끝은 내림
+    first = max(0, -(-(to_minutes(ws) - grid.open_min) // grid.minutes))
+    last = (to_minutes(we) - grid.open_min) // grid.minutes
+    length = -(-duration // grid.minutes)  # 빈 구간 탐색용 슬롯 수 (응답의 end는 실제 사용 시간 기준)
 
     rooms = db.execute(
-        select(Classroom).where(Classroom.is_active == True).order_by(Classroom.room_code)
+        select(Classroom).where(Classroom.is_active == True, Classroom.capacity >= min_capacity)
+        .order_by(Classroom.capacity, Classroom.room_code)
     ).scalars().all()
+    if not rooms:
+        return []
 
-    # PENDING/APPROVED는 시간 점유, REJECTED는 점유 X
-    schedules = db.execute(
-        select(Schedule).where(
-            and_(Schedule.date == d, Schedule.status.in_(["PENDING", "APPROVED"]))
+    # 강의실-일자당 한 행 (일정 수와 무관)
+    rows = db.execute(
+        select(RoomDayOccupancy.classroom_id, RoomDayOccupancy.date, RoomDayOccupancy.busy).where(
+            and_(
+                RoomDayOccupancy.date >= d_from,
+                RoomDayOccupancy.date <= d_to,
+                RoomDayOccupancy.classroom_id.in_([r.id for r in rooms]),
+            )
         )
-    ).scalars().all()
+    ).all()
+    busy: Dict[tuple[int, date], str] = {(cid, d): b for cid, d, b in rows}
 
-    by_room: Dict[int, list[tuple[time, time]]] = {}
-    for s in schedules:
-        by_room.setdefault(s.classroom_id, []).append((s.start_time, s.end_time))
+    def fmt(slot: int, extra_minutes: int = 0) -> str:
+        return _hhmm(grid.open_min + slot * grid.minutes + extra_minutes)
 
-    out_rooms = []
+    days = [d_from + timedelta(days=i) for i in range((d_to - d_from).days + 1)]
+    out = []
     for r in rooms:
-        merged = _merge_busy(by_room.get(r.id, []))
-        out_rooms.append({
-            "classroom_id": r.id,
-            "room_code": r.room_code,
-            "display_name": r.display_name,
-            "capacity": r.capacity,
-            "busy": [{"start": st.strftime("%H:%M"), "end": et.strftime("%H:%M")} for st, et in merged]
-        })
+        for d in days:
+            mask = grid.mask(decode_busy(busy.get((r.id, d), "")))
+            for start, free_until in grid.free_runs(mask, length, first, last, step // grid.minutes):
+                out.append({
+                    "classroom_id": r.id,
+                    "room_code": r.room_code,
+                    "display_name": r.display_name,
+                    "capacity": r.capacity,
+                    "date": d.strftime("%Y-%m-%d"),
+                    "start": fmt(start),
+                    "end": fmt(start, duration),
+                    "free_until": fmt(free_until),
+                })
+                if len(out) >= limit:
+                    return out
+    return out
 
-    return {"date": d.strftime("%Y-%m-%d"), "rooms": out_rooms}
+@app.get("/public/events")
+async def public_events(request: Request, date_str: Optional[str] = Query(None, alias="date")):
+    """
+    일정 변경 push (Server-Sent Events).
+    event: schedule → 점유 구간 증감, rooms → 강의실 목록 변경, resync → 전체 다시 조회 필요
+    date를 주면 해당 날짜 이벤트만 받음
+    """
+    d = parse_date(date_str).isoformat() if date_str else None
+    accept = (lambda e: e["type"] != "schedule" or d in e["dates"]) if d else None
+    sub = change_broker.subscribe(accept)
+    return StreamingResponse(
+        change_broker.stream(sub, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @app.post("/public/reservations")
+@query_budget(12)
 def public_create_reservation(req: PublicScheduleReq, db: Session = Depends(get_db)):
     # 필수 필드 검증
     if not req.name or not req.name.strip():
@@ -395,71 +1458,111 @@ def public_create_reservation(req: PublicScheduleReq, db: Session = Depends(get_
     if not room:
         raise HTTPException(status_code=404, detail="Classroom not found")
 
-    # 점유 검사 (PENDING/APPROVED만)
-    existing = db.execute(
-        select(Schedule).where(
-            and_(
-                Schedule.classroom_id == req.classroom_id,
-                Schedule.date == d,
-                Schedule.status.in_(["PENDING", "APPROVED"]),
-            )
+    # 점유 검사 (PENDING/APPROVED만). 잠금 전에 캐시로 먼저 걸러 경합을 줄임.
+    # 인덱스는 워커별이라 다른 워커가 지운 일정이 남아 있을 수 있으므로, 걸리면 변경 순번을 확인하고 다시 검사
+    conflict_msg = "이미 해당 시간에 사용 중입니다."
+    if conflict_index.find_conflict(db, req.classroom_id, d, st, et) is not None:
+        change_counters.sync(db.connection())
+        if conflict_index.find_conflict(db, req.classroom_id, d, st, et) is not None:
+            raise HTTPException(status_code=409, detail=conflict_msg)
+
+    with booking_transaction(db, (req.classroom_id, d)):
+        if conflict_index.find_conflict(db, req.classroom_id, d, st, et) is not None:
+            raise HTTPException(status_code=409, detail=conflict_msg)
+
+        # 사용자 신청은 PENDING으로 생성
+        s = Schedule(
+            classroom_id=req.classroom_id,
+            date=d,
+            start_time=st,
+            end_time=et,
+            category="RENTAL",
+            title="",  # 사용자에게서 받은 상세 제목은 저장하지 않음(원하면 admin 메모로만)
+            owner_name=req.name.strip(),
+            owner_org=req.org.strip(),
+            memo=req.reason.strip(),
+            status="PENDING",
         )
-    ).scalars().all()
-
-    for s in existing:
-        if overlaps(st, et, s.start_time, s.end_time):
-            raise HTTPException(status_code=400, detail="이미 해당 시간에 사용 중입니다.")
-
-    # 사용자 신청은 PENDING으로 생성
-    s = Schedule(
-        classroom_id=req.classroom_id,
-        date=d,
-        start_time=st,
-        end_time=et,
-        category="RENTAL",
-        title="",  # 사용자에게서 받은 상세 제목은 저장하지 않음(원하면 admin 메모로만)
-        owner_name=req.name.strip(),
-        owner_org=req.org.strip(),
-        memo=req.reason.strip(),
-        status="PENDING",
-    )
-    db.add(s)
-    db.commit()
+        db.add(s)
+        db.commit()
     return {"success": True, "id": s.id}
 
-@app.get("/public/my-reservations")
+def _my_reservations_query(name: str, org: str, since: Optional[date], cursor: Optional[str], limit: int):
+    # 강의실 이름까지 한 번의 JOIN 쿼리로 가져옴.
+    # ix_schedules_owner (owner_name, owner_org, category, date) 범위 스캔 → (date, start_time, id) 역순 키셋
+    q = select(
+        Schedule.id, Classroom.display_name, Schedule.date, Schedule.start_time, Schedule.end_time,
+        Schedule.status, Schedule.reject_reason, Schedule.memo, Schedule.created_at,
+    ).join(Classroom, Classroom.id == Schedule.classroom_id).where(
+        and_(
+            Schedule.owner_name == name.strip(),
+            Schedule.owner_org == org.strip(),
+            Schedule.category == "RENTAL"
+        )
+    )
+    if since is not None:
+        q = q.where(Schedule.date >= since)
+    if cursor:
+        cd, cst, cid = _decode_cursor(cursor)
+        q = q.where(or_(
+            Schedule.date < cd,
+            and_(Schedule.date == cd, or_(
+                Schedule.start_time < cst,
+                and_(Schedule.start_time == cst, Schedule.id < cid),
+            )),
+        ))
+    return q.order_by(Schedule.date.desc(), Schedule.start_time.desc(), Schedule.id.desc()).limit(limit + 1)
+
+def _render_my_reservations(rows, limit: int) -> Response:
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1])
+    return Response(content=fast_json.dumps([{
+        "id": sid,
+        "classroom_name": room_name,
+        "date": d.isoformat(),
+        "start_time": st.isoformat("minutes"),
+        "end_time": et.isoformat("minutes"),
+        "status": status,
+        "reject_reason": reject_reason,
+        "memo": memo,
+        "created_at": created_at.isoformat()
+    } for sid, room_name, d, st, et, status, reject_reason, memo, created_at in rows]),
+        media_type="application/json", headers=headers)
+
+@query_budget(1)
 def public_my_reservations(
     name: str = Query(..., min_length=1),
     org: str = Query(..., min_length=1),
-    db: Session = Depends(get_db)
+    since: Optional[str] = Query(None, description="YYYY-MM-DD, 이 날짜 이후 일정만"),
+    limit: int = Query(MY_RESERVATIONS_PAGE_SIZE, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
 ):
-    """사용자가 본인의 신청 내역 조회 (이름 + 소속으로)"""
-    schedules = db.execute(
-        select(Schedule).where(
-            and_(
-                Schedule.owner_name == name.strip(),
-                Schedule.owner_org == org.strip(),
-                Schedule.category == "RENTAL"
-            )
-        ).order_by(Schedule.date.desc(), Schedule.start_time.desc())
-    ).scalars().all()
-    
-    result = []
-    for s in schedules:
-        room = db.execute(select(Classroom).where(Classroom.id == s.classroom_id)).scalar_one()
-        result.append({
-            "id": s.id,
-            "classroom_name": room.display_name,
-            "date": s.date.strftime("%Y-%m-%d"),
-            "start_time": s.start_time.strftime("%H:%M"),
-            "end_time": s.end_time.strftime("%H:%M"),
-            "status": s.status,
-            "reject_reason": s.reject_reason,
-            "memo": s.memo,
-            "created_at": s.created_at.isoformat()
-        })
-    
-    return result
+    """사용자가 본인의 신청 내역 조회 (이름 + 소속으로). 최근 일정부터, 다음 페이지 커서는 X-Next-Cursor 헤더로."""
+    q = _my_reservations_query(name, org, parse_date(since) if since else None, cursor, limit)
+    return _render_my_reservations(db.execute(q).all(), limit)
+
+@query_budget(1)
+async def public_my_reservations_async(
+    name: str = Query(..., min_length=1),
+    org: str = Query(..., min_length=1),
+    since: Optional[str] = Query(None, description="YYYY-MM-DD, 이 날짜 이후 일정만"),
+    limit: int = Query(MY_RESERVATIONS_PAGE_SIZE, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db=Depends(get_async_db)
+):
+    """사용자가 본인의 신청 내역 조회 (이름 + 소속으로). 최근 일정부터, 다음 페이지 커서는 X-Next-Cursor 헤더로."""
+    q = _my_reservations_query(name, org, parse_date(since) if since else None, cursor, limit)
+    return _render_my_reservations((await db.execute(q)).all(), limit)
+
+# 조회가 잦은 public API는 DB_ASYNC=1이면 비동기 세션 버전으로 등록
+app.get("/public/classrooms", response_model=list[ClassroomRes])(
+    public_list_classrooms_async if DB_ASYNC else public_list_classrooms
+)
+app.get("/public/schedule")(public_schedule_async if DB_ASYNC else public_schedule)
+app.get("/public/my-reservations")(public_my_reservations_async if DB_ASYNC else public_my_reservations)
 
 
 # =========================
@@ -468,22 +1571,24 @@ def public_my_reservations(
 # - 상세 조회/수정/승인/반려/삭제 가능
 # =========================
 @app.post("/admin/login", response_model=TokenRes)
-def admin_login(req: AdminLoginReq, db: Session = Depends(get_db)):
-    admin = db.execute(select(Admin).where(Admin.username == req.username)).scalar_one_or_none()
-    if not admin or not verify_password(req.password, admin.password_hash):
+async def admin_login(req: AdminLoginReq, db: Session = Depends(get_db)):
+    password_hash = await run_in_threadpool(
+        lambda: db.execute(select(Admin.password_hash).where(Admin.username == req.username)).scalar_one_or_none()
+    )
+    if not password_hash or not await verify_password_async(req.password, password_hash):
         raise HTTPException(status_code=401, detail="Invalid username or password")
-    return TokenRes(access_token=create_access_token(sub=admin.username))
+    return TokenRes(access_token=create_access_token(sub=req.username))
 
 # classrooms CRUD (삭제 대신 비활성 권장)
 @app.get("/admin/classrooms", response_model=list[ClassroomRes])
-def admin_list_classrooms(_: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_list_classrooms(_: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     rooms = db.execute(select(Classroom).order_by(Classroom.room_code)).scalars().all()
     return [ClassroomRes(
         id=r.id, room_code=r.room_code, display_name=r.display_name, capacity=r.capacity, is_active=r.is_active
     ) for r in rooms]
 
 @app.post("/admin/classrooms", response_model=ClassroomRes)
-def admin_create_classroom(req: ClassroomCreateReq, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_create_classroom(req: ClassroomCreateReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     exists = db.execute(select(Classroom).where(Classroom.room_code == req.room_code)).scalar_one_or_none()
     if exists:
         raise HTTPException(status_code=400, detail="room_code already exists")
@@ -494,7 +1599,7 @@ def admin_create_classroom(req: ClassroomCreateReq, _: Admin = Depends(get_curre
     return ClassroomRes(id=r.id, room_code=r.room_code, display_name=r.display_name, capacity=r.capacity, is_active=r.is_active)
 
 @app.patch("/admin/classrooms/{classroom_id}", response_model=ClassroomRes)
-def admin_update_classroom(classroom_id: int, req: ClassroomUpdateReq, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_update_classroom(classroom_id: int, req: ClassroomUpdateReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     r = db.execute(select(Classroom).where(Classroom.id == classroom_id)).scalar_one_or_none()
     if not r:
         raise HTTPException(status_code=404, detail="Classroom not found")
@@ -509,8 +1614,9 @@ def admin_update_classroom(classroom_id: int, req: ClassroomUpdateReq, _: Admin
     return ClassroomRes(id=r.id, room_code=r.room_code, display_name=r.display_name, capacity=r.capacity, is_active=r.is_active)
 
 
-def _to_admin_res(db: Session, s: Schedule) -> AdminScheduleRes:
-    r = db.execute(select(Classroom).where(Classroom.id == s.classroom_id)).scalar_one()
+def _to_admin_res(s: Schedule) -> AdminScheduleRes:
+    # 일괄 처리는 joinedload로 classroom을 미리 채워 두므로 행마다 추가 쿼리가 없음
+    r = s.classroom
     return AdminScheduleRes(
         id=s.id,
         classroom_id=s.classroom_id,
@@ -530,26 +1636,146 @@ def _to_admin_res(db: Session, s: Schedule) -> AdminScheduleRes:
         created_at=s.created_at.isoformat(),
     )
 
+# 목록 조회 전용: ORM 객체 대신 튜플로 읽어 AdminScheduleRes와 같은 모양의 JSON으로 바로 인코딩
+ADMIN_LIST_COLUMNS = (
+    Schedule.id, Schedule.classroom_id, Classroom.room_code, Classroom.display_name,
+    Schedule.date, Schedule.start_time, Schedule.end_time, Schedule.category, Schedule.title,
+    Schedule.owner_name, Schedule.owner_org, Schedule.memo, Schedule.status, Schedule.reject_reason,
+    Schedule.color, Schedule.created_at,
+)
+
+def _admin_rows_json(rows) -> bytes:
+    return fast_json.dumps([{
+        "id": sid,
+        "classroom_id": cid,
+        "room_code": room_code,
+        "display_name": display_name,
+        "date": d.isoformat(),
+        "start_time": st.isoformat("minutes"),
+        "end_time": et.isoformat("minutes"),
+        "category": category,
+        "title": title,
+        "owner_name": owner_name,
+        "owner_org": owner_org,
+        "memo": memo,
+        "status": status,
+        "reject_reason": reject_reason,
+        "color": color,
+        "created_at": created_at.isoformat(),
+    } for (sid, cid, room_code, display_name, d, st, et, category, title,
+           owner_name, owner_org, memo, status, reject_reason, color, created_at) in rows])
+
+def _encode_cursor(s) -> str:
+    """s: Schedule 또는 (date, start_time, id) 속성이 있는 행"""
+    raw = f"{s.date.isoformat()}|{s.start_time.isoformat()}|{s.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> tuple[date, time, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        d, st, sid = raw.split("|")
+        return date.fromisoformat(d), time.fromisoformat(st), int(sid)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @app.get("/admin/schedules", response_model=list[AdminScheduleRes])
+@query_budget(3)
 def admin_list_schedules(
     date_str: Optional[str] = None,
     status: Optional[str] = None,
-    _: Admin = Depends(get_current_admin),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    _: AdminIdentity = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
-    q = select(Schedule)
+    """
+    일정 목록. limit을 주면 (date DESC, start_time ASC, id ASC) 기준 키셋 페이지네이션,
+    다음 페이지 커서는 X-Next-Cursor 헤더로 전달.
+    """
+    q = select(*ADMIN_LIST_COLUMNS).join(Classroom, Classroom.id == Schedule.classroom_id)
     if date_str:
         d = parse_date(date_str)
         q = q.where(Schedule.date == d)
     if status:
         q = q.where(Schedule.status == status)
-
-    q = q.order_by(Schedule.date.desc(), Schedule.start_time.asc())
-    rows = db.execute(q).scalars().all()
-    return [_to_admin_res(db, s) for s in rows]
+    if cursor:
+        cd, cst, cid = _decode_cursor(cursor)
+        q = q.where(or_(
+            Schedule.date < cd,
+            and_(Schedule.date == cd, or_(
+                Schedule.start_time > cst,
+                and_(Schedule.start_time == cst, Schedule.id > cid),
+            )),
+        ))
+
+    q = q.order_by(Schedule.date.desc(), Schedule.start_time.asc(), Schedule.id.asc())
+    if limit is not None:
+        q = q.limit(limit + 1)
+    rows = db.execute(q).all()
+    headers = {}
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1])
+    # Response를 직접 돌려주므로 response_model 검증은 건너뜀 (스키마 문서용으로만 남김)
+    return Response(content=_admin_rows_json(rows), media_type="application/json", headers=headers)
+
+# fts5 / tsvector / like (기동 시 search.install이 결정)
+SEARCH_BACKEND = "like"
+
+@app.get("/admin/schedules/search", response_model=list[AdminScheduleRes])
+@query_budget(3)
+def admin_search_schedules(
+    q: str = Query(..., min_length=1, max_length=200),
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    classroom_id: Optional[int] = None,
+    status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=SCHEDULE_SEARCH_MAX_LIMIT),
+    offset: int = Query(0, ge=0, le=SCHEDULE_SEARCH_MAX_OFFSET),
+    _: AdminIdentity = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    제목/신청자/소속/메모 검색. 단어마다 접두어 일치, 모든 단어 포함(AND).
+    관련도 순 (같으면 최근 일정 먼저), 다음 페이지 offset은 X-Next-Offset 헤더로 전달.
+    """
+    words = search.terms(q)
+    if not words:
+        raise HTTPException(status_code=400, detail="Empty search query")
+
+    stmt = select(*ADMIN_LIST_COLUMNS).select_from(Schedule).join(Classroom, Classroom.id == Schedule.classroom_id)
+    stmt, rank = search.apply(stmt, SEARCH_BACKEND, Schedule.__table__, words)
+    if date_from:
+        stmt = stmt.where(Schedule.date >= parse_date(date_from))
+    if date_to:
+        stmt = stmt.where(Schedule.date <= parse_date(date_to))
+    if classroom_id is not None:
+        stmt = stmt.where(Schedule.classroom_id == classroom_id)
+    if status:
+        stmt = stmt.where(Schedule.status == status)
+
+    order = (Schedule.date.desc(), Schedule.start_time.asc(), Schedule.id.asc())
+    stmt = stmt.order_by(*((rank,) + order if rank is not None else order)).limit(limit + 1).offset(offset)
+    rows = db.execute(stmt).all()
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Offset"] = str(offset + limit)
+    return Response(content=_admin_rows_json(rows), media_type="application/json", headers=headers)
+
+@app.get("/admin/schedules/{schedule_id}", response_model=AdminScheduleRes)
+@query_budget(3)
+def admin_get_schedule(schedule_id: int, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
+    """일정 하나 (관리자 화면이 push 이벤트를 받은 항목만 다시 읽을 때)"""
+    s = db.execute(
+        select(Schedule).options(joinedload(Schedule.classroom)).where(Schedule.id == schedule_id)
+    ).scalar_one_or_none()
+    if not s:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return _to_admin_res(s)
 
 @app.post("/admin/schedules", response_model=AdminScheduleRes)
-def admin_create_schedule(req: AdminScheduleCreateReq, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_create_schedule(req: AdminScheduleCreateReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     d = parse_date(req.date)
     st = parse_time(req.start_time)
     et = parse_time(req.end_time)
@@ -559,248 +1785,574 @@ def admin_create_schedule(req: AdminScheduleCreateReq, _: Admin = Depends(get_cu
     if not room:
         raise HTTPException(status_code=404, detail="Classroom not found")
 
-    # APPROVED/PENDING일 때만 점유. (관리자 생성이 APPROVED이면 충돌 검사 필요)
-    if req.status in ["PENDING", "APPROVED"]:
-        existing = db.execute(
-            select(Schedule).where(
-                and_(
-                    Schedule.classroom_id == req.classroom_id,
-                    Schedule.date == d,
-                    Schedule.status.in_(["PENDING", "APPROVED"]),
-                )
-            )
-        ).scalars().all()
-        for s in existing:
-            if overlaps(st, et, s.start_time, s.end_time):
+    with booking_transaction(db, (req.classroom_id, d)):
+        # APPROVED/PENDING일 때만 점유. (관리자 생성이 APPROVED이면 충돌 검사 필요)
+        if req.status in ACTIVE_STATUSES:
+            if conflict_index.find_conflict(db, req.classroom_id, d, st, et) is not None:
                 raise HTTPException(status_code=409, detail="Time conflict exists")
 
-    s = Schedule(
-        classroom_id=req.classroom_id,
-        date=d,
-        start_time=st,
-        end_time=et,
-        category=req.category,
-        title=req.title,
-        owner_name=req.owner_name,
-        owner_org=req.owner_org,
-        memo=req.memo,
-        status=req.status,
-        color=req.color,
-    )
-    db.add(s)
-    db.commit()
+        s = Schedule(
+            classroom_id=req.classroom_id,
+            date=d,
+            start_time=st,
+            end_time=et,
+            category=req.category,
+            title=req.title,
+            owner_name=req.owner_name,
+            owner_org=req.owner_org,
+            memo=req.memo,
+            status=req.status,
+            color=req.color,
+        )
+        db.add(s)
+        db.commit()
     db.refresh(s)
-    return _to_admin_res(db, s)
+    return _to_admin_res(s)
 
 @app.patch("/admin/schedules/{schedule_id}", response_model=AdminScheduleRes)
-def admin_update_schedule(schedule_id: int, req: AdminScheduleUpdateReq, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_update_schedule(schedule_id: int, req: AdminScheduleUpdateReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     s = db.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one_or_none()
     if not s:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
-    new_classroom_id = req.classroom_id if req.classroom_id is not None else s.classroom_id
-    new_date = parse_date(req.date) if req.date is not None else s.date
-    new_st = parse_time(req.start_time) if req.start_time is not None else s.start_time
-    new_et = parse_time(req.end_time) if req.end_time is not None else s.end_time
-    validate_time_range(new_st, new_et)
-
-    # 점유 상태가 PENDING/APPROVED면 충돌 검사
-    new_status = req.status if req.status is not None else s.status
-    if new_status in ["PENDING", "APPROVED"]:
-        existing = db.execute(
-            select(Schedule).where(
-                and_(
-                    Schedule.classroom_id == new_classroom_id,
-                    Schedule.date == new_date,
-                    Schedule.status.in_(["PENDING", "APPROVED"]),
-                    Schedule.id != s.id,
-                )
-            )
-        ).scalars().all()
-        for other in existing:
-            if overlaps(new_st, new_et, other.start_time, other.end_time):
-                raise HTTPException(status_code=409, detail="Time conflict exists")
+    old_key = (s.classroom_id, s.date)
+    new_key = (
+        req.classroom_id if req.classroom_id is not None else s.classroom_id,
+        parse_date(req.date) if req.date is not None else s.date,
+    )
 
-    s.classroom_id = new_classroom_id
-    s.date = new_date
-    s.start_time = new_st
-    s.end_time = new_et
-
-    if req.category is not None:
-        s.category = req.category
-    if req.title is not None:
-        s.title = req.title
-    if req.owner_name is not None:
-        s.owner_name = req.owner_name
-    if req.owner_org is not None:
-        s.owner_org = req.owner_org
-    if req.memo is not None:
-        s.memo = req.memo
-    if req.status is not None:
-        s.status = req.status
-        if s.status != "REJECTED":
-            s.reject_reason = None
-    if req.color is not None:
-        s.color = req.color
+    with booking_transaction(db, old_key, new_key):
+        # 잠금을 잡기 전에 다른 요청이 바꿨을 수 있으므로 최신 상태로 다시 읽음
+        db.refresh(s)
+        if (s.classroom_id, s.date) != old_key:
+            raise HTTPException(status_code=409, detail="Schedule was modified concurrently")
+
+        new_classroom_id, new_date = new_key
+        new_st = parse_time(req.start_time) if req.start_time is not None else s.start_time
+        new_et = parse_time(req.end_time) if req.end_time is not None else s.end_time
+        validate_time_range(new_st, new_et)
+
+        # 점유 상태가 PENDING/APPROVED면 충돌 검사
+        new_status = req.status if req.status is not None else s.status
+        if new_status in ACTIVE_STATUSES:
+            if conflict_index.find_conflict(db, new_classroom_id, new_date, new_st, new_et, exclude_id=s.id) is not None:
+                raise HTTPException(status_code=409, detail="Time conflict exists")
 
-    db.commit()
+        s.classroom_id = new_classroom_id
+        s.date = new_date
+        s.start_time = new_st
+        s.end_time = new_et
+
+        if req.category is not None:
+            s.category = req.category
+        if req.title is not None:
+            s.title = req.title
+        if req.owner_name is not None:
+            s.owner_name = req.owner_name
+        if req.owner_org is not None:
+            s.owner_org = req.owner_org
+        if req.memo is not None:
+            s.memo = req.memo
+        if req.status is not None:
+            s.status = req.status
+            if s.status != "REJECTED":
+                s.reject_reason = None
+        if req.color is not None:
+            s.color = req.color
+
+        db.commit()
     db.refresh(s)
-    return _to_admin_res(db, s)
+    return _to_admin_res(s)
 
 @app.patch("/admin/schedules/{schedule_id}/approve", response_model=AdminScheduleRes)
-def admin_approve(schedule_id: int, req: ApproveReq, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_approve(schedule_id: int, req: ApproveReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     s = db.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one_or_none()
     if not s:
         raise HTTPException(status_code=404, detail="Schedule not found")
     if s.status != "PENDING":
         raise HTTPException(status_code=400, detail="Only PENDING can be approved")
 
-    # 승인 충돌 체크
-    existing = db.execute(
-        select(Schedule).where(
-            and_(
-                Schedule.classroom_id == s.classroom_id,
-                Schedule.date == s.date,
-                Schedule.status == "APPROVED",
-                Schedule.id != s.id,
-            )
-        )
-    ).scalars().all()
-    for other in existing:
-        if overlaps(s.start_time, s.end_time, other.start_time, other.end_time):
+    key = (s.classroom_id, s.date)
+    with booking_transaction(db, key):
+        db.refresh(s)
+        if s.status != "PENDING":
+            raise HTTPException(status_code=400, detail="Only PENDING can be approved")
+        if (s.classroom_id, s.date) != key:
+            raise HTTPException(status_code=409, detail="Schedule was modified concurrently")
+
+        # 승인 충돌 체크
+        if conflict_index.find_conflict(
+            db, s.classroom_id, s.date, s.start_time, s.end_time, statuses=("APPROVED",), exclude_id=s.id
+        ) is not None:
             raise HTTPException(status_code=409, detail="Conflict with another approved schedule")
 
-    s.status = "APPROVED"
-    s.reject_reason = None
-    s.color = req.color
-    db.commit()
+        s.status = "APPROVED"
+        s.reject_reason = None
+        s.color = req.color
+        db.commit()
     db.refresh(s)
-    return _to_admin_res(db, s)
+    return _to_admin_res(s)
+
+def _reload_schedule(db: Session, schedule_id: int) -> Schedule:
+    """잠금 안에서 최신 상태로 다시 읽음 (그 사이 삭제됐으면 404)"""
+    s = db.execute(
+        select(Schedule).where(Schedule.id == schedule_id).execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+    if not s:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return s
 
 @app.patch("/admin/schedules/{schedule_id}/reject", response_model=AdminScheduleRes)
-def admin_reject(schedule_id: int, req: RejectReq, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_reject(schedule_id: int, req: RejectReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     s = db.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one_or_none()
     if not s:
         raise HTTPException(status_code=404, detail="Schedule not found")
     if s.status != "PENDING":
         raise HTTPException(status_code=400, detail="Only PENDING can be rejected")
 
-    s.status = "REJECTED"
-    s.reject_reason = req.reject_reason.strip()
-    db.commit()
+    # 승인/삭제와 같은 순서로 강의실-일자 잠금을 먼저 잡음 (커밋 직전 점유 갱신에서 늦게 잡지 않도록)
+    key = (s.classroom_id, s.date)
+    with booking_transaction(db, key, reload=False):
+        s = _reload_schedule(db, schedule_id)
+        if (s.classroom_id, s.date) != key:
+            raise HTTPException(status_code=409, detail="Schedule was modified concurrently")
+        if s.status != "PENDING":
+            raise HTTPException(status_code=400, detail="Only PENDING can be rejected")
+
+        s.status = "REJECTED"
+        s.reject_reason = req.reject_reason.strip()
+        db.commit()
     db.refresh(s)
-    return _to_admin_res(db, s)
+    return _to_admin_res(s)
+
+# =========================
+# Bulk import
+# - 행 검증 → 강의실-일자별로 정렬 후 스윕 한 번으로 (기존 일정 + 파일 내 다른 행)과 충돌 판정
+# - 통과한 행은 한 트랜잭션/한 번의 커밋으로 일괄 INSERT
+# =========================
+SCHEDULE_STATUSES = ("PENDING", "APPROVED", "REJECTED")
+
+def parse_import_payload(data: bytes, fmt: str) -> list[dict]:
+    """CSV(헤더 = AdminScheduleCreateReq 필드명) 또는 JSON 배열/{"rows": [...]} → dict 목록"""
+    text = data.decode("utf-8-sig")
+    if fmt == "csv":
+        # 빈 칸은 생략해 모델 기본값이 적용되게 함
+        return [
+            {k.strip(): v.strip() for k, v in row.items() if k and v is not None and v.strip() != ""}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    if fmt == "json":
+        payload = json.loads(text)
+        if isinstance(payload, dict):
+            payload = payload.get("rows", [])
+        if not isinstance(payload, list):
+            raise ValueError("JSON must be a list of rows")
+        return payload
+    raise ValueError(f"Unsupported format: {fmt}")
+
+def _sweep_room_day(existing: list[tuple[int, int, int]], incoming: list[tuple[int, int, int]]):
+    """
+    existing/incoming: (start_min, end_min, ref) — ref는 기존 일정 id 또는 새 항목 식별자(행 번호 등).
+    시작 시각 순으로 한 번 훑으며 incoming 각각에 대해 충돌 상대(없으면 None)를 돌려줌.
+    같은 시간대를 두고 새 항목끼리 겹치면 먼저 시작하는(동률이면 ref가 작은) 쪽이 채택됨.
+    """
+    existing = sorted(existing)
+    ex_starts = [st for st, _, _ in existing]
+    events = sorted(
+        [(st, 0, et, ("existing", ref)) for st, et, ref in existing]
+        + [(st, 1, et, ("row", ref)) for st, et, ref in incoming]
+    )
+    result: Dict[int, Optional[tuple[str, int]]] = {}
+    busy_end, busy_owner = -1, None
+    for st, kind, et, owner in events:
+        if kind == 0:
+            if et > busy_end:
+                busy_end, busy_owner = et, owner
+            continue
+        conflict = busy_owner if st < busy_end else None
+        if conflict is None:
+            # 뒤에 시작하는 기존 일정과도 겹치는지 확인
+            i = bisect_left(ex_starts, st)
+            if i < len(existing) and existing[i][0] < et:
+                conflict = ("existing", existing[i][2])
+        result[owner[1]] = conflict
+        if conflict is None and et > busy_end:
+            busy_end, busy_owner = et, owner
+    return result
+
+def import_schedules(db: Session, raw_rows: list[dict], dry_run: bool = False) -> dict:
+    report: list[dict] = [{"row": i + 1, "result": "ok"} for i in range(len(raw_rows))]
+    candidates: list[tuple[int, AdminScheduleCreateReq, date, time, time]] = []
+
+    # 1) 행 단위 검증
+    for i, raw in enumerate(raw_rows):
+        try:
+            req = AdminScheduleCreateReq.model_validate(raw)
+            d = parse_date(req.date)
+            st = parse_time(req.start_time)
+            et = parse_time(req.end_time)
+            validate_time_range(st, et)
+            if req.status not in SCHEDULE_STATUSES:
+                raise HTTPException(status_code=400, detail=f"status must be one of {list(SCHEDULE_STATUSES)}")
+        except ValidationError as e:
+            report[i].update(result="invalid", detail="; ".join(
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+            ))
+            continue
+        except HTTPException as e:
+            report[i].update(result="invalid", detail=e.detail)
+            continue
+        candidates.append((i, req, d, st, et))
+
+    room_ids = {req.classroom_id for _, req, _, _, _ in candidates}
+    known_rooms = set(db.execute(select(Classroom.id).where(Classroom.id.in_(room_ids))).scalars()) if room_ids else set()
+    by_key: Dict[tuple[int, date], list] = {}
+    for cand in candidates:
+        i, req, d, _, _ = cand
+        if req.classroom_id not in known_rooms:
+            report[i].update(result="invalid", detail="Classroom not found")
+            continue
+        by_key.setdefault((req.classroom_id, d), []).append(cand)
+
+    if not by_key:
+        return _import_summary(report, dry_run)
+
+    with booking_transaction(db, *by_key.keys(), reload=False):
+        # 2) 관련 강의실-일자의 기존 점유 일정을 한 번에 조회
+        dates = [d for _, d in by_key]
+        existing_rows = db.execute(
+            select(Schedule.id, Schedule.classroom_id, Schedule.date, Schedule.start_time, Schedule.end_time).where(
+                and_(
+                    Schedule.classroom_id.in_({cid for cid, _ in by_key}),
+                    Schedule.date >= min(dates),
+                    Schedule.date <= max(dates),
+                    Schedule.status.in_(ACTIVE_STATUSES),
+                )
+            )
+        ).all()
+        existing: Dict[tuple[int, date], list[tuple[int, int, int]]] = {}
+        for sid, cid, d, st, et in existing_rows:
+            if (cid, d) in by_key:
+                existing.setdefault((cid, d), []).append((to_minutes(st), to_minutes(et), sid))
+
+        # 3) 강의실-일자별 스윕
+        accepted: list[tuple[int, Schedule]] = []
+        for key, cands in by_key.items():
+            active = [(to_minutes(st), to_minutes(et), i) for i, req, _, st, et in cands if req.status in ACTIVE_STATUSES]
+            conflicts = _sweep_room_day(existing.get(key, []), active)
+            for i, req, d, st, et in cands:
+                conflict = conflicts.get(i)
+                if conflict is not None:
+                    kind, ref = conflict
+                    detail = f"Time conflict with existing schedule #{ref}" if kind == "existing" else f"Time conflict with row {ref + 1}"
+                    report[i].update(result="conflict", detail=detail)
+                    continue
+                accepted.append((i, Schedule(
+                    classroom_id=req.classroom_id,
+                    date=d,
+                    start_time=st,
+                    end_time=et,
+                    category=req.category,
+                    title=req.title,
+                    owner_name=req.owner_name,
+                    owner_org=req.owner_org,
+                    memo=req.memo,
+                    status=req.status,
+                    color=req.color,
+                )))
+
+        # 4) 일괄 INSERT + 한 번의 커밋
+        if dry_run or not accepted:
+            db.rollback()
+        else:
+            db.add_all([s for _, s in accepted])
+            db.commit()
+            for i, s in accepted:
+                report[i]["id"] = s.id
+
+    return _import_summary(report, dry_run)
+
+def _import_summary(report: list[dict], dry_run: bool) -> dict:
+    ok = sum(1 for r in report if r["result"] == "ok")
+    return {
+        "total": len(report),
+        "inserted": 0 if dry_run else ok,
+        "accepted": ok,
+        "conflicts": sum(1 for r in report if r["result"] == "conflict"),
+        "invalid": sum(1 for r in report if r["result"] == "invalid"),
+        "dry_run": dry_run,
+        "rows": report,
+    }
+
+@app.post("/admin/schedules/import")
+async def admin_import_schedules(
+    request: Request,
+    format: Optional[str] = Query(None, description="csv | json (기본: Content-Type으로 판단)"),
+    dry_run: bool = False,
+    _: AdminIdentity = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """CSV/JSON 일정 일괄 등록. 본문에 파일 내용을 그대로 보냄."""
+    fmt = format or ("csv" if "csv" in request.headers.get("content-type", "") else "json")
+    try:
+        raw_rows = parse_import_payload(await request.body(), fmt)
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import file: {e}")
+    return await run_in_threadpool(import_schedules, db, raw_rows, dry_run)
+
+# =========================
+# Batch approve/reject
+# - 대상 + 같은 강의실-일자의 APPROVED 일정을 한 번씩만 조회하고, 배치 내부 충돌까지 스윕으로 판정
+# =========================
+BATCH_ACTION_PAST = {"approve": "approved", "reject": "rejected"}
+
+@app.post("/admin/schedules/batch")
+def admin_batch_decide(req: ScheduleBatchReq, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
+    """대기 중 신청 일괄 승인/반려. 항목별 결과를 요청 순서대로 반환."""
+    results: list[dict] = [{"id": item.id, "action": item.action, "result": "error"} for item in req.items]
+    valid: Dict[int, int] = {}  # schedule_id -> item index
+    for i, item in enumerate(req.items):
+        if item.action not in BATCH_ACTION_PAST:
+            results[i]["detail"] = "action must be approve or reject"
+        elif item.action == "approve" and not (item.color or "").strip():
+            results[i]["detail"] = "color is required to approve"
+        elif item.action == "reject" and not (item.reject_reason or "").strip():
+            results[i]["detail"] = "reject_reason is required to reject"
+        elif item.id in valid:
+            results[i]["detail"] = "Duplicate id in batch"
+        else:
+            valid[item.id] = i
+
+    def load_targets() -> Dict[int, Schedule]:
+        return {s.id: s for s in db.execute(
+            select(Schedule).options(joinedload(Schedule.classroom))
+            .where(Schedule.id.in_(valid.keys()))
+            .execution_options(populate_existing=True)
+        ).scalars()}
+
+    targets = load_targets() if valid else {}
+    keys = {(s.classroom_id, s.date) for s in targets.values()}
+    if not keys:
+        for sid, i in valid.items():
+            results[i]["detail"] = "Schedule not found"
+        return results
+
+    with booking_transaction(db, *keys, reload=False):
+        # 잠금 안에서 최신 상태로 다시 읽음
+        targets = load_targets()
+        approvals: Dict[tuple[int, date], list[tuple[int, int, int]]] = {}
+        for sid, i in valid.items():
+            s = targets.get(sid)
+            if s is None:
+                results[i]["detail"] = "Schedule not found"
+            elif (s.classroom_id, s.date) not in keys:
+                results[i]["detail"] = "Schedule was modified concurrently"
+            elif s.status != "PENDING":
+                results[i]["detail"] = f"Only PENDING can be {BATCH_ACTION_PAST[req.items[i].action]}"
+            elif req.items[i].action == "approve":
+                approvals.setdefault((s.classroom_id, s.date), []).append(
+                    (to_minutes(s.start_time), to_minutes(s.end_time), sid)
+                )
+            else:
+                s.status = "REJECTED"
+                s.reject_reason = req.items[i].reject_reason.strip()
+                results[i]["result"] = "rejected"
+
+        if approvals:
+            approved_rows = db.execute(
+                select(Schedule.id, Schedule.classroom_id, Schedule.date, Schedule.start_time, Schedule.end_time).where(
+                    and_(
+                        Schedule.classroom_id.in_({cid for cid, _ in approvals}),
+                        Schedule.date.in_({d for _, d in approvals}),
+                        Schedule.status == "APPROVED",
+                    )
+                )
+            ).all()
+            existing: Dict[tuple[int, date], list[tuple[int, int, int]]] = {}
+            for sid, cid, d, st, et in approved_rows:
+                if (cid, d) in approvals:
+                    existing.setdefault((cid, d), []).append((to_minutes(st), to_minutes(et), sid))
+
+            for key, cands in approvals.items():
+                conflicts = _sweep_room_day(existing.get(key, []), cands)
+                for _, _, sid in cands:
+                    i = valid[sid]
+                    conflict = conflicts.get(sid)
+                    if conflict is not None:
+                        kind, ref = conflict
+                        results[i]["detail"] = (
+                            f"Conflict with another approved schedule #{ref}" if kind == "existing"
+                            else f"Conflict with schedule #{ref} approved in this batch"
+                        )
+                        continue
+                    s = targets[sid]
+                    s.status = "APPROVED"
+                    s.reject_reason = None
+                    s.color = req.items[i].color
+                    results[i]["result"] = "approved"
+
+        # 커밋 후에는 속성이 만료돼 행마다 다시 조회하므로 응답은 커밋 전에 만들어 둠
+        for r in results:
+            if r["result"] != "error":
+                r["schedule"] = _to_admin_res(targets[r["id"]])
+        db.commit()
+
+    return results
 
 @app.delete("/admin/schedules/{schedule_id}")
-def admin_delete(schedule_id: int, _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def admin_delete(schedule_id: int, _: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     s = db.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one_or_none()
     if not s:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    db.delete(s)
-    db.commit()
+
+    key = (s.classroom_id, s.date)
+    with booking_transaction(db, key, reload=False):
+        s = _reload_schedule(db, schedule_id)
+        if (s.classroom_id, s.date) != key:
+            raise HTTPException(status_code=409, detail="Schedule was modified concurrently")
+        db.delete(s)
+        db.commit()
     return {"success": True}
 
 @app.delete("/admin/schedules/cleanup/old")
-def cleanup_old_schedules(_: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+def cleanup_old_schedules(_: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     """6개월 이전 일정 자동 삭제"""
     cutoff_date = date.today() - timedelta(days=180)
-    result = db.execute(select(Schedule).where(Schedule.date < cutoff_date))
-    old_schedules = result.scalars().all()
-    count = len(old_schedules)
-    for s in old_schedules:
-        db.delete(s)
-    db.commit()
-    return {"success": True, "deleted_count": count, "cutoff_date": cutoff_date.strftime("%Y-%m-%d")}
+    result = purge_old_schedules(db, cutoff_date, archive_dir=RETENTION_ARCHIVE_DIR or None)
+    return {
+        "success": True,
+        "deleted_count": result["deleted_count"],
+        "cutoff_date": cutoff_date.strftime("%Y-%m-%d"),
+        "archive_path": result["archive_path"],
+    }
 
 @app.get("/admin/stats")
-def admin_stats(_: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+@query_budget(4)
+def admin_stats(_: AdminIdentity = Depends(get_current_admin), db: Session = Depends(get_db)):
     """시스템 통계"""
-    total_rooms = db.execute(select(Classroom)).scalars().all()
-    total_schedules = db.execute(select(Schedule)).scalars().all()
-    pending = db.execute(select(Schedule).where(Schedule.status == "PENDING")).scalars().all()
-    approved = db.execute(select(Schedule).where(Schedule.status == "APPROVED")).scalars().all()
-    rejected = db.execute(select(Schedule).where(Schedule.status == "REJECTED")).scalars().all()
-    
+    stats = collect_stats(db, age_days=(180,))
+    by_status = stats["by_status"]
     # 6개월 이전 일정 카운트
-    cutoff = date.today() - timedelta(days=180)
-    old_schedules = db.execute(select(Schedule).where(Schedule.date < cutoff)).scalars().all()
-    
+    old = stats["older_than"][180]
+
+    return {
+        "total_classrooms": stats["total_classrooms"],
+        "total_schedules": stats["total_schedules"],
+        "pending_schedules": by_status.get("PENDING", 0),
+        "approved_schedules": by_status.get("APPROVED", 0),
+        "rejected_schedules": by_status.get("REJECTED", 0),
+        "old_schedules_count": old["count"],
+        "old_schedules_cutoff": old["cutoff"].strftime("%Y-%m-%d")
+    }
+
+def _render_admin_day(d: date, rooms: list[Classroom], by_room: Dict[int, list]) -> dict:
     return {
-        "total_classrooms": len(total_rooms),
-        "total_schedules": len(total_schedules),
-        "pending_schedules": len(pending),
-        "approved_schedules": len(approved),
-        "rejected_schedules": len(rejected),
-        "old_schedules_count": len(old_schedules),
-        "old_schedules_cutoff": cutoff.strftime("%Y-%m-%d")
+        "date": d.strftime("%Y-%m-%d"),
+        "rooms": [{
+            "classroom_id": r.id,
+            "room_code": r.room_code,
+            "display_name": r.display_name,
+            "schedules": [{
+                "id": row.id,
+                "start_time": row.start_time.strftime("%H:%M"),
+                "end_time": row.end_time.strftime("%H:%M"),
+                "category": row.category,
+                "title": row.title,
+                "owner_name": row.owner_name,
+                "owner_org": row.owner_org,
+                "status": row.status,
+                "color": row.color,
+            } for row in by_room.get(r.id, ())],
+        } for r in rooms],
     }
 
+@app.get("/admin/schedule/range")
+def admin_schedule_range(
+    from_str: str = Query(..., alias="from"),
+    to_str: str = Query(..., alias="to"),
+    status: Optional[str] = None,
+    _: AdminIdentity = Depends(get_current_admin),
+):
+    """기간별 일정 상세 (하루 단위로 스트리밍)"""
+    d_from, d_to = parse_date_range(from_str, to_str)
+
+    def rows_query(lo: date, hi: date):
+        q = select(
+            Schedule.date, Schedule.classroom_id, Schedule.id, Schedule.start_time, Schedule.end_time,
+            Schedule.category, Schedule.title, Schedule.owner_name, Schedule.owner_org,
+            Schedule.status, Schedule.color,
+        ).where(and_(Schedule.date >= lo, Schedule.date <= hi))
+        if status:
+            q = q.where(Schedule.status == status)
+        return q.order_by(Schedule.date, Schedule.classroom_id, Schedule.start_time)
+    return _stream_range(d_from, d_to, rows_query, _render_admin_day)
+
 @app.get("/admin/timetable")
-def admin_timetable(date_str: str = Query(..., alias="date"), _: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
-    """일자별 강의실 현황 타임테이블 (08:00~22:00, 30분 단위)"""
+@query_budget(4)
+def admin_timetable(
+    date_str: str = Query(..., alias="date"),
+    granularity: int = Query(30, description="슬롯 간격(분): 5/10/15/30"),
+    _: AdminIdentity = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """일자별 강의실 현황 타임테이블 (08:00~22:00, 기본 30분 단위)"""
     d = parse_date(date_str)
+    grid = TIMETABLE_GRIDS.get(granularity)
+    if grid is None:
+        raise HTTPException(status_code=400, detail=f"granularity must be one of {list(GRANULARITIES)}")
     
     # 활성 강의실 목록
-    rooms = db.execute(
-        select(Classroom).where(Classroom.is_active == True).order_by(Classroom.room_code)
-    ).scalars().all()
+    rooms = db.execute(_active_rooms_query()).scalars().all()
     
-    # 해당 날짜의 승인된 일정만 조회
+    # 해당 날짜의 승인된 일정만 조회 → 강의실별로 한 번에 분류
     schedules = db.execute(
-        select(Schedule).where(
+        select(
+            Schedule.classroom_id, Schedule.id, Schedule.start_time, Schedule.end_time,
+            Schedule.color, Schedule.title, Schedule.owner_name, Schedule.category,
+        ).where(
             and_(Schedule.date == d, Schedule.status == "APPROVED")
         )
-    ).scalars().all()
+    ).all()
+    by_room: Dict[int, list] = {}
+    for row in schedules:
+        by_room.setdefault(row.classroom_id, []).append(
+            (to_minutes(row.start_time), to_minutes(row.end_time), row)
+        )
     
-    # 시간 슬롯 생성 (08:00~22:00, 30분 단위)
-    time_slots = []
-    for hour in range(8, 22):
-        for minute in [0, 30]:
-            time_slots.append(f"{hour:02d}:{minute:02d}")
-    time_slots.append("22:00")  # 마지막 슬롯
+    empty_slot = {
+        "occupied": False,
+        "color": None,
+        "title": None,
+        "owner": None,
+        "category": None,
+        "schedule_id": None,
+        "start_time": None,
+        "end_time": None,
+    }
     
-    # 강의실별로 타임테이블 생성
+    # 일정별 슬롯 내용은 한 번만 만들고 걸치는 슬롯마다 시각만 붙임
+    filled: Dict[int, dict] = {
+        row.id: {
+            "occupied": True,
+            "color": row.color or "gray",
+            "title": row.title,
+            "owner": row.owner_name,
+            "category": row.category,
+            "schedule_id": row.id,
+            "start_time": row.start_time.strftime("%H:%M"),
+            "end_time": row.end_time.strftime("%H:%M"),
+        }
+        for row in schedules
+    }
+
+    # 강의실별로 타임테이블 생성 (일정 구간이 걸치는 슬롯은 모두 점유로 표시)
     timetable = []
     for room in rooms:
-        room_schedules = [s for s in schedules if s.classroom_id == room.id]
-        
-        slots = []
-        for slot_time in time_slots[:-1]:  # 마지막 슬롯은 끝 시간으로만 사용
-            slot_start = datetime.strptime(slot_time, "%H:%M").time()
-            slot_end = datetime.strptime(time_slots[time_slots.index(slot_time) + 1], "%H:%M").time()
-            
-            # 이 시간대에 해당하는 일정 찾기
-            occupying_schedule = None
-            for sched in room_schedules:
-                # 일정이 이 슬롯과 겹치는지 확인
-                if sched.start_time <= slot_start and sched.end_time > slot_start:
-                    occupying_schedule = sched
-                    break
-            
-            if occupying_schedule:
-                slots.append({
-                    "time": slot_time,
-                    "occupied": True,
-                    "color": occupying_schedule.color or "gray",
-                    "title": occupying_schedule.title,
-                    "owner": occupying_schedule.owner_name,
-                    "category": occupying_schedule.category,
-                    "schedule_id": occupying_schedule.id,
-                    "start_time": occupying_schedule.start_time.strftime("%H:%M"),
-                    "end_time": occupying_schedule.end_time.strftime("%H:%M"),
-                })
-            else:
-                slots.append({
-                    "time": slot_time,
-                    "occupied": False,
-                    "color": None,
-                    "title": None,
-                    "owner": None,
-                    "category": None,
-                    "schedule_id": None,
-                    "start_time": None,
-                    "end_time": None,
-                })
+        _, owners = grid.occupancy(by_room.get(room.id, ()))
+        slots = [
+            {"time": slot_time, **(filled[sched.id] if sched is not None else empty_slot)}
+            for slot_time, sched in zip(grid.labels, owners)
+        ]
         
         timetable.append({
             "classroom_id": room.id,
@@ -809,8 +2361,13 @@ def admin_timetable(date_str: str = Query(..., alias="date"), _: Admin = Depends
             "slots": slots,
         })
     
-    return {
+    # 슬롯 수가 많아(5분 단위면 강의실당 168개) jsonable_encoder를 거치지 않고 바로 직렬화
+    return Response(content=fast_json.dumps({
         "date": d.strftime("%Y-%m-%d"),
-        "time_slots": time_slots[:-1],  # 시작 시간만 반환
+        "granularity": grid.minutes,
+        "time_slots": grid.labels,  # 시작 시간만 반환
         "timetable": timetable,
-    }
+    }), media_type="application/json")
+
+
+startup_timing.mark_import_done()
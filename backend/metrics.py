@@ -0,0 +1,224 @@
+"""
+Prometheus 텍스트 형식 메트릭 (외부 라이브러리 없이)
+Counter / Histogram은 값을 직접 쌓고, 게이지는 수집 시점에 콜백으로 읽습니다.
+MetricsMiddleware는 요청마다 라우트 템플릿별 지연/상태 코드를 기록하고,
+요청 중 실행된 DB 쿼리(record_query)를 같은 라우트로 묶어 기록합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time as _time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional, Tuple
+
+Labels = Tuple[str, ...]
+
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if not float(v).is_integer() else str(int(v))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Labels = ()):
+        self.name, self.help, self.labelnames = name, help, labelnames
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, v in sorted(self._values.items()):
+            lines.append(f"{self.name}{_fmt_labels(self.labelnames, labels)} {_fmt_value(v)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: Labels = (), buckets: Tuple[float, ...] = HTTP_BUCKETS):
+        self.name, self.help, self.labelnames = name, help, labelnames
+        self.buckets = tuple(buckets)
+        # labels → [버킷별 개수..., +Inf 개수], 합계
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, labels: Labels, value: float):
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels in sorted(self._counts):
+            counts = self._counts[labels]
+            cumulative = 0
+            for le, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le_label = 'le="%s"' % _fmt_value(le)
+                lines.append(f"{self.name}_bucket{_fmt_labels(self.labelnames, labels, le_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_fmt_labels(self.labelnames, labels)} {_fmt_value(self._sums[labels])}")
+            lines.append(f"{self.name}_count{_fmt_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class CallbackMetric:
+    """
+    수집할 때마다 fn()을 호출. fn은 숫자 하나 또는 (labels, value) 목록을 돌려줌.
+    kind="counter"는 다른 객체가 직접 세는 누적값(캐시 hit 수 등)을 그대로 노출할 때.
+    """
+
+    def __init__(self, name: str, help: str, fn: Callable, labelnames: Labels = (), kind: str = "gauge"):
+        self.name, self.help, self.fn, self.labelnames, self.kind = name, help, fn, labelnames, kind
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        value = self.fn()
+        samples = [((), value)] if isinstance(value, (int, float)) else value
+        for labels, v in samples:
+            if v is None:
+                continue
+            lines.append(f"{self.name}{_fmt_labels(self.labelnames, labels)} {_fmt_value(v)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: list = []
+
+    def counter(self, name: str, help: str, labelnames: Labels = ()) -> Counter:
+        m = Counter(name, help, labelnames)
+        self._metrics.append(m)
+        return m
+
+    def histogram(self, name: str, help: str, labelnames: Labels = (), buckets: Tuple[float, ...] = HTTP_BUCKETS) -> Histogram:
+        m = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(m)
+        return m
+
+    def gauge(self, name: str, help: str, fn: Callable, labelnames: Labels = ()) -> CallbackMetric:
+        m = CallbackMetric(name, help, fn, labelnames)
+        self._metrics.append(m)
+        return m
+
+    def callback_counter(self, name: str, help: str, fn: Callable, labelnames: Labels = ()) -> CallbackMetric:
+        m = CallbackMetric(name, help, fn, labelnames, kind="counter")
+        self._metrics.append(m)
+        return m
+
+    def locked(self):
+        """여러 스레드에서 기록하므로 inc/observe는 이 잠금 안에서"""
+        return self._lock
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            for m in self._metrics:
+                lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+class RequestStats:
+    """한 요청 동안 실행된 쿼리 시간(초) 목록"""
+
+    __slots__ = ("query_seconds",)
+
+    def __init__(self):
+        self.query_seconds: list[float] = []
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("metrics_request", default=None)
+
+
+class HttpMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.latency = registry.histogram(
+            "app_http_request_duration_seconds", "HTTP request latency by route", ("method", "route"),
+        )
+        self.responses = registry.counter(
+            "app_http_responses_total", "HTTP responses by route and status", ("method", "route", "status"),
+        )
+        self.db_queries = registry.counter(
+            "app_db_queries_total", "SQL statements executed, by route", ("route",),
+        )
+        self.db_latency = registry.histogram(
+            "app_db_query_duration_seconds", "SQL statement latency by route", ("route",), DB_BUCKETS,
+        )
+
+    def record_query(self, seconds: float):
+        """요청 밖(기동, 정리 스크립트 등)에서 실행된 쿼리는 route="-"로 바로 기록"""
+        stats = _current_request.get()
+        if stats is not None:
+            stats.query_seconds.append(seconds)
+            return
+        with self.registry.locked():
+            self.db_queries.inc(("-",))
+            self.db_latency.observe(("-",), seconds)
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, stats: RequestStats):
+        with self.registry.locked():
+            self.latency.observe((method, route), seconds)
+            self.responses.inc((method, route, str(status)))
+            if stats.query_seconds:
+                self.db_queries.inc((route,), len(stats.query_seconds))
+                for q in stats.query_seconds:
+                    self.db_latency.observe((route,), q)
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어 (스트리밍 응답을 버퍼링하지 않음).
+    라우트 라벨은 매칭된 경로 템플릿(/admin/schedules/{schedule_id})이라 경로 값 수만큼 늘지 않음.
+    """
+
+    def __init__(self, app, metrics: HttpMetrics, exclude: Tuple[str, ...] = ()):
+        self.app = app
+        self.metrics = metrics
+        self.exclude = exclude
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = _time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = _time.perf_counter() - started
+            _current_request.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            if path not in self.exclude:
+                self.metrics.record_request(scope["method"], path, status, elapsed, stats)
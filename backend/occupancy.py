@@ -0,0 +1,37 @@
+"""
+강의실-일자별 점유 요약 (room_day_occupancy 값)
+병합된 점유 구간 문자열("600-660,720-780", 단위: 0시 기준 분)을 만들고 읽습니다.
+슬롯 비트맵이 필요한 곳(빈 시간 검색)은 읽은 구간으로 timetable.SlotGrid.mask를 만듭니다.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Tuple
+
+
+def merge_intervals(intervals: Iterable[Tuple[int, int]]) -> list[Tuple[int, int]]:
+    """겹치거나 맞닿은 구간을 합침"""
+    merged: list[Tuple[int, int]] = []
+    for st, et in sorted(intervals):
+        if merged and st <= merged[-1][1]:
+            if et > merged[-1][1]:
+                merged[-1] = (merged[-1][0], et)
+        else:
+            merged.append((st, et))
+    return merged
+
+
+def pack(intervals: Iterable[Tuple[int, int]]) -> str:
+    """(start_min, end_min) 목록 → busy 문자열"""
+    return ",".join(f"{st}-{et}" for st, et in merge_intervals(intervals))
+
+
+def decode_busy(busy: str) -> list[Tuple[int, int]]:
+    if not busy:
+        return []
+    out = []
+    for part in busy.split(","):
+        st, et = part.split("-")
+        out.append((int(st), int(et)))
+    return out
+
@@ -0,0 +1,225 @@
+"""
+디버그용 요청 프로파일링 (QUERY_PROFILE=warn|raise 일 때만 켜짐)
+- 요청마다 SQL 문을 세고, 값만 다른 같은 모양의 문장을 묶어 N+1 의심 패턴을 찾음
+- 라우트에 선언한 쿼리 예산(@query_budget)을 넘으면 경고 로그(warn) 또는 예외(raise, 테스트용)
+- X-Profile: 1 요청은 처리하는 동안 스택을 샘플링해 collapsed stack 형식(flamegraph.pl / speedscope 입력)으로 응답
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sys
+import threading
+import time as _time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 같은 모양 판정: 리터럴/IN 목록 길이/공백 차이를 없앰
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,?)+\)", re.IGNORECASE)
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    shape = _IN_LIST.sub("IN (?)", statement)
+    shape = _LITERAL.sub("?", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+def query_budget(max_queries: int):
+    """라우트 함수에 허용 쿼리 수 선언 (인증/세션 준비 쿼리 포함). 프로파일링이 꺼져 있으면 아무 일도 안 함."""
+    def decorate(fn):
+        fn.__query_budget__ = max_queries
+        return fn
+    return decorate
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class ProfileState:
+    __slots__ = ("scope", "count", "shapes")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.count = 0
+        self.shapes: Counter = Counter()
+
+
+_current: ContextVar[Optional[ProfileState]] = ContextVar("profile_request", default=None)
+
+
+def _route_info(scope) -> tuple[str, Optional[int]]:
+    route = scope.get("route")
+    if route is None:
+        return scope.get("path", "?"), None
+    return route.path, getattr(getattr(route, "endpoint", None), "__query_budget__", None)
+
+
+class QueryProfiler:
+    """
+    mode: "warn" → 요청이 끝난 뒤 경고 로그 / "raise" → 넘는 순간 QueryBudgetExceeded (테스트에서 실패 처리)
+    repeat_threshold: 한 요청에서 같은 모양 문장이 이 횟수 이상이면 N+1 의심
+    """
+
+    def __init__(self, mode: str = "warn", repeat_threshold: int = 5):
+        self.mode = mode
+        self.repeat_threshold = repeat_threshold
+
+    def install(self, engine):
+        from sqlalchemy import event
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            state = _current.get()
+            if state is None:
+                return
+            shape = statement_shape(statement)
+            state.count += 1
+            state.shapes[shape] += 1
+            if self.mode != "raise":
+                return
+            path, budget = _route_info(state.scope)
+            # 넘는 순간 한 번만
+            if budget is not None and state.count == budget + 1:
+                raise QueryBudgetExceeded(f"{path}: more than {budget} queries")
+            if state.shapes[shape] == self.repeat_threshold:
+                raise QueryBudgetExceeded(f"{path}: possible N+1, same statement x{self.repeat_threshold}: {shape[:200]}")
+
+    def begin(self, scope) -> tuple[ProfileState, object]:
+        state = ProfileState(scope)
+        return state, _current.set(state)
+
+    def end(self, state: ProfileState, token):
+        _current.reset(token)
+        if self.mode != "warn" or not state.count:
+            return
+        path, budget = _route_info(state.scope)
+        if budget is not None and state.count > budget:
+            logger.warning("query profile: %s ran %d queries (budget %d)", path, state.count, budget)
+        shape, repeats = state.shapes.most_common(1)[0]
+        if repeats >= self.repeat_threshold:
+            logger.warning("query profile: %s possible N+1, same statement x%d: %s", path, repeats, shape[:200])
+
+
+# 대기 중인 스레드(이벤트 루프 select, 워커 스레드 대기 등)는 샘플에서 뺌
+_IDLE_FRAMES = {
+    ("threading.py", "wait"), ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"), ("queue.py", "get"), ("thread.py", "_worker"),
+}
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    for marker in ("site-packages" + os.sep, "lib" + os.sep + "python"):
+        i = filename.rfind(marker)
+        if i >= 0:
+            filename = filename[i + len(marker):]
+            break
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{frame.f_lineno})"
+
+
+class StackSampler:
+    """
+    interval초마다 모든 스레드의 스택을 수집 (sys._current_frames).
+    요청 하나를 디버깅하는 용도: 동시에 다른 요청이 돌고 있으면 그 스택도 섞임.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.is_set():
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                if (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in _IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+            _time.sleep(self.interval)
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope가 읽는 'frame;frame;frame count' 형식"""
+        return "".join(f"{stack} {n}\n" for stack, n in self.samples.most_common())
+
+
+class ProfilingMiddleware:
+    """
+    모든 요청의 쿼리를 QueryProfiler로 세고, X-Query-Count 응답 헤더를 붙임.
+    X-Profile: 1 이면 원래 응답 대신 샘플링한 스택(text/plain)을 돌려주고 원래 상태 코드는 X-Profile-Status로 알려줌.
+    """
+
+    def __init__(self, app, profiler: QueryProfiler, sample_interval: float = 0.001):
+        self.app = app
+        self.profiler = profiler
+        self.sample_interval = sample_interval
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state, token = self.profiler.begin(scope)
+        profile = (b"x-profile", b"1") in scope.get("headers", ())
+        sampler = StackSampler(self.sample_interval) if profile else None
+        original_status = 500
+
+        async def send_wrapper(message):
+            nonlocal original_status
+            if profile:
+                # 원래 응답은 버리고 상태 코드만 기억
+                if message["type"] == "http.response.start":
+                    original_status = message["status"]
+                return
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ())) + [(b"x-query-count", str(state.count).encode())]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        if sampler:
+            sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if sampler:
+                sampler.stop()
+            self.profiler.end(state, token)
+
+        if profile:
+            body = sampler.collapsed().encode()
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile-status", str(original_status).encode()),
+                    (b"x-query-count", str(state.count).encode()),
+                    (b"x-profile-samples", str(sum(sampler.samples.values())).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
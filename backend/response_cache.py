@@ -0,0 +1,122 @@
+"""
+데이터 버전 기반 응답 캐시
+키(예: 날짜)별 버전과 전역 버전을 조합해 ETag를 만들고,
+버전이 바뀌지 않은 동안은 미리 직렬화한 응답 본문을 그대로 돌려줍니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time as _time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+
+class VersionClock:
+    """키별 변경 카운터 + 전체에 영향을 주는 전역 카운터."""
+
+    def __init__(self, namespace: str):
+        # 재시작 후 카운터가 0부터 다시 시작해도 이전 ETag와 겹치지 않도록 기동 시각을 섞음
+        self._epoch = f"{namespace}-{int(_time.time() * 1000):x}"
+        self._lock = threading.Lock()
+        self._global = 0
+        self._versions: dict[Hashable, int] = {}
+
+    def bump(self, key: Hashable):
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def bump_all(self):
+        with self._lock:
+            self._global += 1
+
+    def etag(self, key: Hashable) -> str:
+        with self._lock:
+            return f'W/"{self._epoch}.{self._global}.{self._versions.get(key, 0)}"'
+
+
+class ResponseCache:
+    """key → (etag, body) LRU. etag가 현재 버전과 다르면 미스로 취급."""
+
+    def __init__(self, max_entries: int = 512):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[str, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, etag: str) -> Optional[bytes]:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None or hit[0] != etag:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return hit[1]
+
+    def put(self, key: Hashable, etag: str, body: bytes):
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두사는 무시
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == wanted:
+            return True
+    return False
+
+
+class TTLCache:
+    """항목별 만료 시각이 있는 LRU."""
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable):
+        now = _time.monotonic()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                self.misses += 1
+                return None
+            if hit[0] <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return hit[1]
+
+    def put(self, key: Hashable, value, ttl: float):
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (_time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
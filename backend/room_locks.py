@@ -0,0 +1,58 @@
+"""
+키((classroom_id, date) 등)별 프로세스 내 잠금
+같은 강의실-일자에 대한 쓰기만 직렬화하고, 서로 다른 키는 병렬로 진행됩니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Optional
+
+
+class LockTimeout(Exception):
+    pass
+
+
+class KeyedLocks:
+    """참조 카운트로 관리되는 키별 Lock. 아무도 쓰지 않는 키의 Lock은 바로 정리됩니다."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        self._timeout = timeout
+        self._guard = threading.Lock()
+        self._locks: dict[Hashable, list] = {}  # key -> [Lock, refcount]
+
+    def stats(self) -> tuple[int, int]:
+        """(잠금이 걸린 키 수, 대기 중인 요청 수)"""
+        with self._guard:
+            return len(self._locks), sum(entry[1] - 1 for entry in self._locks.values())
+
+    @contextmanager
+    def hold(self, *keys: Hashable):
+        # 여러 키를 잡을 때는 항상 같은 순서로 잡아 교착을 피함
+        ordered = sorted({k for k in keys if k is not None})
+        entries = []
+        with self._guard:
+            for key in ordered:
+                entry = self._locks.get(key)
+                if entry is None:
+                    entry = self._locks[key] = [threading.Lock(), 0]
+                entry[1] += 1
+                entries.append(entry)
+
+        acquired = []
+        try:
+            for entry in entries:
+                ok = entry[0].acquire(timeout=self._timeout) if self._timeout else entry[0].acquire()
+                if not ok:
+                    raise LockTimeout("lock wait timed out")
+                acquired.append(entry)
+            yield
+        finally:
+            for entry in reversed(acquired):
+                entry[0].release()
+            with self._guard:
+                for key, entry in zip(ordered, entries):
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        del self._locks[key]
@@ -0,0 +1,147 @@
+"""
+일정 전문 검색 (title / owner_name / owner_org / memo)
+- SQLite: FTS5 외부 콘텐츠 테이블(schedules_fts) + 트리거로 schedules와 동기화
+- PostgreSQL: tsvector 식 GIN 인덱스 (행이 바뀌면 DB가 인덱스를 갱신)
+- 그 밖의 DB 또는 FTS5 없는 SQLite: LIKE 조건 (순위 없음)
+트리거/식 인덱스는 DB 안에서 동작하므로 ORM을 거치지 않는 벌크 INSERT/DELETE도 반영됩니다.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import and_, column, func, literal_column, or_, table, text
+
+SEARCH_COLUMNS = ("title", "owner_name", "owner_org", "memo")
+# bm25 가중치 (SEARCH_COLUMNS 순서): 제목이 가장 중요
+FTS_WEIGHTS = (10.0, 4.0, 4.0, 1.0)
+FTS_TABLE = "schedules_fts"
+MAX_TERMS = 8
+
+_FTS_DDL = f"""
+CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+    {", ".join(SEARCH_COLUMNS)},
+    content='schedules', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+)
+"""
+_COLS = ", ".join(SEARCH_COLUMNS)
+_NEW = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+_OLD = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+_FTS_TRIGGERS = {
+    "schedules_fts_ai": f"""
+CREATE TRIGGER schedules_fts_ai AFTER INSERT ON schedules BEGIN
+    INSERT INTO {FTS_TABLE}(rowid, {_COLS}) VALUES (new.id, {_NEW});
+END""",
+    "schedules_fts_ad": f"""
+CREATE TRIGGER schedules_fts_ad AFTER DELETE ON schedules BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLS}) VALUES ('delete', old.id, {_OLD});
+END""",
+    # 검색 대상 컬럼이 바뀔 때만 (승인/반려 등 상태 변경은 건너뜀)
+    "schedules_fts_au": f"""
+CREATE TRIGGER schedules_fts_au AFTER UPDATE OF {_COLS} ON schedules BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLS}) VALUES ('delete', old.id, {_OLD});
+    INSERT INTO {FTS_TABLE}(rowid, {_COLS}) VALUES (new.id, {_NEW});
+END""",
+}
+
+# 제목(A) > 신청자/소속(B) > 메모(C). 인덱스와 조회가 같은 식을 써야 인덱스를 탐
+PG_VECTOR_SQL = (
+    "(setweight(to_tsvector('simple', coalesce(schedules.title, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(schedules.owner_name, '') || ' ' || coalesce(schedules.owner_org, '')), 'B')"
+    " || setweight(to_tsvector('simple', coalesce(schedules.memo, '')), 'C'))"
+)
+_PG_INDEX_DDL = f"CREATE INDEX IF NOT EXISTS ix_schedules_search ON schedules USING gin ({PG_VECTOR_SQL})"
+
+_TERM = re.compile(r"\w+")
+
+
+def terms(q: str) -> list[str]:
+    """검색어 → 단어 목록 (따옴표/연산자 등 특수문자는 버림)"""
+    return _TERM.findall(q.lower())[:MAX_TERMS]
+
+
+def fts5_query(words: list[str]) -> str:
+    # 각 단어를 접두어로 (한국어 조사가 붙은 "세미나를"도 "세미나"로 찾도록), 단어끼리는 AND
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def pg_tsquery(words: list[str]) -> str:
+    return " & ".join(f"{w}:*" for w in words)
+
+
+def _fts5_available(conn) -> bool:
+    options = {row[0] for row in conn.exec_driver_sql("PRAGMA compile_options")}
+    return "ENABLE_FTS5" in options
+
+
+def install(engine) -> str:
+    """
+    검색 인덱스를 준비하고 사용할 방식("fts5" / "tsvector" / "like")을 돌려줌.
+    FTS5 테이블이나 트리거가 없었다면(신설, schedules 재생성 등) 전체를 다시 색인.
+    """
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text(_PG_INDEX_DDL))
+        return "tsvector"
+    if dialect != "sqlite":
+        return "like"
+
+    with engine.begin() as conn:
+        if not _fts5_available(conn):
+            return "like"
+        existing = {
+            name for (name,) in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE name = ? OR (type = 'trigger' AND tbl_name = 'schedules')",
+                (FTS_TABLE,),
+            )
+        }
+        missing = [name for name in _FTS_TRIGGERS if name not in existing]
+        if FTS_TABLE not in existing:
+            conn.exec_driver_sql(_FTS_DDL)
+        for name in missing:
+            conn.exec_driver_sql(_FTS_TRIGGERS[name])
+        if missing or FTS_TABLE not in existing:
+            conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return "fts5"
+
+
+def detect(engine) -> str:
+    """install이 이미 끝난 DB에서 DDL 없이 사용할 방식만 확인 (빠른 기동용)"""
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        return "tsvector"
+    if dialect != "sqlite":
+        return "like"
+    with engine.connect() as conn:
+        found = conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = ?", (FTS_TABLE,)).first()
+    return "fts5" if found is not None else "like"
+
+
+def rebuild(engine) -> None:
+    """FTS5 색인을 schedules 내용으로 다시 만듦 (불일치 복구용). 다른 방식은 할 일 없음."""
+    if install(engine) == "fts5":
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def apply(q, backend: str, schedules, words: list[str]):
+    """
+    select 문 q(schedules 포함)에 검색 조건을 붙이고 (q, 순위 식) 반환.
+    순위 식은 ORDER BY에 그대로 쓰면 됨 (관련도 높은 순). like는 None.
+    """
+    if backend == "fts5":
+        fts = table(FTS_TABLE, column("rowid"))
+        fts_ref = literal_column(FTS_TABLE)
+        q = q.join(fts, fts.c.rowid == schedules.c.id).where(fts_ref.op("MATCH")(fts5_query(words)))
+        # bm25는 관련도가 높을수록 작은 값
+        return q, func.bm25(fts_ref, *FTS_WEIGHTS).asc()
+    if backend == "tsvector":
+        vector = literal_column(PG_VECTOR_SQL)
+        query = func.to_tsquery("simple", pg_tsquery(words))
+        return q.where(vector.op("@@")(query)), func.ts_rank_cd(vector, query).desc()
+
+    pattern = lambda w: "%" + w.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    return q.where(and_(*[
+        or_(*[schedules.c[c].ilike(pattern(w), escape="\\") for c in SEARCH_COLUMNS]) for w in words
+    ])), None
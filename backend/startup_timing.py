@@ -0,0 +1,76 @@
+"""
+기동 시간 측정
+프로세스 시작 → main import → startup 단계별 → 첫 응답까지 걸린 시간을 기록해
+기동이 끝날 때와 첫 요청을 처리했을 때 한 줄씩 로그로 남기고, /metrics에도 노출합니다.
+프로세스 시작 시각은 Linux /proc에서 읽고, 없으면 main import 시작을 기준으로 합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time as _time
+from contextlib import contextmanager
+from typing import Optional
+
+# uvicorn이 INFO로 설정해 두는 로거 (앱 전용 로깅 설정 없이 콘솔에 보임)
+logger = logging.getLogger("uvicorn.error")
+
+
+def process_age() -> Optional[float]:
+    """프로세스가 시작된 지 몇 초 지났는지 (Linux 외에는 None)"""
+    try:
+        with open("/proc/self/stat") as f:
+            # comm에 공백/괄호가 있을 수 있어 마지막 ')' 뒤부터 나눔. starttime은 22번째 필드
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTiming:
+    def __init__(self, import_started: float):
+        # perf_counter 기준 프로세스 시작 시각 (모르면 import 시작)
+        age = process_age()
+        self._origin = _time.perf_counter() - age if age is not None else import_started
+        self._import_started = import_started
+        self._lock = threading.Lock()
+        self.phases: dict[str, float] = {}
+        self._first_served: set[str] = set()
+
+    def mark_import_done(self):
+        self.phases["before_import"] = max(0.0, self._import_started - self._origin)
+        self.phases["import"] = _time.perf_counter() - self._import_started
+
+    @contextmanager
+    def phase(self, name: str):
+        started = _time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = _time.perf_counter() - started
+
+    def since_start(self) -> float:
+        return _time.perf_counter() - self._origin
+
+    def startup_done(self, summary: str):
+        self.phases["ready"] = self.since_start()
+        detail = ", ".join(f"{k} {v * 1000:.0f}ms" for k, v in self.phases.items() if k != "ready")
+        logger.info("startup: ready %.0fms after process start (%s) [%s]", self.phases["ready"] * 1000, summary, detail)
+
+    def first_served(self, route: str):
+        """라우트별 첫 응답 시각을 한 번만 기록 (이후 호출은 집합 조회 한 번)"""
+        if route in self._first_served:
+            return
+        with self._lock:
+            if route in self._first_served:
+                return
+            self._first_served.add(route)
+            self.phases[f"first {route}"] = elapsed = self.since_start()
+        logger.info("startup: first %s served %.0fms after process start", route, elapsed * 1000)
+
+    def samples(self) -> list:
+        return [((name,), seconds) for name, seconds in list(self.phases.items())]
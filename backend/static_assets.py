@@ -0,0 +1,178 @@
+"""
+프론트엔드 정적 파일 서빙 (미리 압축 + 캐시 헤더)
+- 파일마다 내용 해시(sha256 앞 16자)로 강한 ETag를 만들고, gzip/brotli 본문을 미리 만들어 메모리에 둠
+- Accept-Encoding(q 값 포함)에 따라 br > gzip > identity 순으로 골라 보냄
+- name.<해시>.ext 처럼 해시가 붙은 URL은 내용이 바뀌면 URL도 바뀌므로 1년 immutable 캐시,
+  그 밖의 URL(/, /admin, /static/user.html)은 no-cache (매번 ETag로 재검증 → 바뀌지 않았으면 304)
+- 파일이 수정되면(mtime/크기 변경) 다음 요청 때 다시 읽고 압축하므로 개발 중 재시작 불필요
+brotli는 선택 의존성 (pip install brotli), 없으면 gzip까지만.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from typing import NamedTuple, Optional
+
+from fastapi import Request, Response
+from response_cache import etag_matches
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# 압축해서 이득이 있는 형식만 (이미지 등은 그대로)
+COMPRESSIBLE_TYPES = (
+    "text/html", "text/css", "text/plain", "text/javascript", "application/javascript",
+    "application/json", "image/svg+xml",
+)
+MIN_COMPRESS_SIZE = 256
+
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9._-]*$")
+_FINGERPRINT = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{16})(?P<ext>\.[A-Za-z0-9]+)$")
+
+
+class Asset(NamedTuple):
+    name: str
+    media_type: str
+    digest: str                      # 내용 해시 (ETag, 지문 URL에 사용)
+    bodies: dict[str, bytes]         # "identity" / "gzip" / "br" → 본문
+    stat_key: tuple[int, int]        # (mtime_ns, size) 변경 감지용
+
+
+def accepted_encodings(header: Optional[str]) -> dict[str, float]:
+    """Accept-Encoding → {encoding: q}. 명시하지 않은 identity는 허용(q=0.001)"""
+    accepted: dict[str, float] = {}
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[token] = q
+    accepted.setdefault("identity", accepted.get("*", 0.001))
+    return accepted
+
+
+def choose_encoding(header: Optional[str], available) -> str:
+    """q 값이 가장 높은 인코딩 (같으면 br > gzip > identity)"""
+    accepted = accepted_encodings(header)
+    wildcard = accepted.get("*", 0.0)
+    candidates = [(accepted.get(enc, wildcard), rank, enc) for rank, enc in ((2, "br"), (1, "gzip")) if enc in available]
+    candidates.append((accepted["identity"], 0, "identity"))
+    q, _, encoding = max(candidates)
+    return encoding if q > 0 else "identity"
+
+
+class StaticAssets:
+    def __init__(self, directory: str, gzip_level: int = 9, brotli_quality: int = 11):
+        self.directory = directory
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._lock = threading.Lock()
+        self._assets: dict[str, Asset] = {}
+
+    def preload(self) -> int:
+        """기동 시 디렉터리의 파일을 모두 읽어 압축. 반환: 파일 수"""
+        count = 0
+        for name in sorted(os.listdir(self.directory)):
+            if self.get(name) is not None:
+                count += 1
+        return count
+
+    def get(self, name: str) -> Optional[Asset]:
+        """디렉터리 바로 아래 파일만 (하위 경로/숨김 파일 불가). 바뀌었으면 다시 읽음."""
+        if not _SAFE_NAME.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+        stat_key = (st.st_mtime_ns, st.st_size)
+        asset = self._assets.get(name)
+        if asset is not None and asset.stat_key == stat_key:
+            return asset
+        with self._lock:
+            asset = self._assets.get(name)
+            if asset is None or asset.stat_key != stat_key:
+                asset = self._load(name, path, stat_key)
+                self._assets[name] = asset
+        return asset
+
+    def _load(self, name: str, path: str, stat_key: tuple[int, int]) -> Asset:
+        with open(path, "rb") as f:
+            raw = f.read()
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        bodies = {"identity": raw}
+        if media_type in COMPRESSIBLE_TYPES and len(raw) >= MIN_COMPRESS_SIZE:
+            # mtime=0: 같은 내용이면 같은 gzip 바이트 (재시작/워커 간 ETag 일치)
+            bodies["gzip"] = gzip.compress(raw, compresslevel=self.gzip_level, mtime=0)
+            if brotli is not None:
+                bodies["br"] = brotli.compress(raw, quality=self.brotli_quality)
+        if media_type.startswith("text/") or media_type in ("application/javascript", "application/json"):
+            media_type += "; charset=utf-8"
+        return Asset(name, media_type, hashlib.sha256(raw).hexdigest()[:16], bodies, stat_key)
+
+    def url(self, name: str) -> Optional[str]:
+        """지문이 붙은 URL (/static/user.<해시>.html). 파일이 없으면 None"""
+        asset = self.get(name)
+        return self._fingerprinted(asset) if asset is not None else None
+
+    @staticmethod
+    def _fingerprinted(asset: Asset) -> str:
+        stem, ext = os.path.splitext(asset.name)
+        return f"/static/{stem}.{asset.digest}{ext}"
+
+    def resolve(self, path_name: str) -> tuple[Optional[Asset], bool]:
+        """URL의 파일 이름 → (asset, immutable 캐시 가능 여부). 지난 버전의 해시면 현재 내용을 재검증 캐시로."""
+        m = _FINGERPRINT.match(path_name)
+        if m:
+            asset = self.get(m["stem"] + m["ext"])
+            if asset is not None:
+                return asset, asset.digest == m["hash"]
+        return self.get(path_name), False
+
+    def response(self, request: Request, asset: Asset, immutable: bool = False) -> Response:
+        """
+        선택한 인코딩의 본문 + ETag/Cache-Control/Vary, If-None-Match가 맞으면 304.
+        Content-Location은 이 내용의 지문 URL (immutable 캐시용 주소)
+        """
+        encoding = choose_encoding(request.headers.get("accept-encoding"), asset.bodies)
+        # 강한 ETag는 표현(인코딩)마다 달라야 함
+        etag = f'"{asset.digest}"' if encoding == "identity" else f'"{asset.digest}-{encoding}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": IMMUTABLE if immutable else REVALIDATE,
+            "Vary": "Accept-Encoding",
+            "Content-Location": self._fingerprinted(asset),
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        body = b"" if request.method == "HEAD" else asset.bodies[encoding]
+        response = Response(content=body, media_type=asset.media_type, headers=headers)
+        if request.method == "HEAD":
+            response.headers["Content-Length"] = str(len(asset.bodies[encoding]))
+        return response
@@ -0,0 +1,48 @@
+"""
+테스트 공용 설정
+main은 import 시점에 DB_URL로 엔진을 만들므로, 테스트 모듈이 main을 import하기 전에 임시 SQLite 파일 DB를 지정합니다.
+QUERY_PROFILE=raise로 라우트 쿼리 예산 초과/N+1 의심을 실패로 잡습니다.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+_tmp = tempfile.mkdtemp(prefix="classroom-rental-test-")
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_tmp, 'test.db')}"
+os.environ.setdefault("QUERY_PROFILE", "raise")
+os.environ.setdefault("STARTUP_MODE", "full")
+
+ADMIN = {"username": "admin", "password": "admin1234"}
+
+
+@pytest.fixture(scope="session")
+def app_main():
+    import main
+    return main
+
+
+@pytest.fixture(scope="session")
+def client(app_main):
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_main.app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    token = client.post("/admin/login", json=ADMIN).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def reservation(classroom_id: int, d: str, start: str = "10:00", end: str = "11:00") -> dict:
+    return {
+        "classroom_id": classroom_id, "date": d, "start_time": start, "end_time": end,
+        "name": "홍길동", "org": "테스트", "reason": "테스트 예약",
+    }
@@ -0,0 +1,57 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+
+from sqlalchemy import insert
+
+from conftest import reservation
+
+
+def test_concurrent_requests_for_one_slot_have_a_single_winner(client):
+    body = reservation(1, "2031-06-02")
+    with ThreadPoolExecutor(16) as ex:
+        codes = Counter(ex.map(lambda _: client.post("/public/reservations", json=body).status_code, range(40)))
+    assert codes == {200: 1, 409: 39}
+
+
+def test_different_rooms_book_in_parallel(client):
+    with ThreadPoolExecutor(8) as ex:
+        codes = list(ex.map(
+            lambda cid: client.post("/public/reservations", json=reservation(cid, "2031-06-03")).status_code,
+            range(1, 5),
+        ))
+    assert codes == [200, 200, 200, 200]
+
+
+def test_booking_sees_a_write_made_by_another_worker(app_main, client):
+    main = app_main
+    d = date(2031, 6, 4)
+    # 인덱스에 "빈 날"을 캐시해 둠
+    assert client.post("/public/reservations", json=reservation(2, d.isoformat(), "08:00", "09:00")).status_code == 200
+
+    # 다른 워커: 이 프로세스의 세션 이벤트를 거치지 않고 DB에 쓰고 변경 순번만 올림
+    other = main.ChangeCounters(main.ChangeCounter.__table__, lambda scopes: None)
+    with main.engine.begin() as conn:
+        conn.execute(insert(main.Schedule.__table__).values(
+            classroom_id=2, date=d, start_time=time(10), end_time=time(11), category="CLASS",
+            title="다른 워커", owner_name="a", owner_org="b", status="APPROVED", color="blue",
+        ))
+        other.bump(conn, {main.room_day_scope(2, d)})
+
+    res = client.post("/public/reservations", json=reservation(2, d.isoformat(), "10:30", "11:30"))
+    assert res.status_code == 409
+
+
+def test_admin_reject_and_delete_release_the_slot(client, admin_headers):
+    d = "2031-06-07"
+    sid = client.post("/public/reservations", json=reservation(4, d)).json()["id"]
+    assert client.post("/public/reservations", json=reservation(4, d)).status_code == 409
+
+    res = client.patch(f"/admin/schedules/{sid}/reject", json={"reject_reason": "중복"}, headers=admin_headers)
+    assert res.status_code == 200 and res.json()["status"] == "REJECTED"
+    assert client.patch(f"/admin/schedules/{sid}/reject", json={"reject_reason": "x"}, headers=admin_headers).status_code == 400
+
+    again = client.post("/public/reservations", json=reservation(4, d)).json()["id"]
+    assert client.delete(f"/admin/schedules/{again}", headers=admin_headers).status_code == 200
+    assert client.delete(f"/admin/schedules/{again}", headers=admin_headers).status_code == 404
+    assert client.post("/public/reservations", json=reservation(4, d)).status_code == 200
@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import BigInteger, Column, MetaData, String, Table, create_engine, insert
+
+from coherence import ChangeCounters
+
+
+@pytest.fixture()
+def counters_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'counters.db'}")
+    meta = MetaData()
+    table = Table(
+        "change_counters", meta,
+        Column("scope", String(40), primary_key=True),
+        Column("version", BigInteger, index=True),
+    )
+    meta.create_all(engine)
+    return engine, table
+
+
+def _worker(table, interval=0.0):
+    seen = []
+    return ChangeCounters(table, seen.extend, interval=interval), seen
+
+
+def _write(engine, counters, scopes):
+    with engine.begin() as conn:
+        seq = counters.bump(conn, scopes)
+    counters.committed(seq)
+    return seq
+
+
+def test_other_worker_sees_only_changed_scopes(counters_engine):
+    engine, table = counters_engine
+    a, a_seen = _worker(table)
+    b, b_seen = _worker(table)
+    with engine.begin() as conn:
+        a.ensure(conn)
+        b.ensure(conn)
+    with engine.connect() as conn:
+        a.sync(conn)
+        b.sync(conn)
+
+    _write(engine, a, {"room:1:2031-05-01", "classrooms"})
+    with engine.connect() as conn:
+        assert sorted(b.sync(conn)) == ["classrooms", "room:1:2031-05-01"]
+        assert b.sync(conn) == []
+        # 자기 변경은 이미 로컬 캐시에 반영했으므로 다시 버리지 않음
+        assert a.sync(conn) == []
+    assert sorted(b_seen) == ["classrooms", "room:1:2031-05-01"]
+    assert a_seen == []
+    assert b.remote_changes == 2
+
+
+def test_first_sync_only_sets_the_baseline(counters_engine):
+    engine, table = counters_engine
+    a, _ = _worker(table)
+    with engine.begin() as conn:
+        a.ensure(conn)
+    with engine.connect() as conn:
+        a.sync(conn)
+    _write(engine, a, {"admins"})
+
+    late, late_seen = _worker(table)
+    with engine.connect() as conn:
+        assert late.sync(conn) == []
+    _write(engine, a, {"room:2:2031-05-01"})
+    with engine.connect() as conn:
+        assert late.sync(conn) == ["room:2:2031-05-01"]
+    assert late_seen == ["room:2:2031-05-01"]
+
+
+def test_out_of_order_commit_is_picked_up_later(counters_engine):
+    # 시퀀스(PostgreSQL) 순번은 커밋 순서와 다를 수 있음: 7이 먼저 보이고 6이 나중에 커밋
+    engine, table = counters_engine
+    b, _ = _worker(table)
+    with engine.begin() as conn:
+        conn.execute(insert(table).values(scope="room:1:2031-05-01", version=5))
+    with engine.connect() as conn:
+        b.sync(conn)
+
+    with engine.begin() as conn:
+        conn.execute(insert(table).values(scope="room:2:2031-05-01", version=7))
+    with engine.connect() as conn:
+        assert b.sync(conn) == ["room:2:2031-05-01"]
+
+    with engine.begin() as conn:
+        conn.execute(insert(table).values(scope="room:3:2031-05-01", version=6))
+    with engine.connect() as conn:
+        assert b.sync(conn) == ["room:3:2031-05-01"]
+        assert b.sync(conn) == []
+
+
+def test_gap_gives_up_after_timeout(counters_engine):
+    engine, table = counters_engine
+    b = ChangeCounters(table, lambda scopes: None, interval=0.0, gap_timeout=0.0)
+    with engine.connect() as conn:
+        b.sync(conn)
+    with engine.begin() as conn:
+        conn.execute(insert(table).values(scope="classrooms", version=3))
+    with engine.connect() as conn:
+        assert b.sync(conn) == ["classrooms"]
+        assert b.sync(conn) == []
+    # 순번 1, 2는 더 이상 기다리지 않음
+    assert b._gaps == {}
+
+
+def test_maybe_sync_respects_interval(counters_engine):
+    engine, table = counters_engine
+    a, _ = _worker(table, interval=60)
+    a.maybe_sync(engine.connect)
+    a.maybe_sync(engine.connect)
+    assert a.syncs == 1
+    disabled, _ = _worker(table, interval=-1)
+    disabled.maybe_sync(engine.connect)
+    assert disabled.syncs == 0
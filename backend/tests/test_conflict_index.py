@@ -0,0 +1,110 @@
+from datetime import date, time
+
+from conflict_index import ConflictIndex, RoomDayIntervals
+
+D = date(2031, 5, 1)
+
+
+def _intervals(*rows):
+    entry = RoomDayIntervals()
+    for sid, st, et, status in rows:
+        entry.add(sid, st, et, status)
+    return entry
+
+
+def test_overlap_and_touching_edges():
+    entry = _intervals((1, 600, 660, "APPROVED"))
+    assert entry.find_conflict(630, 690) == 1
+    assert entry.find_conflict(540, 601) == 1
+    # [st, et) 구간이라 맞닿는 것은 충돌이 아님
+    assert entry.find_conflict(660, 720) is None
+    assert entry.find_conflict(540, 600) is None
+
+
+def test_long_interval_found_behind_later_starts():
+    # 뒤쪽 짧은 구간들보다 앞에서 시작한 긴 구간도 max_ends 덕분에 찾아야 함
+    entry = _intervals((1, 480, 1200, "APPROVED"), (2, 600, 610, "PENDING"), (3, 700, 710, "PENDING"))
+    assert entry.find_conflict(900, 960) == 1
+    assert entry.find_conflict(900, 960, statuses=("PENDING",)) is None
+
+
+def test_status_filter_and_exclude_id():
+    entry = _intervals((1, 600, 660, "PENDING"), (2, 600, 660, "APPROVED"))
+    assert entry.find_conflict(600, 660, statuses=("APPROVED",)) == 2
+    assert entry.find_conflict(600, 660, statuses=("APPROVED",), exclude_id=2) is None
+    assert entry.find_conflict(600, 660, exclude_id=2) == 1
+
+
+def test_discard_keeps_max_ends_consistent():
+    entry = _intervals((1, 480, 1200, "APPROVED"), (2, 600, 610, "APPROVED"))
+    assert entry.discard(1)
+    assert not entry.discard(1)
+    assert entry.find_conflict(900, 960) is None
+    assert entry.find_conflict(605, 606) == 2
+    assert len(entry) == 1
+
+
+def test_loads_once_and_applies_committed_changes():
+    calls = []
+
+    def loader(db, classroom_id, d):
+        calls.append((classroom_id, d))
+        return [(1, time(10), time(11), "APPROVED")]
+
+    index = ConflictIndex(loader)
+    assert index.find_conflict(None, 1, D, time(10, 30), time(12)) == 1
+    assert index.find_conflict(None, 1, D, time(11), time(12)) is None
+    assert calls == [(1, D)]
+    assert (index.hits, index.misses) == (1, 1)
+
+    # 시간 변경 → 이전 구간은 비고 새 구간이 막힘
+    index.apply(1, (1, D), (1, D), time(13), time(14), "APPROVED")
+    assert index.find_conflict(None, 1, D, time(10), time(11)) is None
+    assert index.find_conflict(None, 1, D, time(13, 30), time(15)) == 1
+    # 반려는 점유가 아님
+    index.apply(1, (1, D), (1, D), time(13), time(14), "REJECTED")
+    assert index.find_conflict(None, 1, D, time(13), time(14)) is None
+    assert calls == [(1, D)]
+
+
+def test_invalidate_date_reloads_only_that_date():
+    calls = []
+    other = date(2031, 5, 2)
+
+    def loader(db, classroom_id, d):
+        calls.append((classroom_id, d))
+        return []
+
+    index = ConflictIndex(loader)
+    for key in [(1, D), (2, D), (1, other)]:
+        index.find_conflict(None, *key, time(10), time(11))
+    index.invalidate_date(D)
+    for key in [(1, D), (2, D), (1, other)]:
+        index.find_conflict(None, *key, time(10), time(11))
+    assert calls == [(1, D), (2, D), (1, other), (1, D), (2, D)]
+
+
+def test_load_racing_a_write_is_not_cached():
+    index = None
+    calls = []
+
+    def loader(db, classroom_id, d):
+        calls.append(d)
+        if len(calls) == 1:
+            # 읽는 도중 다른 요청의 커밋이 반영됨 → 이 결과는 이미 낡았을 수 있음
+            index.apply(2, None, (1, D), time(10), time(11), "APPROVED")
+        return []
+
+    index = ConflictIndex(loader)
+    assert index.find_conflict(None, 1, D, time(10), time(11)) is None
+    assert index.find_conflict(None, 1, D, time(10), time(11)) is None
+    assert len(calls) == 2
+
+
+def test_lru_evicts_oldest_key():
+    index = ConflictIndex(lambda db, cid, d: [], max_keys=2)
+    for cid in (1, 2, 3):
+        index.find_conflict(None, cid, D, time(10), time(11))
+    index.find_conflict(None, 3, D, time(10), time(11))
+    index.find_conflict(None, 1, D, time(10), time(11))
+    assert (index.hits, index.misses) == (1, 4)
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from room_locks import KeyedLocks, LockTimeout
+
+
+def test_timeout_when_key_is_held():
+    locks = KeyedLocks(timeout=0.05)
+    with locks.hold("a"):
+        t0 = time.monotonic()
+        with pytest.raises(LockTimeout):
+            with locks.hold("a"):
+                pass
+        assert time.monotonic() - t0 < 1
+        # 다른 키는 기다리지 않음
+        with locks.hold("b"):
+            pass
+    assert locks.stats() == (0, 0)
+
+
+def test_timeout_releases_keys_already_taken():
+    locks = KeyedLocks(timeout=0.05)
+    with locks.hold("b"):
+        with pytest.raises(LockTimeout):
+            with locks.hold("a", "b"):
+                pass
+        # "a"는 실패한 시도에서 풀렸어야 함
+        with locks.hold("a"):
+            pass
+    assert locks.stats() == (0, 0)
+
+
+def test_opposite_key_order_does_not_deadlock():
+    locks = KeyedLocks(timeout=5)
+    start = threading.Barrier(2)
+    errors = []
+
+    def worker(keys):
+        try:
+            start.wait()
+            for _ in range(200):
+                with locks.hold(*keys):
+                    pass
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(keys,)) for keys in (("a", "b"), ("b", "a"))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    assert not any(t.is_alive() for t in threads)
+    assert errors == []
+    assert locks.stats() == (0, 0)
+
+
+def test_same_key_is_mutually_exclusive():
+    locks = KeyedLocks()
+    inside = []
+    overlaps = []
+
+    def worker():
+        for _ in range(100):
+            with locks.hold(("room", 1), None):
+                inside.append(1)
+                if len(inside) > 1:
+                    overlaps.append(len(inside))
+                inside.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlaps == []
+    assert locks.stats() == (0, 0)
+
+
+def test_stats_counts_waiters():
+    locks = KeyedLocks()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with locks.hold("a"):
+            entered.set()
+            release.wait(5)
+
+    def waiter():
+        with locks.hold("a"):
+            pass
+
+    threads = [threading.Thread(target=holder)]
+    threads[0].start()
+    entered.wait(5)
+    threads.append(threading.Thread(target=waiter))
+    threads[1].start()
+    deadline = time.monotonic() + 5
+    while locks.stats() != (1, 1) and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert locks.stats() == (1, 1)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert locks.stats() == (0, 0)
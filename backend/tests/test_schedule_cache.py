@@ -0,0 +1,19 @@
+from conftest import reservation
+
+
+def test_schedule_etag_revalidates_until_a_write(client):
+    d = "2031-06-05"
+    first = client.get(f"/public/schedule?date={d}")
+    etag = first.headers["etag"]
+    assert client.get(f"/public/schedule?date={d}", headers={"If-None-Match": etag}).status_code == 304
+
+    # 다른 날짜의 변경은 이 날짜의 ETag를 바꾸지 않음
+    assert client.post("/public/reservations", json=reservation(3, "2031-06-06")).status_code == 200
+    assert client.get(f"/public/schedule?date={d}", headers={"If-None-Match": etag}).status_code == 304
+
+    assert client.post("/public/reservations", json=reservation(3, d)).status_code == 200
+    changed = client.get(f"/public/schedule?date={d}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    room = next(r for r in changed.json()["rooms"] if r["classroom_id"] == 3)
+    assert room["busy"] == [{"start": "10:00", "end": "11:00"}]
@@ -0,0 +1,97 @@
+"""
+타임테이블 엔진
+운영 시간을 고정 간격 슬롯으로 나눈 격자(SlotGrid)를 미리 만들어 두고,
+강의실-일자의 일정들을 한 번 훑어 점유 비트맵(int)과 슬롯별 점유 일정으로 변환합니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Tuple
+
+GRANULARITIES = (5, 10, 15, 30)
+
+
+class SlotGrid:
+    """open_hour~close_hour를 minutes 간격으로 나눈 슬롯. 라벨/경계는 생성 시 한 번만 계산."""
+
+    __slots__ = ("open_min", "close_min", "minutes", "count", "labels", "full_mask")
+
+    def __init__(self, open_hour: int, close_hour: int, minutes: int):
+        span = (close_hour - open_hour) * 60
+        if minutes <= 0 or span % minutes:
+            raise ValueError(f"granularity {minutes} does not divide the opening hours")
+        self.open_min = open_hour * 60
+        self.close_min = close_hour * 60
+        self.minutes = minutes
+        self.count = span // minutes
+        self.labels = [
+            f"{m // 60:02d}:{m % 60:02d}" for m in range(self.open_min, self.close_min, minutes)
+        ]
+        self.full_mask = (1 << self.count) - 1
+
+    def slot_range(self, st: int, et: int) -> Tuple[int, int]:
+        """[st, et)(분)와 조금이라도 겹치는 슬롯 인덱스 구간 [first, last)"""
+        first = max(0, (st - self.open_min) // self.minutes)
+        last = min(self.count, -(-(et - self.open_min) // self.minutes))
+        return first, last
+
+    def occupancy(self, intervals: Iterable[Tuple[int, int, Any]]) -> Tuple[int, list[Optional[Any]]]:
+        """
+        intervals: (start_min, end_min, payload)
+        반환: (점유 비트맵, 슬롯별 payload). 한 슬롯에 여러 일정이 걸치면 먼저 시작한 일정이 표시됨.
+        """
+        mask = 0
+        owners: list[Optional[Any]] = [None] * self.count
+        for st, et, payload in sorted(intervals, key=lambda x: x[0]):
+            first, last = self.slot_range(st, et)
+            if first >= last:
+                continue
+            bits = ((1 << (last - first)) - 1) << first
+            # 아직 비어 있는 슬롯만 채움
+            free = bits & ~mask
+            mask |= bits
+            while free:
+                low = free & -free
+                owners[low.bit_length() - 1] = payload
+                free ^= low
+        return mask, owners
+
+    def mask(self, intervals: Iterable[Tuple[int, int]]) -> int:
+        """(start_min, end_min) 목록 → 점유 비트맵. 슬롯에 조금이라도 걸치면 점유."""
+        mask = 0
+        for st, et in intervals:
+            first, last = self.slot_range(st, et)
+            if first < last:
+                mask |= ((1 << (last - first)) - 1) << first
+        return mask
+
+    def free_runs(self, mask: int, length: int, first: int = 0, last: Optional[int] = None, step: int = 1):
+        """
+        [first, last) 안에서 length 슬롯 이상 연속으로 비어 있는 구간마다
+        (step 간격에 맞는 가장 이른 시작 슬롯, 빈 구간 끝 슬롯)을 돌려줌.
+        """
+        last = self.count if last is None else min(last, self.count)
+        if length <= 0 or last - first < length:
+            return []
+        window = ((1 << (last - first)) - 1) << first
+        free = ~mask & window
+        # fits의 i번째 비트 = i..i+length-1 슬롯이 모두 비어 있음 (shift를 두 배씩 늘려 log(length)번에 계산)
+        fits, span = free, 1
+        while span < length:
+            shift = min(span, length - span)
+            fits &= fits >> shift
+            span += shift
+        runs = []
+        prev_end = -1
+        while fits:
+            low = fits & -fits
+            pos = low.bit_length() - 1
+            fits ^= low
+            if pos < prev_end or pos % step:
+                continue
+            occupied_after = (mask | ~window) >> pos
+            end = pos + (occupied_after & -occupied_after).bit_length() - 1
+            runs.append((pos, end))
+            prev_end = end
+        return runs
+